@@ -0,0 +1,72 @@
+"""
+Micro-benchmark for the NamedState extension check.
+
+Times ``world <= named_state`` for every world of a NamedState and counts
+the State, ValueSet and ConstantAssignment objects constructed while doing
+so; the comparison itself should construct none.
+"""
+
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vivid
+from vivid.classes.state import State
+from vivid.classes.valueset import ValueSet
+from vivid.classes.constant_assignment import ConstantAssignment
+
+
+def make_named_state():
+    """Return a NamedState and its worlds."""
+    hour = vivid.Attribute("hour", [vivid.Interval(0, 23)])
+    minute = vivid.Attribute("minute", [vivid.Interval(0, 59)])
+    attribute_structure = vivid.AttributeStructure(hour, minute)
+    vocabulary = vivid.Vocabulary(["C1", "C2"], [], [])
+
+    attribute_system = vivid.AttributeSystem(attribute_structure,
+                                             ["s1", "s2", "s3"])
+    p = vivid.ConstantAssignment(vocabulary, attribute_system,
+                                 {"C1": "s1", "C2": "s2"})
+    named_state = vivid.NamedState(attribute_system, p, {
+        ("hour", "s1"): [9, 13], ("minute", "s1"): [12, 13, 14],
+        ("hour", "s2"): [8], ("minute", "s2"): [27],
+        ("hour", "s3"): [1, 2], ("minute", "s3"): [5]})
+
+    return named_state, list(named_state.get_worlds())
+
+
+def main():
+    """Run the benchmark."""
+    named_state, worlds = make_named_state()
+    number = 20
+
+    constructions = {State: [0], ValueSet: [0], ConstantAssignment: [0]}
+    original_inits = {}
+
+    def counting_init(cls):
+        original_init = cls.__init__
+
+        def init(self, *args, **kwargs):
+            constructions[cls][0] += 1
+            original_init(self, *args, **kwargs)
+        return original_init, init
+
+    for cls in constructions:
+        original_inits[cls], cls.__init__ = counting_init(cls)
+    try:
+        compare = timeit.timeit(
+            lambda: [world <= named_state for world in worlds],
+            number=number) / (number * len(worlds))
+    finally:
+        for cls in constructions:
+            cls.__init__ = original_inits[cls]
+
+    comparisons = number * len(worlds)
+    print "world <= named_state:    %10.3f us" % (compare * 1e6)
+    for cls in [State, ValueSet, ConstantAssignment]:
+        print "%s constructions per comparison: %.3f" % (
+            cls.__name__, constructions[cls][0] / float(comparisons))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Micro-benchmark for routing Relation definitions to parsers.
+
+Times the evaluator of a numeric definition, a Point definition and a
+LineSegment definition whose function (``meets``) is also declared by the
+PointParser, and counts the parsers compiling each definition.
+"""
+
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vivid.classes.point import Point
+from vivid.classes.line_segment import LineSegment
+from vivid.classes.relation import Relation
+from vivid.classes.parsers.parser_set import ParserSet
+
+
+def main():
+    """Run the benchmark."""
+    number = 2000
+
+    definitions = [
+        ("R1(h1, m1, h2, m2) <=> h1 > h2 or (h1 = h2 and m1 > m2)",
+         (9, 12, 8, 27)),
+        ("R2(p, s, e) <=> is_on(p, s, e)",
+         (Point(1.5, 1.5), Point(1.0, 1.0), Point(2.0, 2.0))),
+        ("R3(p, l1, l2) <=> meets(p, l1, l2)",
+         (Point(2.5, 2.5), LineSegment(Point(0.0, 0.0), Point(5.0, 5.0)),
+          LineSegment(Point(5.0, 0.0), Point(0.0, 5.0))))]
+
+    for definition, values in definitions:
+        compiles = [0]
+        for parser in ParserSet.get_shared():
+            parser.compile = counting_compile(parser, compiles)
+        try:
+            evaluator = Relation._compile_definition(definition)
+        finally:
+            for parser in ParserSet.get_shared():
+                del parser.compile
+
+        evaluate = timeit.timeit(lambda: evaluator(*values),
+                                 number=number) / number
+        name = definition[:definition.find("(")]
+        print "%s evaluator:           %10.3f us (%d parsers compiled)" % (
+            name, evaluate * 1e6, compiles[0])
+
+
+def counting_compile(parser, compiles):
+    """Return ``parser.compile`` counting its calls in ``compiles``."""
+    original_compile = parser.compile
+
+    def compile(*args):
+        compiles[0] += 1
+        return original_compile(*args)
+    return compile
+
+if __name__ == "__main__":
+    main()
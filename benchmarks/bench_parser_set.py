@@ -0,0 +1,82 @@
+"""
+Micro-benchmark for the shared ParserSet.
+
+Compares constructing a ParserSet object (and so rebuilding the pyparsing
+grammar of the TruthValueParser) against retrieving the shared ParserSet,
+and counts the TruthValueParser constructions made while assigning truth
+values to a Formula many times.
+"""
+
+import os
+import sys
+import timeit
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vivid
+from vivid.classes.parsers.parser_set import ParserSet
+from vivid.classes.parsers.truth_value_parser import TruthValueParser
+
+
+def make_formula():
+    """Return a Formula, AttributeInterpretation, NamedState and X."""
+    hour = vivid.Attribute("hour", [vivid.Interval(0, 23)])
+    minute = vivid.Attribute("minute", [vivid.Interval(0, 59)])
+    r_ahead = vivid.Relation(
+        "R1(h1, m1, h2, m2) <=> h1 > h2 or (h1 = h2 and m1 > m2)",
+        ["hour", "minute", "hour", "minute"], 1)
+    attribute_structure = vivid.AttributeStructure(hour, minute, r_ahead)
+
+    ahead_rs = vivid.RelationSymbol("Ahead", 2)
+    vocabulary = vivid.Vocabulary(["C1", "C2"], [ahead_rs], [])
+    profiles = [[ahead_rs, ("hour", 1), ("minute", 1),
+                 ("hour", 2), ("minute", 2)]]
+    attribute_interpretation = vivid.AttributeInterpretation(
+        vocabulary, attribute_structure, {ahead_rs: 1}, profiles)
+
+    attribute_system = vivid.AttributeSystem(attribute_structure,
+                                             ["s1", "s2"])
+    p = vivid.ConstantAssignment(vocabulary, attribute_system,
+                                 {"C1": "s1", "C2": "s2"})
+    named_state = vivid.NamedState(attribute_system, p, {
+        ("hour", "s1"): [9, 13], ("minute", "s1"): [12],
+        ("hour", "s2"): [8], ("minute", "s2"): [27]})
+    X = vivid.VariableAssignment(vocabulary, attribute_system, {},
+                                 dummy=True)
+
+    return (vivid.Formula(vocabulary, "Ahead", "C1", "C2"),
+            attribute_interpretation, named_state, X)
+
+
+def main():
+    """Run the benchmark."""
+    number = 100
+
+    construct = timeit.timeit(ParserSet, number=number) / number
+    shared = timeit.timeit(ParserSet.get_shared, number=number) / number
+    print "ParserSet():             %10.3f us" % (construct * 1e6)
+    print "ParserSet.get_shared():  %10.3f us" % (shared * 1e6)
+
+    formula, attribute_interpretation, named_state, X = make_formula()
+
+    constructions = [0]
+    original_init = TruthValueParser.__init__
+
+    def counting_init(self):
+        constructions[0] += 1
+        original_init(self)
+
+    TruthValueParser.__init__ = counting_init
+    try:
+        assign = timeit.timeit(
+            lambda: formula.assign_truth_value(
+                attribute_interpretation, named_state, X),
+            number=number) / number
+    finally:
+        TruthValueParser.__init__ = original_init
+
+    print "assign_truth_value:      %10.3f us" % (assign * 1e6)
+    print "TruthValueParser constructions in %d assignments: %d" % (
+        number, constructions[0])
+
+if __name__ == "__main__":
+    main()
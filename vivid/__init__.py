@@ -8,16 +8,21 @@ from vivid.classes.attribute_system import AttributeSystem
 from vivid.classes.constant_assignment import ConstantAssignment
 from vivid.classes.context import Context
 from vivid.classes.formula import Formula
+from vivid.classes.frozen_valueset import FrozenValueSet
 from vivid.classes.interval import Interval
 from vivid.classes.named_state import NamedState
+from vivid.classes.named_world_view import NamedWorldView
 from vivid.classes.point import Point
 from vivid.classes.line_segment import LineSegment
 from vivid.classes.relation import Relation
 from vivid.classes.relation_symbol import RelationSymbol
 from vivid.classes.state import State
+from vivid.classes.truth_table import TruthTable
 from vivid.classes.valueset import ValueSet
+from vivid.classes.value_index import ValueIndex
 from vivid.classes.variable_assignment import VariableAssignment
 from vivid.classes.vocabulary import Vocabulary
+from vivid.classes.world_view import WorldView
 
 from vivid.classes.inference_rules import thinning, widening, observe
 from vivid.classes.inference_rules import diagrammatic_absurdity
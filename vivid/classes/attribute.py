@@ -1,7 +1,7 @@
 """This section introduces the Attribute class."""
 
 from copy import deepcopy
-from valueset import ValueSet
+from frozen_valueset import FrozenValueSet
 
 
 class Attribute(object):
@@ -10,8 +10,8 @@ class Attribute(object):
     An Attribute is a finite set :math:`A` with an associated label :math:`l`.
 
     :ivar label: The associated label :math:`l` of the Attribute :math:`A`.
-    :ivar value_set: A ValueSet object functioning as the set of values that \
-    the attribute can take on (e.g {small,large}).
+    :ivar value_set: A FrozenValueSet object functioning as the set of \
+    values that the attribute can take on (e.g {small,large}).
     :ivar _is_Attribute: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
@@ -37,11 +37,8 @@ class Attribute(object):
         self._label = label
         self._is_Attribute = True
 
-        if hasattr(value_set, "_is_ValueSet"):
-            self._value_set = deepcopy(value_set)
-            return
-        if isinstance(value_set, list):
-            self._value_set = ValueSet(value_set)
+        if hasattr(value_set, "_is_ValueSet") or isinstance(value_set, list):
+            self._value_set = FrozenValueSet(value_set)
         else:
             raise TypeError('v parameter must be of type ValueSet or list')
 
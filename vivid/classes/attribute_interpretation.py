@@ -5,6 +5,7 @@ from relation_symbol import RelationSymbol
 from attribute import Attribute
 from relation import Relation
 from attribute_structure import AttributeStructure
+from truth_table import TruthTable
 
 
 class AttributeInterpretation(object):
@@ -36,10 +37,20 @@ class AttributeInterpretation(object):
     :ivar profiles: A list of profiles :math:`[(l_{i_{1}}; j_{1}) \cdots \
     (l_{i_{m}}; j_{m})]`; one for each realization.
     :ivar table: The interpretation table of the attribute interpretation.
+    :ivar index: The rows of the interpretation table keyed by the name of \
+    their RelationSymbol object, each as a 4-tuple of the subscript of the \
+    realization, the realization (the Relation object of the \
+    AttributeStructure object of the interpretation), its profile as a \
+    ``tuple`` of (label, term position) 2-tuples (the term positions \
+    counting from 0) and the largest :math:`j_{x}` in the profile.
     :ivar relation_symbols: A copy of the RelationSymbol objects from \
     :math:`\Sigma` (for convenient access).
     :ivar is_AttributeInterpretation: An identifier to use in place of \
     ``type`` or ``isinstance``.
+
+    Constructing an AttributeInterpretation object also computes the
+    TruthTable object of each Relation object in the interpretation table
+    whose Attribute objects have small, finite and discrete ValueSets.
     """
 
     def __init__(self, vocabulary, attribute_structure, mapping, profiles):
@@ -180,6 +191,22 @@ class AttributeInterpretation(object):
         self._relation_symbols = [e[0] for e in interpretation_table]
         self._is_AttributeInterpretation = True
 
+        # index the table by RelationSymbol name so Formula objects find
+        # their realization and profile without scanning the table
+        self._index = {}
+        for R, arity, subscript, prof in interpretation_table:
+            relation = self._attribute_structure._relations[
+                int(subscript[1:])]
+            self._index[R._name] = (
+                relation._subscript, relation,
+                tuple([(label, j - 1) for label, j in prof]),
+                max([j for label, j in prof] + [0]))
+
+        # precompute the truth tables of the realizations once; relations
+        # that cannot be tabled are evaluated by their parsers
+        for subscript, relation, profile, max_j in self._index.itervalues():
+            TruthTable.get(relation, self._attribute_structure)
+
     def __eq__(self, other):
         """
         Determine if two AttributeInterpretation objects are equal via the
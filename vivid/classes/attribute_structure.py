@@ -27,6 +27,11 @@ class AttributeStructure(Attribute):
     :ivar attributes: A list of Attribute objects (i.e., \
     :math:`A_{1}, \ldots, A_{k}`); always maintained as a list.
     :ivar relations: A dictionary of relations (i.e., :math:`\mathcal{R}`).
+    :ivar fingerprint: A cached hash of the Attribute objects of the \
+    AttributeStructure object (or ``None`` until it is first needed); the \
+    Relation objects can be changed in place (e.g., via ``set_definition`` \
+    on a Relation object retrieved by indexing), so they are hashed anew \
+    for each comparison (see ``_get_fingerprint``).
     :ivar _is_AttributeStructure: An identifier to use in place of ``type`` \
     or ``isinstance``.
     """
@@ -48,6 +53,7 @@ class AttributeStructure(Attribute):
 
         self._attributes = []
         self._relations = {}
+        self._fingerprint = None
         self._is_AttributeStructure = True
 
         a_ops, r_ops = [], []
@@ -107,6 +113,11 @@ class AttributeStructure(Attribute):
         operator.
         """
 
+        if self is other:
+            return True
+        if self._get_fingerprint() != other._get_fingerprint():
+            return False
+
         # Attribute sets different length, not equal
         if len(self._attributes) != len(other._attributes):
             return False
@@ -465,6 +476,27 @@ class AttributeStructure(Attribute):
 
         return AttributeStructure(*ops_copy)
 
+    def _get_fingerprint(self):
+        """
+        Return the fingerprint of the calling AttributeStructure object;
+        AttributeStructure objects with different fingerprints are never
+        equal. The hash of the Attribute objects is cached on first use,
+        while the Relation objects, which can be changed in place, are
+        hashed on every call.
+
+        :return: The hash of the Attribute objects, in order, and of the \
+        set of (subscript, :math:`D(R)`, definition) 3-tuples of the \
+        Relation objects.
+        :rtype: ``int``
+        """
+
+        if self._fingerprint is None:
+            self._fingerprint = hash(tuple(self._attributes))
+        relations = frozenset(
+            [(r._subscript, tuple(r._DR), r._definition)
+             for r in self._relations.itervalues()])
+        return hash((self._fingerprint, relations))
+
     def get_labels(self):
         """
         Return the labels of the Attribute objects within the calling
@@ -27,6 +27,11 @@ class AttributeSystem(object):
     :ivar attribute_structure: The AttributeStructure of the AttributeSystem.
     :ivar objects: The objects of the AttributeSystem; held as a list of \
     ``str``\s.
+    :ivar fingerprint: A cached hash of the objects of the AttributeSystem \
+    object (or ``None`` until it is first needed); it must be reset to \
+    ``None`` whenever ``objects`` is rebound. The AttributeStructure object \
+    can be changed in place, so its fingerprint is not cached here (see \
+    ``_get_fingerprint``).
     :ivar _is_AttributeSystem: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
@@ -73,6 +78,7 @@ class AttributeSystem(object):
         # sort objects before setting them
         self._objects = sorted(objects)
         self._attribute_structure = deepcopy(attribute_structure)
+        self._fingerprint = None
         self._is_AttributeSystem = True
 
     def __eq__(self, other):
@@ -80,6 +86,11 @@ class AttributeSystem(object):
         Determine if two AttributeSystem objects are equal via ``==`` operator.
         """
 
+        if self is other:
+            return True
+        if self._get_fingerprint() != other._get_fingerprint():
+            return False
+
         c_astr = self._attribute_structure == other._attribute_structure
         c_objs = set(self._objects) == set(other._objects)
         if c_astr and c_objs:
@@ -329,6 +340,23 @@ class AttributeSystem(object):
 
         return self.__str__()
 
+    def _get_fingerprint(self):
+        """
+        Return the fingerprint of the calling AttributeSystem object;
+        AttributeSystem objects with different fingerprints are never equal.
+        The hash of the objects is cached on first use, while the
+        fingerprint of the AttributeStructure object is taken on every call.
+
+        :return: The hash of the fingerprint of the AttributeStructure object \
+        and the set of objects.
+        :rtype: ``int``
+        """
+
+        if self._fingerprint is None:
+            self._fingerprint = hash(frozenset(self._objects))
+        return hash((self._attribute_structure._get_fingerprint(),
+                     self._fingerprint))
+
     def get_power(self):
         """
         Get the power of the calling AttributeSystem object, i.e.,
@@ -140,23 +140,10 @@ class Context(object):
                 "Formula must be over the same vocabulary used to create"
                 "ConstantAssignment within this Context.")
 
-        # get all possible worlds and variable assignments.
-        possible_worlds = self._named_state.get_worlds()
-
-        # for every possible world and variable assignment, if the world
-        # satisfies the context, but not the formula, this Context does not
-        # entail the Formula, return False, otherwise return True aftewards.
-        for world in possible_worlds:
-            for X in world._generate_variable_assignments():
-                satisfies_context = world.satisfies_context(
-                    self, X, attribute_interpretation)
-                satisfies_formula = world.satisfies_formula(
-                    formula, X, attribute_interpretation)
-
-                if satisfies_context and not satisfies_formula:
-                    return False
-
-        return True
+        # this Context entails the Formula unless some world and variable
+        # assignment satisfy the context, but not the formula
+        return not self._find_countermodel(
+            attribute_interpretation, formula=formula)
 
     def entails_named_state(self, named_state, attribute_interpretation):
         """
@@ -207,22 +194,303 @@ class Context(object):
                 "ConstantAssignment as the Vocabulary of the "
                 "ConstantAssignment within this Context.")
 
-        # get all possible worlds and variable assignments.
-        possible_worlds = self._named_state.get_worlds()
-
-        # for every possible world and variable assignment, if the world
-        # satisfies this Context, but not the NamedState, this Context does not
-        # entail the NamedState, return False, otherwise return True aftewards.
-        for world in possible_worlds:
-            for X in world._generate_variable_assignments():
-                satisfies_context = world.satisfies_context(
-                    self, X, attribute_interpretation)
-                satisfies_named_state = world.satisfies_named_state(
-                    named_state)
-
-                if satisfies_context and not satisfies_named_state:
-                    return False
-        return True
+        # this Context entails the NamedState unless some world and variable
+        # assignment satisfy the context, but not the NamedState
+        return not self._find_countermodel(
+            attribute_interpretation, named_state=named_state)
+
+    def _find_countermodel(self, attribute_interpretation, formula=None,
+                           named_state=None):
+        """
+        Determine if there is a countermodel to the entailment of the Formula
+        object :math:`F` in the ``formula`` parameter or the NamedState object
+        :math:`(\sigma^{\prime};\\rho^{\prime})` in the ``named_state``
+        parameter by the calling Context object
+        :math:`\gamma = (\\beta; (\sigma; \\rho))`; that is, a world
+        :math:`(w;\widehat{\\rho})` derivable from :math:`(\sigma; \\rho)` and
+        a variable assignment :math:`\chi` such that
+        :math:`(w;\widehat{\\rho})\models_{\chi}\gamma` holds, but
+        :math:`(w;\widehat{\\rho})\models_{\chi}F` (or
+        :math:`(w;\widehat{\\rho})\models(\sigma^{\prime};\\rho^{\prime})`)
+        does not.
+
+        Rather than enumerating every world, for each constant assignment
+        :math:`\widehat{\\rho}` and variable assignment :math:`\chi` the
+        search binds the attribute-object pairs in the profiles of the
+        Formula objects of :math:`\\beta` (and of :math:`F`) one at a time,
+        evaluates each Formula object as soon as all attribute-object pairs
+        in its profile are bound and backtracks as soon as some Formula object
+        of :math:`\\beta` is false (or :math:`F` is true). The remaining
+        attribute-object pairs cannot affect the truth value of any of the
+        Formula objects, so they are never enumerated. Constant assignments
+        that differ only by a permutation of interchangeable objects yield
+        the same truth values, so only one of them is considered.
+
+        :param attribute_interpretation: The AttributeInterpretation object \
+        :math:`I` to use for the interpretation of truth values.
+        :type  attribute_interpretation: AttributeInterpretation
+        :param formula: The Formula object :math:`F` or ``None``.
+        :type  formula: Formula | ``None``
+        :param named_state: The NamedState object \
+        :math:`(\sigma^{\prime};\\rho^{\prime})` or ``None``.
+        :type  named_state: NamedState | ``None``
+
+        :return: Whether or not a countermodel exists.
+        :rtype: ``bool``
+
+        :raises TypeError: ``attribute_interpretation`` parameter must be an \
+        AttributeInterpretation object.
+        :raises ValueError: The Vocabulary object of the \
+        AttributeInterpretation object :math:`I` must match that of the \
+        calling Context object.
+        """
+
+        from state import State
+        from valueset import ValueSet
+
+        if not hasattr(attribute_interpretation,
+                       "_is_AttributeInterpretation"):
+            raise TypeError(
+                "attribute_interpretation parameter must be of type "
+                "AttributeInterpretation")
+
+        context_state = self._named_state
+        if attribute_interpretation._vocabulary != context_state._p._vocabulary:
+            raise ValueError(
+                "Vocabulary of AttributeInterpretation must match the "
+                "Vocabulary of this Context")
+
+        labels, valuesets = State._discretize_ascriptions(context_state)
+        # some ascription has no values, so there are no worlds at all
+        if not all(valuesets):
+            return False
+        values = dict(zip(labels, valuesets))
+
+        attribute_system = context_state._attribute_system
+
+        bad_values = {}
+        if named_state is not None:
+            same_attr_systems = attribute_system == \
+                named_state._attribute_system
+            same_vocabularies = context_state._p._vocabulary == \
+                named_state._p._vocabulary
+            comparable = same_attr_systems and same_vocabularies
+
+            # the values of each ao_pair a world may take that keep it from
+            # extending the NamedState
+            if comparable:
+                for ao_pair, ao_values in values.iteritems():
+                    other_valueset = named_state._ascriptions[ao_pair]
+                    bad_values[ao_pair] = set(
+                        [i for i, value in enumerate(ao_values)
+                         if not ValueSet([value]) <= other_valueset])
+
+        # worlds related by permuting interchangeable objects are all
+        # countermodels or none is, so only representatives are searched
+        if named_state is not None and comparable:
+            classes = context_state._get_interchangeable_objects(named_state)
+        else:
+            classes = context_state._get_interchangeable_objects()
+
+        for p in context_state._generate_constant_assignments(classes):
+            for X in context_state._generate_variable_assignments(p):
+                # each constraint is a Relation object, the ao_pairs bound to
+                # its arguments and the truth value it must take
+                constraints = []
+                for assumption in self._assumption_base:
+                    resolved = assumption._resolve_profile(
+                        attribute_interpretation, attribute_system, p, X)
+                    # an unknown assumption is never satisfied
+                    if resolved is None:
+                        break
+                    constraints.append(resolved + (True,))
+                else:
+                    if formula is not None:
+                        resolved = formula._resolve_profile(
+                            attribute_interpretation, attribute_system, p, X)
+                        # an unknown formula is never satisfied, so any world
+                        # satisfying the context is a countermodel
+                        if resolved is not None:
+                            constraints.append(resolved + (False,))
+
+                    # a world extending the NamedState is a countermodel only
+                    # if some ao_pair takes a bad value
+                    if named_state is None:
+                        satisfied = True
+                    else:
+                        satisfied = not (comparable and p >= named_state._p)
+
+                    if Context._search_constraints(
+                            constraints, labels, values, satisfied,
+                            bad_values):
+                        return True
+
+        return False
+
+    @staticmethod
+    def _search_constraints(constraints, labels, values, satisfied,
+                            bad_values):
+        """
+        Determine if the ao_pairs in the ``labels`` parameter can be bound to
+        values in the ``values`` parameter such that every constraint in the
+        ``constraints`` parameter holds and (unless the ``satisfied``
+        parameter is ``True``) some ao_pair is bound to one of its values in
+        the ``bad_values`` parameter.
+
+        ao_pairs that do not occur together in any constraint are
+        independent, so the constraints are split into the connected
+        components of the graph of ao_pairs sharing a constraint (see
+        ``_get_components``) and each component is searched on its own; the
+        cost is the sum rather than the product of the sizes of the
+        components. ao_pairs in no constraint are never bound.
+
+        :param constraints: 3-tuples of a Relation object, the ao_pairs to \
+        bind to its arguments and the truth value its evaluator must return.
+        :type  constraints: ``list``
+        :param labels: All ao_pairs.
+        :type  labels: ``list``
+        :param values: The possible values of each ao_pair.
+        :type  values: ``dict``
+        :param satisfied: Whether any binding satisfying the constraints \
+        suffices or some ao_pair must also take a bad value.
+        :type  satisfied: ``bool``
+        :param bad_values: The positions of the bad values of each ao_pair in \
+        ``values`` parameter; only used if ``satisfied`` is ``False``.
+        :type  bad_values: ``dict``
+
+        :return: Whether or not such a binding exists.
+        :rtype: ``bool``
+        """
+
+        # constraints without ao_pairs hold or fail outright
+        for relation, profile, truth_value in constraints:
+            if not profile and \
+                    bool(relation._evaluator()) is not truth_value:
+                return False
+
+        components = Context._get_components(
+            [constraint for constraint in constraints if constraint[1]])
+
+        # an unbound ao_pair with a bad value may always take it
+        if not satisfied:
+            bound = set([ao_pair for component in components
+                         for relation, profile, truth_value in component
+                         for ao_pair in profile])
+            for ao_pair in labels:
+                if ao_pair not in bound and bad_values[ao_pair]:
+                    satisfied = True
+                    break
+
+        # every component must be satisfiable
+        for component in components:
+            if not Context._search_component(
+                    component, values, bad_values, True):
+                return False
+
+        if satisfied:
+            return True
+
+        # and some component must be satisfiable with a bad value
+        for component in components:
+            if Context._search_component(
+                    component, values, bad_values, False):
+                return True
+        return False
+
+    @staticmethod
+    def _get_components(constraints):
+        """
+        Split the constraints in the ``constraints`` parameter into the
+        connected components of the graph whose vertices are ao_pairs and
+        whose edges join the ao_pairs of the same constraint.
+
+        :param constraints: 3-tuples of a Relation object, a non-empty \
+        ``list`` of ao_pairs and a truth value.
+        :type  constraints: ``list``
+
+        :return: A ``list`` of the ``list`` of constraints in each component.
+        :rtype: ``list``
+        """
+
+        # union-find over the ao_pairs
+        parents = {}
+
+        def find(ao_pair):
+            """Find the representative ao_pair of the component."""
+            root = ao_pair
+            while parents.setdefault(root, root) != root:
+                root = parents[root]
+            # compress the path
+            while ao_pair != root:
+                parents[ao_pair], ao_pair = root, parents[ao_pair]
+            return root
+
+        for relation, profile, truth_value in constraints:
+            root = find(profile[0])
+            for ao_pair in profile[1:]:
+                parents[find(ao_pair)] = root
+
+        components = {}
+        roots = []
+        for constraint in constraints:
+            root = find(constraint[1][0])
+            if root not in components:
+                components[root] = []
+                roots.append(root)
+            components[root].append(constraint)
+        return [components[root] for root in roots]
+
+    @staticmethod
+    def _search_component(constraints, values, bad_values, satisfied):
+        """
+        Determine if the ao_pairs of the constraints in the ``constraints``
+        parameter can be bound to values in the ``values`` parameter such
+        that every constraint holds and (unless the ``satisfied`` parameter
+        is ``True``) some ao_pair is bound to one of its values in the
+        ``bad_values`` parameter, by backtracking; each constraint is checked
+        as soon as its last ao_pair is bound.
+
+        :return: Whether or not such a binding exists.
+        :rtype: ``bool``
+        """
+
+        # bind ao_pairs of constraints with the fewest ao_pairs first, so
+        # constraints are checked (and prune) as early as possible
+        order = []
+        for relation, profile, truth_value in sorted(
+                constraints, key=lambda constraint: len(set(constraint[1]))):
+            for ao_pair in profile:
+                if ao_pair not in order:
+                    order.append(ao_pair)
+        depths = dict([(ao_pair, depth) for depth, ao_pair in enumerate(order)])
+
+        # check each constraint once its last ao_pair is bound
+        checks = [[] for ao_pair in order]
+        for relation, profile, truth_value in constraints:
+            depth = max([depths[ao_pair] for ao_pair in profile])
+            checks[depth].append((relation._evaluator, profile, truth_value))
+
+        valuation = {}
+
+        def search(depth, satisfied):
+            """Bind the ao_pair at ``depth`` in ``order`` to each value."""
+            if depth == len(order):
+                return satisfied
+
+            ao_pair = order[depth]
+            for i, value in enumerate(values[ao_pair]):
+                valuation[ao_pair] = value
+                for evaluator, profile, truth_value in checks[depth]:
+                    arguments = [valuation[pair] for pair in profile]
+                    if bool(evaluator(*arguments)) is not truth_value:
+                        break
+                else:
+                    if search(depth + 1,
+                              satisfied or i in bad_values[ao_pair]):
+                        return True
+            return False
+
+        return search(0, satisfied)
 
 
 def main():
@@ -1,6 +1,10 @@
 """This section introduces the Formula class."""
 
+from collections import OrderedDict
 from variable_assignment import VariableAssignment
+from frozen_valueset import FrozenValueSet
+from state import State
+from truth_table import TruthTable
 
 
 class Formula(object):
@@ -14,8 +18,20 @@ class Formula(object):
     :ivar terms: The terms of the Formula object.
     :ivar is_Formula: An identifier to use in place of ``type`` or \
     ``isinstance``.
+    :cvar _truth_value_cache: The truth values computed most recently by \
+    ``assign_truth_value``, in least recently used order, keyed by the \
+    definition of the Relation object and the FrozenValueSet objects bound \
+    to its arguments.
+    :cvar _truth_value_cache_size: The largest number of truth values kept \
+    in ``_truth_value_cache``.
+    :cvar _truth_value_cache_info: The number of hits, misses and evictions \
+    of ``_truth_value_cache``.
     """
 
+    _truth_value_cache = OrderedDict()
+    _truth_value_cache_size = 4096
+    _truth_value_cache_info = {"hits": 0, "misses": 0, "evictions": 0}
+
     def __init__(self, vocabulary, name, *terms):
         """
         Construct a Formula object.
@@ -197,7 +213,8 @@ class Formula(object):
         VariableAssignment object :math:`\chi` in the ``X`` parameter w.r.t.
         an AttributeInterpretation object :math:`I`.
 
-        This function makes use of the ParserSet object; the ParserSet object
+        This function makes use of the evaluator the Relation object compiles
+        from its definition with the ParserSet object; the ParserSet object
         is a key part in the vivid object extension protocol.
 
         The assign_truth_value function works as follows:
@@ -222,32 +239,44 @@ class Formula(object):
 
         4. The profile now consists of the attribute-object pairs
         (:math:`\delta_{i}(s_{j})` for some set of the possible values of
-        :math:`i` and :math:`j`) to use in the Relation object's definition
-        when creating the evaluatable expression. Now, all worlds
-        :math:`(w;\widehat{\\rho})` derivable from the NamedState are generated
-        and the ValueSets of the attribute-object pairs in the profile
-        (consisting of single elements) are extracted from the ascriptions of
-        these worlds.
-
-        5. The single element ValueSets are zipped together with the arguments
-        in the Relation object definition (the :math:`i`\ th attribute-object
-        pair of the profile is zipped with the :math:`i`\ th argument of the
-        definition) and these new argument-ValueSet pairs are used to
-        substitute every occurance of each argument in the definition with the
-        corresponding single element ValueSet creating a (hopefully)
-        evaluatable expression (the RHS of the substituted definition) for each
-        world :math:`(w;\widehat{\\rho})`.
-
-        6. Each parser in the ParserSet object will then try to evaluate the
-        expression and save the truth value for each
-        :math:`(w;\widehat{\\rho})`. If some expression is unevaluatable for
-        all parsers in the ParserSet a ValueError is raised.
-
-        7. If the expression of every world :math:`(w;\widehat{\\rho})`
-        evaluates to True, the truth value returned is **true**, if the
-        expression of every world evaluates to False, the truth value returned
-        is **false** and if the expressions of any two worlds evaluate to
-        different values, the truth value returned is **unknown**.
+        :math:`i` and :math:`j`) to use in the Relation object's definition.
+        As only these attribute-object pairs affect the truth value, rather
+        than generating all worlds :math:`(w;\widehat{\\rho})` derivable from
+        the NamedState, each distinct valuation of the attribute-object pairs
+        in the profile (i.e., each element of the Cartesian product of their
+        discretized ValueSets in the NamedState) is generated once; every
+        world of the NamedState agrees with exactly one of these valuations
+        on the profile. The truth values of the most recently evaluated
+        profiles are cached (see ``get_truth_value_cache_info``), so if the
+        ascriptions of the profile have already been evaluated for the same
+        Relation object definition, steps 5 through 7 are skipped.
+
+        5. The values of each valuation are bound to the arguments in the
+        Relation object definition (the :math:`i`\ th attribute-object pair
+        of the profile is bound to the :math:`i`\ th argument of the
+        definition).
+
+        6. The Relation object's evaluator, compiled once from the RHS of its
+        definition by the parsers in the ParserSet object, is called with the
+        bound values and the truth value for each valuation is saved. If the
+        values are numeric and the Relation object has an interval evaluator,
+        boxes of valuations, bounded by the values and Interval objects of
+        the ascriptions, are decided at once instead and a box is only split
+        when its truth value is unknown; an Interval object is only
+        discretized once a box must be split within it, and the truth value
+        is still that of the discretized valuations. If the Attribute
+        objects in :math:`D(R)` have small, finite and discrete ValueSets,
+        the truth value of each valuation is instead looked up in the
+        Relation object's TruthTable, computed once. If the values of some
+        valuation are unevaluatable by the parser in the ParserSet handling
+        the definition a ValueError is raised.
+
+        7. If the expression of every valuation (and hence every world
+        :math:`(w;\widehat{\\rho})`) evaluates to True, the truth value
+        returned is **true**, if the expression of every valuation evaluates
+        to False, the truth value returned is **false** and as soon as the
+        expressions of any two valuations evaluate to different values, the
+        truth value returned is **unknown**.
 
         :return: A truth value in the set \
         :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`
@@ -281,14 +310,22 @@ class Formula(object):
         definition.
         """
 
-        def get_relation_arguments(definition):
-            """Return the arguments provided in Relation definition."""
+        self._check_assign_truth_value(attribute_interpretation, named_state, X)
+        return self._assign_truth_value(
+            attribute_interpretation, named_state, X)
 
-            start_paren = definition.find('(')
-            end_paren = definition.find(')')
+    def _check_assign_truth_value(self, attribute_interpretation, named_state,
+                                  X):
+        """
+        Validate the parameters of ``assign_truth_value``.
 
-            arg_string = definition[start_paren + 1:end_paren]
-            return arg_string.split(',')
+        :raises TypeError: ``attribute_interpretation`` parameter must be an \
+        AttributeInterpretation object, ``named_state`` parameter must be a \
+        NamedState object and ``X`` parameter must be a VariableAssignment \
+        object.
+        :raises ValueError: All parameters must have the same Vocabulary \
+        object and the same Vocabulary object as the calling Formula object.
+        """
 
         if not hasattr(attribute_interpretation,
                        "_is_AttributeInterpretation"):
@@ -312,110 +349,314 @@ class Formula(object):
                 "Vocabulry's of Formula, AttributeInterpretation, NamedState, "
                 "and VariableAssignment must match")
 
-        # name should always be in interpretation table
-        for entry in attribute_interpretation:
-            if entry[0]._name == self._name:
-                R_I = entry
+    def _assign_truth_value(self, attribute_interpretation, named_state, X,
+                            discretized=None):
+        """
+        Assign a truth value to the calling Formula object as
+        ``assign_truth_value`` does, without validating the parameters (unless
+        ``State._debug`` is set).
+
+        :param discretized: A ``dict`` of the discretized ascriptions of \
+        attribute-object pairs of ``named_state`` already computed, filled \
+        in with those computed here, or ``None``.
+        :type  discretized: ``dict`` | ``None``
+
+        :return: A truth value in the set \
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`
+        :rtype: ``bool`` | ``str``
+        """
+
+        if State._debug:
+            self._check_assign_truth_value(
+                attribute_interpretation, named_state, X)
+
+        resolved = self._resolve_profile(
+            attribute_interpretation, named_state._attribute_system,
+            named_state._p, X)
+        if resolved is None:
+            return "unknown"
+        relation, profile = resolved
+
+        # the truth value depends only on the Relation's definition (which
+        # determines its evaluator), the ascriptions of the profile and which
+        # arguments share an ao_pair, so it is looked up before any valuation
+        # is generated
+        cache = Formula._truth_value_cache
+        info = Formula._truth_value_cache_info
+        key = (relation._definition,
+               tuple([profile.index(ao_pair) for ao_pair in profile]),
+               tuple([FrozenValueSet(named_state._ascriptions[ao_pair])
+                      for ao_pair in profile]))
+        try:
+            truth_value = cache.pop(key)
+        except KeyError:
+            info["misses"] += 1
+        else:
+            info["hits"] += 1
+            cache[key] = truth_value
+            return truth_value
+
+        truth_table = TruthTable.get(
+            relation, named_state._attribute_system._attribute_structure)
+        truth_value = Formula._evaluate_profile(
+            relation, profile, named_state._ascriptions, truth_table,
+            discretized)
+
+        cache[key] = truth_value
+        if len(cache) > Formula._truth_value_cache_size:
+            cache.popitem(last=False)
+            info["evictions"] += 1
+
+        return truth_value
+
+    @staticmethod
+    def _evaluate_profile(relation, profile, ascriptions, truth_table=None,
+                          discretized=None):
+        """
+        Evaluate the Relation object in the ``relation`` parameter on each
+        distinct valuation of the attribute-object pairs in the ``profile``
+        parameter w.r.t. the ascriptions in the ``ascriptions`` parameter;
+        that is, perform steps 4 through 7 of ``assign_truth_value``. If the
+        TruthTable object of the Relation object is given in the
+        ``truth_table`` parameter, valuations are looked up in it instead.
+        Discretized ascriptions are shared through the ``discretized``
+        parameter (see ``_assign_truth_value``).
+
+        :return: A truth value in the set \
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`
+        :rtype: ``bool`` | ``str``
+        """
+
+        # if every ao_pair in the profile is ascribed a single value that is
+        # not an Interval (e.g., in a world) there is exactly one valuation,
+        # so the evaluator is called once without building any valuations
+        if truth_table is None:
+            evaluator = relation._evaluator
+        else:
+            evaluator = truth_table.evaluate
+        values = []
+        for ao_pair in profile:
+            ascription = ascriptions[ao_pair]._values
+            if len(ascription) != 1 or hasattr(ascription[0], "_is_Interval"):
                 break
+            values.append(ascription[0])
         else:
+            return bool(evaluator(*values))
+
+        # only the ao_pairs in the profile affect the truth value, so rather
+        # than checking every world of the named state, check each distinct
+        # valuation of the (discretized) ascriptions of those ao_pairs once
+        from itertools import product
+        ao_pairs = []
+        for ao_pair in profile:
+            if ao_pair not in ao_pairs:
+                ao_pairs.append(ao_pair)
+        positions = [ao_pairs.index(ao_pair) for ao_pair in profile]
+
+        # numeric valuations of a Relation without a TruthTable are decided a
+        # box of them at a time by its interval evaluator, if it has one; the
+        # boxes are bounded by the Intervals of the ascriptions themselves
+        if truth_table is None and relation._interval_evaluator is not None:
+            valuesets = [ascriptions[ao_pair]._values for ao_pair in ao_pairs]
+            if all(valuesets) and all([
+                    hasattr(value, "_is_Interval") or
+                    type(value) in [int, long, float]
+                    for valueset in valuesets for value in valueset]):
+                return Formula._evaluate_boxes(relation, positions, valuesets)
+
+        if discretized is None:
+            discretized = {}
+        valuesets = []
+        for ao_pair in ao_pairs:
+            try:
+                valuesets.append(discretized[ao_pair])
+            except KeyError:
+                discretized[ao_pair] = ascriptions[ao_pair].discretize()
+                valuesets.append(discretized[ao_pair])
+
+        # the values of the ao_pairs in the profile are handed to the
+        # Relation's compiled evaluator in the order of its arguments; once
+        # both truth values occur the result is "unknown"
+        truth_values = set()
+        for valuation in product(*valuesets):
+            values = [valuation[position] for position in positions]
+            truth_values.add(bool(evaluator(*values)))
+            if len(truth_values) > 1:
+                return "unknown"
+
+        if all(truth_values):
+            return True
+        elif not any(truth_values):
+            return False
+        else:
+            return "unknown"
+
+    @staticmethod
+    def _evaluate_boxes(relation, positions, valuesets):
+        """
+        Evaluate the Relation object in the ``relation`` parameter on each
+        valuation of the numbers and numeric Interval objects in the
+        ``valuesets`` parameter (the values of the :math:`i`\ th argument of
+        the Relation object are given by ``valuesets[positions[i]]``) by
+        branch and bound; a box of valuations (the values between the least
+        and greatest bounds of each ValueSet, Interval objects included as
+        they are) is decided at once by the Relation object's interval
+        evaluator and only split in two along its largest ValueSet if its
+        truth value is unknown.
+
+        The valuations are those of the worlds, i.e., Interval objects stand
+        for their discretized values (see ``Interval.discretize``), so the
+        truth value is the one of evaluating each valuation; an Interval
+        object is only discretized once a box must be split within it.
+
+        :return: A truth value in the set \
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`
+        :rtype: ``bool`` | ``str``
+        """
+
+        def bounds(values):
+            """Return the least and greatest bounds of values."""
+            lows = [value._infimum if hasattr(value, "_is_Interval")
+                    else value for value in values]
+            highs = [value._supremum if hasattr(value, "_is_Interval")
+                     else value for value in values]
+            return min(lows), max(highs)
+
+        def size(values):
+            """Estimate the number of discretized values of values."""
+            return sum([max(2, int(value._supremum - value._infimum) + 1)
+                        if hasattr(value, "_is_Interval") else 1
+                        for value in values])
+
+        truth_values = set()
+        boxes = [[sorted(valueset, key=lambda value: bounds([value])[0])
+                  for valueset in valuesets]]
+        while boxes:
+            box = boxes.pop()
+            truth_value = relation._interval_evaluator(
+                *[bounds(box[position]) for position in positions])
+
+            if truth_value == "unknown":
+                # a single valuation is evaluated directly, otherwise the
+                # box is split and its halves are decided in turn
+                sizes = [size(values) for values in box]
+                i = sizes.index(max(sizes))
+                if sizes[i] == 1:
+                    truth_value = bool(relation._evaluator(
+                        *[box[position][0] for position in positions]))
+                else:
+                    values = box[i]
+                    if len(values) == 1:
+                        values = values[0].discretize()
+                    upper, lower = list(box), list(box)
+                    if len(values) == 1:
+                        upper[i] = values
+                        boxes.append(upper)
+                        continue
+                    half = len(values) // 2
+                    upper[i], lower[i] = values[half:], values[:half]
+                    boxes.extend([upper, lower])
+                    continue
+
+            truth_values.add(truth_value)
+            if len(truth_values) > 1:
+                return "unknown"
+
+        return truth_values.pop()
+
+    def _resolve_profile(self, attribute_interpretation, attribute_system,
+                         p, X):
+        """
+        Resolve the calling Formula object :math:`F` into the Relation object
+        and the attribute-object pairs its truth value depends on; that is,
+        perform steps 1 through 4 of ``assign_truth_value`` w.r.t. the
+        AttributeSystem object in the ``attribute_system`` parameter, the
+        ConstantAssignment object :math:`\\rho` in the ``p`` parameter and
+        the VariableAssignment object :math:`\chi` in the ``X`` parameter.
+
+        :return: A 2-tuple of the Relation object and the ``list`` of \
+        attribute-object pairs to bind to its arguments (in order) or \
+        ``None`` if some term of :math:`F` is in neither :math:`\\rho` nor \
+        :math:`\chi`.
+        :rtype: ``tuple`` | ``None``
+
+        :raises ValueError: The Formula object must match an entry in the \
+        interpretation table of the AttributeInterpretation :math:`I` in the \
+        ``attribute_interpretation`` parameter, the number of \
+        attribute-object pairs in the profile must match the arity of the \
+        corresponding Relation object and :math:`1 \le j_{x} \le n` for each \
+        :math:`j_{x}` in the profile.
+        """
+
+        # name should always be in interpretation table
+        try:
+            entry = attribute_interpretation._index[self._name]
+        except KeyError:
             raise ValueError(self._name + " must be in intepretation table")
 
-        p = named_state._p
-        profile = list(R_I[3])
+        subscript, positions, max_j = entry[0], entry[2], entry[3]
         terms = self._terms
-        relation = named_state._attribute_system._attribute_structure[
-            int(R_I[2][1:])]
+        # the AttributeSystem's AttributeStructure holds its own copy of the
+        # realization, which is the one evaluated
+        relation = attribute_system._attribute_structure._relations[subscript]
 
-        if len(profile) != len(relation._DR):
+        if len(positions) != len(relation._DR):
             raise ValueError(
                 "number of profile pairs must be equal to the number "
                 "of arguments the relation takes")
 
-        # compiling profile into attribute object pairs that will be
-        # substituted into the expression
-
         # check if each index is valid in respect to list of terms
         # i.e., j_x has corresponding (t^{p,X})_{j_x}
-        for index in [pair[1] for pair in profile]:
-            if index > len(terms):
-                raise ValueError(
-                    "each index corresponds to an index in formula's terms "
-                    "list; indicies may not exceed the amount of terms")
-
-        profile_copy = [pr for pr in profile]
+        if max_j > len(terms):
+            raise ValueError(
+                "each index corresponds to an index in formula's terms "
+                "list; indicies may not exceed the amount of terms")
 
         # for each pair in profile grab formula term corresponding to the
-        # pair's index; shifted down 1 as indexing starts at 0 and not 1 then
-        # rewrite that pair with the corresponding term instead of index
-        profile = map(lambda pair: (pair[0], terms[pair[1] - 1]), profile)
-
-        # Replace Vocabulary C and V's with their respective objects
-        # according to p and X
-        for i, pair in enumerate(profile):
+        # pair's index and replace it with its object according to p and X
+        constant_mapping = p._mapping
+        variable_mapping = X._mapping
+        profile = []
+        for label, position in positions:
+            term = terms[position]
             try:
-                obj = p._mapping[pair[1]]
+                obj = constant_mapping[term]
             except KeyError:
                 try:
-                    obj = X._mapping[pair[1]]
+                    obj = variable_mapping[term]
                 except KeyError:
-                    return "unknown"
-
-            profile[i] = (pair[0], obj)
-
-        relation_args = get_relation_arguments(relation._definition)
-        worlds = named_state.get_worlds()
-
-        # sort by longest arguments firsts so we can ensure unambiguous
-        # replacement when swapping in the valuations associated with the
-        # ao_pairs from each world into the relation definition
-        relation_args, profile = (
-            list(t) for t in zip(*sorted(zip(relation_args, profile),
-                                 key=lambda x: len(x[0]),
-                                 reverse=True)))
-
-        # we now check the formula against each possible world within the state
-        # First, create a ParserSet object so we can attempt parsing of formula
-        from parsers.parser_set import ParserSet
-        parser_set = ParserSet()
-
-        truth_values = []
-        for world in worlds:
-            # break reference from Relation
-            definition = str(relation._definition)
-
-            # zip arguments in Relation and valuations together
-            valuations = [
-                world._ascriptions[ao_pair] for ao_pair in profile]
-            substitutions = zip(relation_args, valuations)
-
-            for substitution in substitutions:
-                pattern, valueset = substitution
-                # we're swapping in a valuation valueset so just shed
-                # the prefix 'V(' and suffix ')'
-                value = str(valueset)[2:-1]
-                definition = definition.replace(pattern, value)
-
-            # trim the LHS of the definition to make evaluatable expression
-            expression = definition[definition.find(" <=> ") + 5:]
-
-            # Try each parser in ParserSet; raise ValueError if no parser
-            # can successfully parse formula
-            for parser in parser_set:
-                try:
-                    result = parser(expression)
-                    truth_values.append(result)
-                    break
-                except:
-                    pass
-            else:
-                raise ValueError("Unable to parse formula")
+                    return None
 
-        if all(truth_values):
-            return True
-        elif not any(truth_values):
-            return False
-        else:
-            return "unknown"
+            profile.append((label, obj))
+
+        return relation, profile
+
+    @staticmethod
+    def get_truth_value_cache_info():
+        """
+        Return the number of hits, misses and evictions of the truth value
+        cache of ``assign_truth_value`` and the number of truth values it
+        currently holds.
+
+        :return: A ``dict`` with keys ``"hits"``, ``"misses"``, \
+        ``"evictions"`` and ``"size"``.
+        :rtype: ``dict``
+        """
+
+        info = dict(Formula._truth_value_cache_info)
+        info["size"] = len(Formula._truth_value_cache)
+        return info
+
+    @staticmethod
+    def clear_truth_value_cache():
+        """
+        Empty the truth value cache of ``assign_truth_value`` and reset its
+        counters.
+        """
+
+        Formula._truth_value_cache.clear()
+        for counter in Formula._truth_value_cache_info:
+            Formula._truth_value_cache_info[counter] = 0
 
     @staticmethod
     def get_basis(constant_assignment, variable_assignment,
@@ -488,18 +729,16 @@ class Formula(object):
                     "Formula objects.")
 
             # name should always be in interpretation table
-            for entry in attribute_interpretation:
-                if entry[0]._name == formula._name:
-                    R_I = entry
-                    break
-            else:
+            try:
+                positions = attribute_interpretation._index[formula._name][2]
+            except KeyError:
                 raise ValueError(
                     formula._name + " must be in intepretation table")
 
-            profile = list(R_I[3])
             terms = formula._terms
 
-            profile = map(lambda pair: (pair[0], terms[pair[1] - 1]), profile)
+            profile = [(label, terms[position])
+                       for label, position in positions]
 
             # Replace Vocabulary C and V's with their respective objects
             # according to p and X
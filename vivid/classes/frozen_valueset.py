@@ -0,0 +1,156 @@
+"""This section introduces the FrozenValueSet class."""
+
+from weakref import WeakValueDictionary
+from valueset import ValueSet
+
+
+class FrozenValueSet(ValueSet):
+    """
+    FrozenValueSet class. Each FrozenValueSet object is an immutable ValueSet
+    object that is interned on construction; that is, constructing a
+    FrozenValueSet object from values equal to those of an existing
+    FrozenValueSet object returns the existing object. Two FrozenValueSet
+    objects are therefore equal if and only if they are the same object and
+    their hash is computed once.
+
+    :cvar _interned: The live FrozenValueSet objects, keyed by their values.
+    :ivar values: The values contained in the FrozenValueSet object, in the \
+    canonical form of ValueSet objects.
+    :ivar members: A ``frozenset`` of the values.
+    :ivar frozen_key: A ``frozenset`` of the values paired with their \
+    types.
+    :ivar hash: The hash of ``frozen_key``.
+    :ivar _is_FrozenValueSet: An identifier to use in place of ``type`` or \
+    ``isinstance``.
+    """
+
+    _interned = WeakValueDictionary()
+
+    def __new__(cls, valueset):
+        """
+        Construct a FrozenValueSet object or return the existing
+        FrozenValueSet object with the same values.
+
+        :param valueset: The values to place in the FrozenValueSet object.
+        :type  valueset: list|set|ValueSet
+
+        :raises TypeError: ``valueset`` parameter must be a ``list``, \
+        ``set`` or ValueSet object.
+        """
+
+        if hasattr(valueset, "_is_FrozenValueSet"):
+            return valueset
+
+        if hasattr(valueset, "_is_ValueSet"):
+            values = list(valueset._values)
+        elif isinstance(valueset, list) or isinstance(valueset, set):
+            values = ValueSet._parse(valueset)
+        else:
+            raise TypeError(
+                "valueset parameter must be of type list, set or ValueSet")
+
+        # pair values with their types so e.g. 1, 1.0 and True stay apart
+        key = frozenset([(type(value), value) for value in values])
+        try:
+            return cls._interned[key]
+        except KeyError:
+            pass
+
+        frozen_valueset = object.__new__(cls)
+        frozen_valueset._values = values
+        frozen_valueset._members = frozenset(values)
+        frozen_valueset._frozen_key = key
+        frozen_valueset._hash = hash(key)
+        frozen_valueset._is_ValueSet = True
+        frozen_valueset._is_FrozenValueSet = True
+        cls._interned[key] = frozen_valueset
+        return frozen_valueset
+
+    def __init__(self, valueset):
+        """Initialization is done by ``__new__``."""
+        pass
+
+    def __eq__(self, other):
+        """
+        Determine if a FrozenValueSet object is equal to another FrozenValueSet
+        or ValueSet object via the ``==`` operator.
+        """
+
+        if hasattr(other, "_is_FrozenValueSet"):
+            return self is other
+        return ValueSet.__eq__(self, other)
+
+    def __le__(self, other):
+        """
+        Overloaded ``<=`` operator for FrozenValueSet object. Determine if the
+        calling FrozenValueSet object is a subset of the ValueSet object
+        contained in ``other`` parameter.
+        """
+
+        if self is other:
+            return True
+        return ValueSet.__le__(self, other)
+
+    def __ge__(self, other):
+        """
+        Overloaded ``>=`` operator for FrozenValueSet object. Determine if the
+        calling FrozenValueSet object is a superset of the ValueSet object
+        contained in ``other`` parameter.
+
+        As FrozenValueSet is a subclass of ValueSet, Python tries this method
+        first for ``valueset <= frozen_valueset``, so it must not fall back on
+        the ``total_ordering`` definition (which assumes a total order).
+        """
+
+        if self is other:
+            return True
+        return other.__le__(self)
+
+    def __gt__(self, other):
+        """
+        Overloaded ``>`` operator for FrozenValueSet object. Determine if the
+        calling FrozenValueSet object is a strict superset of the ValueSet
+        object contained in ``other`` parameter.
+        """
+
+        return self.__ge__(other) and not self.__eq__(other)
+
+    def __hash__(self):
+        """Hash implementation for set functionality of FrozenValueSets."""
+        return self._hash
+
+    def __setitem__(self, key, value):
+        """
+        FrozenValueSet objects are immutable.
+
+        :raises TypeError: Always.
+        """
+
+        raise TypeError("FrozenValueSet objects are immutable")
+
+    def __copy__(self):
+        """
+        Copy a FrozenValueSet object via the ``copy.copy`` method; as it is
+        immutable, the calling FrozenValueSet object is returned.
+        """
+
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        Deepcopy a FrozenValueSet object via the ``copy.deepcopy`` method; as
+        it is immutable, the calling FrozenValueSet object is returned.
+        """
+
+        return self
+
+
+def main():
+    """Main method; quick testing."""
+    a = FrozenValueSet(['b', 'a', 1])
+    b = FrozenValueSet([1, 'a', 'b'])
+    print a, b, a is b, hash(a) == hash(b)
+
+
+if __name__ == "__main__":
+    main()
@@ -268,20 +268,16 @@ def sentential_to_sentential(context, F1, F2, G, attribute_interpretation,
             context._named_state._p._vocabulary,
             context._named_state._attribute_system, {}, dummy=True)
 
-    F1_holds = F1.assign_truth_value(attribute_interpretation,
-                                     context._named_state,
-                                     variable_assignment)
-
-    F2_holds = F2.assign_truth_value(attribute_interpretation,
-                                     context._named_state,
-                                     variable_assignment)
+    # F1, F2 and G are evaluated in one batch over the context's named state
+    truth_values = context._named_state._generate_truth_values(
+        [F1, F2, G], variable_assignment, attribute_interpretation)
+    F1_holds = next(truth_values)
+    F2_holds = next(truth_values)
 
     if F1_holds is not True and F2_holds is not True:
         raise ValueError("disjunction F1 OR F2 does not hold")
 
-    G_holds = G.assign_truth_value(attribute_interpretation,
-                                   context._named_state,
-                                   variable_assignment)
+    G_holds = next(truth_values)
 
     if F1_holds and not G_holds:
         return False
@@ -484,21 +480,21 @@ def sentential_to_diagrammatic(context, F1, F2, named_state,
     :return: Whether or not **sentential-to-diagrammatic** holds.
     :rtype: ``bool``
 
+    :raises TypeError: ``named_state`` parameter must be a NamedState \
+    object.
     :raises ValueError: The disjunction :math:`F_{1} \lor F_{2}` does not hold.
     """
 
+    if not hasattr(named_state, "_is_NamedState"):
+        raise TypeError("named_state parameter must be of type NamedState")
+
     if not variable_assignment:
         variable_assignment = VariableAssignment(
             context._named_state._p._vocabulary,
             context._named_state._attribute_system, {}, dummy=True)
 
-    F1_holds = F1.assign_truth_value(attribute_interpretation,
-                                     context._named_state,
-                                     variable_assignment)
-
-    F2_holds = F2.assign_truth_value(attribute_interpretation,
-                                     context._named_state,
-                                     variable_assignment)
+    F1_holds, F2_holds = context._named_state.assign_truth_values(
+        [F1, F2], variable_assignment, attribute_interpretation)
 
     if F1_holds is not True and F2_holds is not True:
         raise ValueError("disjunction F1 OR F2 does not hold")
@@ -524,11 +520,18 @@ def sentential_to_diagrammatic(context, F1, F2, named_state,
     # thus (σ'; ρ') follows either way
     possible_worlds = named_state.get_worlds()
 
+    # the worlds share the AttributeSystem and Vocabulary of the entailed
+    # named state, so whether they can satisfy the contexts at all is
+    # determined once and each world is then checked without validation
+    comparable = named_state._is_comparable(context._named_state)
+
     for world in possible_worlds:
+        if not comparable:
+            return False
         for X in world._generate_variable_assignments():
-            satisfies_f1_context = world.satisfies_context(
+            satisfies_f1_context = world._satisfies_context(
                 f1_context, X, attribute_interpretation)
-            satisfies_f2_context = world.satisfies_context(
+            satisfies_f2_context = world._satisfies_context(
                 f2_context, X, attribute_interpretation)
 
             if not satisfies_f1_context or not satisfies_f2_context:
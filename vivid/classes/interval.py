@@ -297,33 +297,14 @@ class Interval(object):
         :param intervals: A list of intervals to collapse.
         :type  intervals: list
 
-        :return: A new list of totally disjoint, collapsed Intervals.
+        :return: A new list of totally disjoint, collapsed Intervals, sorted \
+        by type (int, float, then long) and infimum.
         :rtype: ``list``
 
         :raises TypeError: ``interval`` parameter must be a ``list`` \
         containing only Interval objects.
         """
 
-        def can_collapse(lis):
-            """Try to collapse some 2 Interval's returning True on success."""
-            for i, interval_i in enumerate(lis):
-                for j, interval_j in enumerate(lis):
-                    # ignore when we're looking at the same Interval
-                    if i == j:
-                        continue
-                    # if Interval i is subsumed by Interval j, get rid of it
-                    if interval_i in interval_j:
-                        lis.remove(interval_i)
-                        return True
-                    # if Intervals overlap, add them and remove old Intervals
-                    elif interval_i <= interval_j:
-                        lis.append(interval_i | interval_j)
-                        lis.remove(interval_i)
-                        lis.remove(interval_j)
-                        return True
-
-            return False
-
         if not isinstance(intervals, list):
             raise TypeError("intervals must be a list")
 
@@ -337,11 +318,66 @@ class Interval(object):
         float_intervals = [i for i in intervals if i._type == float]
         long_intervals = [i for i in intervals if i._type == long]
 
-        # collapse Intervals for as long as posible
-        while can_collapse(int_intervals): pass
-        while can_collapse(float_intervals): pass
-        while can_collapse(long_intervals): pass
-
-        # recombine and send back
-        output = int_intervals + float_intervals + long_intervals
+        # collapse Intervals of each type in a single sweep
+        output = []
+        for typed_intervals in [int_intervals, float_intervals,
+                                long_intervals]:
+            output.extend(Interval._sweep(typed_intervals, [], 0)[1])
         return output
+
+    @staticmethod
+    def _sweep(intervals, values, gap):
+        """
+        Merge Intervals and single values of one type in one sweep over their
+        sorted infima. Intervals and values that overlap or lie within ``gap``
+        parameter of each other are merged into a single Interval; values
+        that are not merged with any Interval are kept as they are.
+
+        :param intervals: The Intervals to merge.
+        :type  intervals: list
+        :param values: The single values to merge; their type must match the \
+        type of the Intervals.
+        :type  values: list
+        :param gap: The largest distance between two neighbouring Intervals \
+        or values that are merged (e.g. ``1`` to merge adjacent ints).
+        :type  gap: int|float|long
+
+        :return: The remaining values and the merged Intervals, both sorted \
+        and disjoint.
+        :rtype: ``tuple``
+        """
+
+        segments = [(interval._infimum, interval._supremum, interval)
+                    for interval in intervals]
+        segments.extend([(value, value, None) for value in values])
+        segments.sort(key=lambda segment: segment[:2])
+
+        new_values, new_intervals = [], []
+
+        def close(run_inf, run_sup, run_intervals, run_values):
+            """Add the merged run of segments to the output."""
+            if not run_intervals:
+                new_values.extend(run_values)
+            elif len(run_intervals) == 1 and \
+                    run_intervals[0]._infimum == run_inf and \
+                    run_intervals[0]._supremum == run_sup:
+                new_intervals.append(run_intervals[0])
+            else:
+                new_intervals.append(Interval(run_inf, run_sup))
+
+        run = None
+        for inf, sup, interval in segments:
+            if run and inf <= run[1] + gap:
+                run[1] = max(run[1], sup)
+            else:
+                if run:
+                    close(*run)
+                run = [inf, sup, [], []]
+            if interval is None:
+                run[3].append(inf)
+            else:
+                run[2].append(interval)
+        if run:
+            close(*run)
+
+        return new_values, new_intervals
@@ -2,6 +2,7 @@
 
 from functools import total_ordering
 from state import State
+from frozen_valueset import FrozenValueSet
 from constant_assignment import ConstantAssignment
 from variable_assignment import VariableAssignment
 
@@ -17,12 +18,15 @@ class NamedState(State):
     extensions are also available via the ``<``, ``>=``, and ``>`` operators
     respectively, despite the lack of magic functions for them.
 
-    :ivar attribute_system: A copy of the AttributeSytem object \
-    :math:`\mathcal{S}` that the NamedState object comes from.
+    :ivar attribute_system: The AttributeSytem object :math:`\mathcal{S}` \
+    that the NamedState object comes from; shared by reference and copied \
+    only when the NamedState object adds an object to it.
     :ivar ascriptions: The ascriptions of the named state (i.e., the set of \
     attribute-object pairs and their corresponding ValueSet objects) \
-    :math:`\delta_{i},~i=1, \ldots, k`.
-    :ivar p: The ConstantAssignment object :math:`\\rho` of the named state.
+    :math:`\delta_{i},~i=1, \ldots, k`, shared as in State objects.
+    :ivar p: A copy of the ConstantAssignment object :math:`\\rho` of the \
+    named state; shared with copies of the NamedState object until one of \
+    them adds an object.
     :ivar _is_NamedState: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
@@ -86,6 +90,17 @@ class NamedState(State):
 
         return not self.__eq__(other)
 
+    def _key(self):
+        """
+        Private key function for hashing.
+
+        :return: 2-tuple consisting of the key of the State component and a \
+        ``frozenset`` of the constant-object mappings of :math:`\\rho`.
+        :rtype: ``tuple``
+        """
+
+        return (State._key(self), frozenset(self._p._mapping.iteritems()))
+
     def __deepcopy__(self, memo):
         """
         Deepcopy a NamedState object via the ``copy.deepcopy`` method.
@@ -93,12 +108,23 @@ class NamedState(State):
         :math:`\Sigma`.
         """
 
-        from copy import deepcopy
+        return self._copy()
 
-        return NamedState(
-            deepcopy(self._attribute_system),
-            deepcopy(self._p),
-            deepcopy(self._ascriptions))
+    def _copy(self):
+        """
+        Return a copy of the calling NamedState object without validation,
+        sharing the calling NamedState object's AttributeSystem object,
+        ConstantAssignment object and ValueSet objects (copy-on-write).
+
+        :return: A copy of the calling NamedState object.
+        :rtype: NamedState
+        """
+
+        from copy import copy
+
+        named_state = copy(self)
+        named_state._ascriptions = dict(self._ascriptions)
+        return named_state
 
     def __le__(self, other):
         """
@@ -114,24 +140,84 @@ class NamedState(State):
         if not hasattr(other, "_is_NamedState"):
             raise TypeError('other parameter must be of type NamedState')
 
+        # not same AttributeSystem or Vocabulary, not an extension
+        if not self._is_comparable(other):
+            return False
+
+        return self._extends(other)
+
+    def _is_comparable(self, other):
+        """
+        Determine if the calling NamedState object and the NamedState object
+        in the ``other`` parameter share the same AttributeSystem object
+        :math:`\mathcal{S}` and Vocabulary object :math:`\Sigma`, so that one
+        may be an extension of the other.
+
+        :return: Whether or not the NamedState objects are comparable.
+        :rtype: ``bool``
+        """
+
         same_attr_systems = self._attribute_system == other._attribute_system
         same_vocabularies = self._p._vocabulary == other._p._vocabulary
+        return same_attr_systems and same_vocabularies
 
-        # not same AttributeSystem or Vocabulary, not an extension
-        if not same_attr_systems or not same_vocabularies:
+    def _extends(self, other):
+        """
+        Determine if the calling NamedState object is an extension of the
+        NamedState object in the ``other`` parameter as ``<=`` does, without
+        validating ``other`` (unless ``State._debug`` is set); that is, both
+        NamedState objects must be comparable (see ``_is_comparable``).
+
+        :return: Whether or not the calling NamedState object is an \
+        extension of ``other``.
+        :rtype: ``bool``
+
+        :raises TypeError: ``State._debug`` is set and ``other`` parameter \
+        is not a NamedState object.
+        :raises ValueError: ``State._debug`` is set and the NamedState \
+        objects are not comparable.
+        """
+
+        if State._debug:
+            if not hasattr(other, "_is_NamedState"):
+                raise TypeError('other parameter must be of type NamedState')
+            if not self._is_comparable(other):
+                raise ValueError(
+                    "other NamedState must be of same AttributeSystem and "
+                    "Vocabulary as this NamedState")
+
+        # if this State is an extension of other State and this
+        # ConstantAssignment is a superset of other ConstantAssignment (i.e.,
+        # self._p >= other._p), this NamedState is an extension of other
+        # NamedState; both are compared in place, without building State or
+        # set objects
+        if not State._extends(self, other):
             return False
+        return not NamedState._is_strict_subset(self._p, other._p)
 
-        self_state = State(self._attribute_system, self._ascriptions)
-        other_state = State(other._attribute_system, other._ascriptions)
+    @staticmethod
+    def _is_strict_subset(p, other_p):
+        """
+        Determine if the ConstantAssignment object in the ``p`` parameter is
+        a strict subset of the ConstantAssignment object in the ``other_p``
+        parameter (i.e., ``p < other_p``) without building any objects.
 
-        # if this State is an extension of other State or this
-        # ConstantAssignment is a superset of other ConstantAssignment,
-        # this NamedState is an extension of other NamedState
-        if self_state <= other_state and self._p >= other._p:
-            return True
-        else:
+        :return: Whether or not ``p < other_p``.
+        :rtype: ``bool``
+        """
+
+        if p._attribute_system != other_p._attribute_system or \
+                p._vocabulary != other_p._vocabulary:
             return False
 
+        mapping, other_mapping = p._mapping, other_p._mapping
+        if len(mapping) >= len(other_mapping):
+            return False
+        for constant, obj in mapping.iteritems():
+            if constant not in other_mapping or other_mapping[constant] != obj:
+                return False
+        return True
+
     def add_object(self, obj, ascriptions=None, constant_symbol=None):
         """
         Add an object :math:`s^{\prime}` to the calling NamedState object's
@@ -177,16 +263,31 @@ class NamedState(State):
 
             # Add object, then add mapping so any errors happen before mutation
             State.add_object(self, obj, ascriptions)
+            self._copy_p()
             self._p._attribute_system._objects = sorted(
                 self._p._attribute_system._objects + [obj])
+            self._p._attribute_system._fingerprint = None
 
             self._p._mapping[constant_symbol] = obj
             self._p._source.append(constant_symbol)
             self._p._target.append(obj)
         else:
             State.add_object(self, obj, ascriptions)
+            self._copy_p()
             self._p._attribute_system._objects = sorted(
                 self._p._attribute_system._objects + [obj])
+            self._p._attribute_system._fingerprint = None
+
+    def _copy_p(self):
+        """
+        Replace the ConstantAssignment object of the calling NamedState object
+        with a copy before changing it, as it may be shared with copies of the
+        calling NamedState object. The copy keeps the reference to the
+        underlying Vocabulary object :math:`\Sigma`.
+        """
+
+        from copy import deepcopy
+        self._p = deepcopy(self._p)
 
     def is_world(self):
         """
@@ -206,53 +307,229 @@ class NamedState(State):
         """
         Return a generator for the generation of all possible worlds
         :math:`(w;\widehat{\\rho})` derivable from the calling NamedState
-        object.
+        object as read-only NamedWorldView objects.
+
+        The single element FrozenValueSet objects of the worlds are made once
+        and the worlds share them, the AttributeSystem object and each
+        ConstantAssignment object :math:`\widehat{\\rho}`, so no world is
+        validated.
 
         :return: A generator for the generation of all possible worlds \
         :math:`(w;\widehat{\\rho})` derivable from this NamedState object.
         :rtype: ``generator``
         """
 
+        from itertools import product
+        from named_world_view import NamedWorldView
+
         if self.is_world():
-            from copy import deepcopy
-            yield deepcopy(self)
+            yield NamedWorldView(self._attribute_system, self._p,
+                                 dict(self._ascriptions))
+            return
+
+        labels, valuesets = self._discretize_ascriptions()
+        singletons = [[FrozenValueSet([value]) for value in values]
+                      for values in valuesets]
+
+        for p in self._generate_constant_assignments():
+            # the last ao-pair varies fastest, as in State.generate_worlds
+            for world_valuesets in product(*singletons):
+                yield NamedWorldView(self._attribute_system, p,
+                                     dict(zip(labels, world_valuesets)))
+
+    def _generate_constant_assignments(self, classes=None):
+        """
+        Generate all total ConstantAssignment objects :math:`\widehat{\\rho}`
+        that extend the ConstantAssignment object :math:`\\rho` of the
+        calling NamedState object (i.e., the constant assignments of the
+        worlds derivable from the calling NamedState object).
+
+        If the classes of interchangeable objects of the calling NamedState
+        object are provided in the ``classes`` parameter (see
+        ``_get_interchangeable_objects``), only one ConstantAssignment object
+        is generated per orbit of the permutations of the objects within each
+        class: the constants mapped into a class are mapped, in order, onto
+        the first objects of the class. Every world derivable from the
+        calling NamedState object is then a permutation of a world with one
+        of these ConstantAssignment objects, and ``_expand_constant_assignment``
+        recovers the rest of each orbit.
+
+        :param classes: The classes of interchangeable objects or ``None`` to \
+        generate every ConstantAssignment object.
+        :type  classes: ``list`` | ``None``
+
+        :return: A generator for all (or all representative) \
+        ConstantAssignment objects :math:`\widehat{\\rho}` extending \
+        :math:`\\rho`.
+        :rtype: ``generator``
+        """
+
+        C = self._p._vocabulary._C
+        bound_constants = self._p._source
+        unbound_constants = [c for c in C if c not in bound_constants]
+
+        objects = self._attribute_system._objects
+        bound_objects = self._p._target
+        unbound_objects = [
+            obj for obj in objects if obj not in bound_objects]
+
+        smaller = unbound_constants if len(unbound_constants) <= \
+            len(unbound_objects) else unbound_objects
+        bigger = unbound_constants if len(unbound_constants) > \
+            len(unbound_objects) else unbound_objects
+
+        import itertools
+        if classes is not None:
+            # every object gets a constant if there are more constants
+            combos = NamedState._generate_class_combos(
+                sorted(unbound_constants), classes,
+                len(unbound_constants) > len(unbound_objects))
+        elif smaller == unbound_constants:
+            combos = [zip(smaller, x) for x in itertools.permutations(
+                bigger, len(smaller))]
         else:
-            C = self._p._vocabulary._C
-            bound_constants = self._p._source
-            unbound_constants = [c for c in C if c not in bound_constants]
+            combos = [zip(x, smaller) for x in itertools.permutations(
+                bigger, len(smaller))]
 
-            objects = self._attribute_system._objects
-            bound_objects = self._p._target
-            unbound_objects = [
-                obj for obj in objects if obj not in bound_objects]
+        for combo in combos:
+            mapping = dict(combo + self._p._mapping.items())
+            yield ConstantAssignment(self._p._vocabulary,
+                                     self._attribute_system,
+                                     mapping)
+
+    @staticmethod
+    def _generate_class_combos(constants, classes, fill):
+        """
+        Generate the representative injective mappings of the constants in
+        the ``constants`` parameter onto the objects of the classes in the
+        ``classes`` parameter as ``list``\s of (constant, object) pairs; each
+        class receives a combination of the constants, mapped in order onto
+        its first objects.
+
+        :param constants: The unbound constants, sorted.
+        :type  constants: ``list``
+        :param classes: The classes of interchangeable unbound objects.
+        :type  classes: ``list``
+        :param fill: Whether every object must receive a constant (rather \
+        than every constant an object).
+        :type  fill: ``bool``
+
+        :return: A generator for the representative mappings.
+        :rtype: ``generator``
+        """
 
-            smaller = unbound_constants if len(unbound_constants) <= \
-                len(unbound_objects) else unbound_objects
-            bigger = unbound_constants if len(unbound_constants) > \
-                len(unbound_objects) else unbound_objects
+        from itertools import combinations
 
-            import itertools
-            if smaller == unbound_constants:
-                combos = [zip(smaller, x) for x in itertools.permutations(
-                    bigger, len(smaller))]
-            else:
-                combos = [zip(x, smaller) for x in itertools.permutations(
-                    bigger, len(smaller))]
+        if not classes:
+            if fill or not constants:
+                yield []
+            return
 
-            constant_assignments = []
-            for combo in combos:
-                mapping = dict(combo + self._p._mapping.items())
-                p = ConstantAssignment(self._p._vocabulary,
-                                       self._attribute_system,
-                                       mapping)
-                constant_assignments.append(p)
+        objects, rest = classes[0], classes[1:]
+        if fill:
+            sizes = [len(objects)]
+        else:
+            sizes = range(min(len(objects), len(constants)) + 1)
 
-            self_worlds = State.get_worlds(self)
-            for p in constant_assignments:
-                for self_world in self_worlds:
-                    yield NamedState(self._attribute_system,
-                                     p,
-                                     self_world._ascriptions)
+        for size in sizes:
+            for chosen in combinations(constants, size):
+                remaining = [c for c in constants if c not in chosen]
+                for combo in NamedState._generate_class_combos(
+                        remaining, rest, fill):
+                    yield zip(chosen, objects) + combo
+
+    def _get_interchangeable_objects(self, *named_states):
+        """
+        Partition the objects of the calling NamedState object that are not
+        in the target of its ConstantAssignment object :math:`\\rho` into
+        classes of interchangeable objects; that is, objects with the same
+        ascriptions in the calling NamedState object and in each NamedState
+        object provided as an optional positional argument in the
+        ``named_states`` parameter and in the target of none of their
+        ConstantAssignment objects. Permuting the objects within a class maps
+        the worlds derivable from the calling NamedState object onto each
+        other and preserves the truth value of every Formula object.
+
+        If the AttributeSystem object is automorphic (i.e., objects occur as
+        values), no objects are interchangeable.
+
+        :param named_states: Any amount of NamedState objects whose \
+        ascriptions must also be preserved.
+        :type  named_states: NamedState
+
+        :return: The classes of interchangeable objects, each sorted, in the \
+        order of their first objects.
+        :rtype: ``list``
+        """
+
+        objects = self._attribute_system._objects
+        bound_objects = set(self._p._target)
+        for named_state in named_states:
+            bound_objects.update(named_state._p._target)
+        unbound_objects = [
+            obj for obj in objects if obj not in self._p._target]
+
+        if self._attribute_system.is_automorphic():
+            return [[obj] for obj in unbound_objects]
+
+        labels = self._attribute_system._attribute_structure.get_labels()
+        states = (self,) + named_states
+
+        classes = []
+        signatures = {}
+        for obj in unbound_objects:
+            # objects bound in some other NamedState are distinguishable
+            if obj in bound_objects:
+                classes.append([obj])
+                continue
+            signature = tuple(
+                [FrozenValueSet(state._ascriptions[(label, obj)])
+                 for state in states for label in labels])
+            try:
+                signatures[signature].append(obj)
+            except KeyError:
+                signatures[signature] = [obj]
+                classes.append(signatures[signature])
+
+        return classes
+
+    def _expand_constant_assignment(self, p, classes):
+        """
+        Generate every ConstantAssignment object in the orbit of the
+        ConstantAssignment object in the ``p`` parameter under the
+        permutations of the objects within each class of interchangeable
+        objects in the ``classes`` parameter (i.e., undo the symmetry
+        reduction of ``_generate_constant_assignments``).
+
+        :param p: A ConstantAssignment object generated by \
+        ``_generate_constant_assignments`` with ``classes`` parameter.
+        :type  p: ConstantAssignment
+        :param classes: The classes of interchangeable objects.
+        :type  classes: ``list``
+
+        :return: A generator for the ConstantAssignment objects in the orbit.
+        :rtype: ``generator``
+        """
+
+        from itertools import permutations, product
+
+        # the constants of p mapped into each class, moved onto every
+        # arrangement of the objects of the class
+        placements = []
+        for objects in classes:
+            constants = sorted(
+                [c for c, obj in p._mapping.iteritems() if obj in objects])
+            placements.append(
+                [zip(constants, arrangement) for arrangement in
+                 permutations(objects, len(constants))])
+
+        for placement in product(*placements):
+            mapping = dict(p._mapping)
+            for combo in placement:
+                mapping.update(combo)
+            yield ConstantAssignment(self._p._vocabulary,
+                                     self._attribute_system,
+                                     mapping)
 
     def is_named_alternate_extension(self, ns_prime, *named_states):
         """
@@ -322,69 +599,6 @@ class NamedState(State):
         extensions of this NamedState.
         """
 
-        def get_supersets():
-            """
-            Return the set of ConstantAssignments that are supersets
-            of this NamedState object's p.
-            """
-
-            # grab the system objects for convenience.
-            system_objects = self._attribute_system._objects
-            n = len(system_objects)
-
-            # Get the union of all domains of provided NamedState objects
-            domain_union = []
-            for named_state in named_states:
-                domain_union.extend(named_state._p.get_domain())
-            domain_union = list(set(domain_union))
-
-            # create set of all cartesian products of domain list and system
-            # object list where each product is of length arity, that is,
-            # the minimum number to match the smaller list with exactly one
-            # member of the bigger list.
-            from itertools import product
-
-            arity = len(domain_union) if len(domain_union) < n else n
-            combos = list(product(domain_union, system_objects, repeat=arity))
-
-            supersets_list = []
-
-            for combo in combos:
-                # bundle the combo elements into 2-tuples representing
-                # domain-object pairs, then remove duplicates.
-                combo = [
-                    combo[i:i + 2] for i, item in enumerate(combo)
-                    if i % 2 == 0]
-                combo = list(set(combo))
-
-                # ensure that individual combos do not contain duplicate
-                # domain elemens or duplicate objects.
-                domain = [pair[0] for pair in combo]
-                objects = [pair[1] for pair in combo]
-                domain_duplicates = len(domain) != len(set(domain))
-                object_duplicates = len(objects) != len(set(objects))
-
-                if not domain_duplicates and not object_duplicates:
-                    # if this combo is a superset of this NamedState's p, and
-                    # hasn't already been saved in supersets_list, save it.
-                    if set(self._p._mapping.items()) <= set(combo):
-                        for superset in supersets_list:
-                            if set(superset) == set(combo):
-                                break
-                        else:
-                            supersets_list.append(combo)
-
-            # create a ConstantAssignment for each superset; easily transform
-            # each superset (list of 2-tuples) into mapping by casting to dict
-            supersets = []
-            for superset in supersets_list:
-                p_prime = ConstantAssignment(self._p._vocabulary,
-                                             self._attribute_system,
-                                             dict(superset))
-                supersets.append(p_prime)
-
-            return supersets
-
         if not named_states:
             raise ValueError(
                 "at least one NamedState object must be "
@@ -401,10 +615,27 @@ class NamedState(State):
                     "all NamedStates provided must be proper "
                     "subsets of this NamedState object.")
 
+        # Get the union of all domains of provided NamedState objects
+        domain_union = set()
+        for named_state in named_states:
+            domain_union.update(named_state._p.get_domain())
+
+        # the supersets of this NamedState's ConstantAssignment map only the
+        # constants of domain_union, so there are none if some constant of
+        # this NamedState's ConstantAssignment is not in domain_union.
+        if not domain_union.issuperset(self._p._mapping):
+            return []
+
         # get supsets of this NamedState's ConstantAssignment and create an
         # empty list to hold all alternate extensions.
-        supersets = get_supersets()
+        supersets = (
+            ConstantAssignment(self._p._vocabulary, self._attribute_system,
+                               mapping)
+            for mapping in self._generate_injective_extensions(
+                sorted(domain_union)))
         named_alternate_extensions = []
+        # NamedStates are hashable, so duplicates are found through a set
+        seen = set()
 
         for p_prime in supersets:
             # get the list of provided NamedStates not in conflict with each
@@ -416,7 +647,7 @@ class NamedState(State):
             # NamedState's State component w.r.t. the list of non-conflicted
             # States in Sigma_i.
             if Sigma_i:
-                phi_i = self.get_alternate_extensions(*Sigma_i)
+                phi_i = self._generate_alternate_extensions(*Sigma_i)
                 # for each alternate extension, create a new NamedState with
                 # that alternate extensions ascriptions and the superset
                 # p_prime and add to named_alternate_extensions if not already
@@ -425,7 +656,8 @@ class NamedState(State):
                     nae = NamedState(
                         self._attribute_system, p_prime, s_prime._ascriptions)
 
-                    if nae not in named_alternate_extensions:
+                    if nae not in seen:
+                        seen.add(nae)
                         named_alternate_extensions.append(nae)
             # There is no provided NamedState not in conflict with this
             # NamedState's ConstantAssignment, so create a new NamedState with
@@ -434,11 +666,52 @@ class NamedState(State):
             else:
                 from copy import deepcopy
                 nae = deepcopy(self)
-                if nae not in named_alternate_extensions:
+                if nae not in seen:
+                    seen.add(nae)
                     named_alternate_extensions.append(nae)
 
         return named_alternate_extensions
 
+    def _generate_injective_extensions(self, domain):
+        """
+        Generate each injective mapping from some of the constants in the
+        ``domain`` parameter to the objects of the calling NamedState object
+        that extends the mapping of its ConstantAssignment object
+        :math:`\\rho`, once. The empty mapping is only generated if
+        ``domain`` is empty.
+
+        :param domain: The constants that may be mapped; must contain the \
+        domain of :math:`\\rho`.
+        :type  domain: ``list``
+
+        :return: A generator for the mappings as ``dict``\s.
+        :rtype: ``generator``
+        """
+
+        mapping = dict(self._p._mapping)
+        free_constants = [c for c in domain if c not in mapping]
+        free_objects = [obj for obj in self._attribute_system._objects
+                        if obj not in self._p._target]
+
+        def extend(position, free_objects):
+            """Leave the constant at ``position`` unmapped or map it."""
+            if position == len(free_constants):
+                if mapping or not domain:
+                    yield dict(mapping)
+                return
+
+            constant = free_constants[position]
+            for extension in extend(position + 1, free_objects):
+                yield extension
+            for i, obj in enumerate(free_objects):
+                mapping[constant] = obj
+                for extension in extend(
+                        position + 1, free_objects[:i] + free_objects[i + 1:]):
+                    yield extension
+                del mapping[constant]
+
+        return extend(0, free_objects)
+
     def satisfies_formula(self, formula, X, attribute_interpretation):
         """
         Determine if the calling NamedState object :math:`(w;\widehat{\\rho})`
@@ -464,7 +737,24 @@ class NamedState(State):
         ``X`` parameter must be a VariableAssignment object and \
         ``attribute_interpretation`` parameter must be an \
         AttributeInterpretation object.
-        :raises ValueError: The calling NamedState object must be a world.
+        :raises ValueError: The calling NamedState object must be a world and \
+        the Vocabulary objects must match (see \
+        ``Formula.assign_truth_value``).
+        """
+
+        self._check_satisfies_formula(formula, X, attribute_interpretation)
+        return self._satisfies_formula(formula, X, attribute_interpretation)
+
+    def _check_satisfies_formula(self, formula, X, attribute_interpretation):
+        """
+        Validate the parameters of ``satisfies_formula``.
+
+        :raises TypeError: ``formula`` parameter must be a Formula object, \
+        ``X`` parameter must be a VariableAssignment object and \
+        ``attribute_interpretation`` parameter must be an \
+        AttributeInterpretation object.
+        :raises ValueError: The calling NamedState object must be a world and \
+        the Vocabulary objects must match.
         """
 
         if not hasattr(formula, "_is_Formula"):
@@ -483,7 +773,23 @@ class NamedState(State):
         if not self.is_world():
             raise ValueError('this NamedState object must be a world')
 
-        truth_value = formula.assign_truth_value(
+        formula._check_assign_truth_value(attribute_interpretation, self, X)
+
+    def _satisfies_formula(self, formula, X, attribute_interpretation):
+        """
+        Determine if the calling NamedState object satisfies the Formula
+        object in the ``formula`` parameter as ``satisfies_formula`` does,
+        without validating the parameters (unless ``State._debug`` is set).
+
+        :return: Whether or not :math:`(w;\widehat{\\rho})\models_{\chi}F`.
+        :rtype: ``bool``
+        """
+
+        if State._debug:
+            self._check_satisfies_formula(
+                formula, X, attribute_interpretation)
+
+        truth_value = formula._assign_truth_value(
             attribute_interpretation, self, X)
 
         if truth_value is True:
@@ -491,6 +797,85 @@ class NamedState(State):
         else:
             return False
 
+    def assign_truth_values(self, formulae, X, attribute_interpretation):
+        """
+        Assign a truth value in
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`
+        to each Formula object in the ``formulae`` parameter w.r.t. the
+        calling NamedState object :math:`(\sigma;\\rho)`, the
+        VariableAssignment object :math:`\chi` in the ``X`` parameter and the
+        AttributeInterpretation object :math:`I` in the
+        ``attribute_interpretation`` parameter (see
+        ``Formula.assign_truth_value``).
+
+        The parameters are validated once and the discretized ascriptions of
+        the attribute-object pairs in the bases of the Formula objects are
+        computed once and shared between the Formula objects; each Formula
+        object stops as soon as its truth value is unknown.
+
+        :param formulae: The Formula objects to assign truth values to.
+        :type  formulae: ``list``
+        :param X: The variable assignment :math:`\chi`
+        :type  X: VariableAssignment
+        :param attribute_interpretation: The attribute interpretation \
+        :math:`I`.
+        :type  attribute_interpretation: AttributeInterpretation
+
+        :return: The truth value of each Formula object, in order.
+        :rtype: ``list``
+
+        :raises TypeError: ``formulae`` parameter must contain only Formula \
+        objects, ``X`` parameter must be a VariableAssignment object and \
+        ``attribute_interpretation`` parameter must be an \
+        AttributeInterpretation object.
+        :raises ValueError: The Formula objects, the calling NamedState \
+        object, ``X`` and ``attribute_interpretation`` must all share the \
+        same Vocabulary object and each Formula object must be evaluatable \
+        (see ``Formula.assign_truth_value``).
+        """
+
+        return list(self._generate_truth_values(
+            formulae, X, attribute_interpretation))
+
+    def _generate_truth_values(self, formulae, X, attribute_interpretation):
+        """
+        Generate the truth value of each Formula object in the ``formulae``
+        parameter as ``assign_truth_values`` does, one at a time.
+
+        :return: A generator for the truth values.
+        :rtype: ``generator``
+        """
+
+        if not hasattr(X, "_is_VariableAssignment"):
+            raise TypeError(
+                'X parameter must be a VariableAssignment object')
+
+        if not hasattr(attribute_interpretation, "_is_AttributeInterpretation"):
+            raise TypeError(
+                "attribute_interpretation parameter must be of type "
+                "AttributeInterpretation")
+
+        vocabulary = self._p._vocabulary
+        if not vocabulary == attribute_interpretation._vocabulary == \
+                X._vocabulary:
+            raise ValueError(
+                "Vocabulry's of Formula, AttributeInterpretation, NamedState, "
+                "and VariableAssignment must match")
+
+        discretized = {}
+        for formula in formulae:
+            if not hasattr(formula, "_is_Formula"):
+                raise TypeError(
+                    'all formulae must be of type Formula')
+
+            if formula._vocabulary != vocabulary:
+                raise ValueError(
+                    "Vocabulry's of Formula, AttributeInterpretation, "
+                    "NamedState, and VariableAssignment must match")
+
+            yield formula._assign_truth_value(
+                attribute_interpretation, self, X, discretized)
+
     def satisfies_named_state(self, named_state):
         """
         Determine if the calling NamedState object :math:`(w;\widehat{\\rho})`
@@ -554,7 +939,32 @@ class NamedState(State):
         :raises TypeError: ``context`` parameter must be a Context object, \
         ``X`` parameter must be a VariableAssignment object and \
         ``attribute_interpretation`` must be an AttributeInterpretation object.
-        :raises ValueError: The calling NamedState object must be a world.
+        :raises ValueError: The calling NamedState object must be a world and \
+        the Vocabulary objects of the calling NamedState object, ``X``, \
+        ``attribute_interpretation`` and the Formula objects of ``context`` \
+        must match.
+        """
+
+        self._check_satisfies_context(context, X, attribute_interpretation)
+
+        # if this world doesn't share the AttributeSystem and Vocabulary of
+        # the Context's NamedState, it can't satisfy the Context
+        if not self._is_comparable(context._named_state):
+            return False
+
+        return self._satisfies_context(context, X, attribute_interpretation)
+
+    def _check_satisfies_context(self, context, X, attribute_interpretation):
+        """
+        Validate the parameters of ``satisfies_context``.
+
+        :raises TypeError: ``context`` parameter must be a Context object, \
+        ``X`` parameter must be a VariableAssignment object and \
+        ``attribute_interpretation`` must be an AttributeInterpretation object.
+        :raises ValueError: The calling NamedState object must be a world and \
+        the Vocabulary objects of the calling NamedState object, ``X``, \
+        ``attribute_interpretation`` and the Formula objects of ``context`` \
+        must match.
         """
 
         if not hasattr(context, "_is_Context"):
@@ -574,26 +984,53 @@ class NamedState(State):
             raise ValueError(
                 "this NamedState object must be a world")
 
-        named_state = context._named_state
-        assumption_base = context._assumption_base
+        vocabulary = self._p._vocabulary
+        vocabs_match = vocabulary == attribute_interpretation._vocabulary == \
+            X._vocabulary and all(
+                [formula._vocabulary == vocabulary
+                 for formula in context._assumption_base])
+
+        if not vocabs_match:
+            raise ValueError(
+                "Vocabulry's of Formula, AttributeInterpretation, NamedState, "
+                "and VariableAssignment must match")
+
+    def _satisfies_context(self, context, X, attribute_interpretation):
+        """
+        Determine if the calling NamedState object satisfies the Context
+        object in the ``context`` parameter as ``satisfies_context`` does,
+        without validating the parameters (unless ``State._debug`` is set);
+        the calling NamedState object must be comparable with the NamedState
+        object of ``context`` (see ``_is_comparable``).
+
+        :return: Whether or not \
+        :math:`(w;\widehat{\\rho})\models_{\chi}\gamma`.
+        :rtype: ``bool``
+        """
+
+        if State._debug:
+            self._check_satisfies_context(
+                context, X, attribute_interpretation)
 
         # if this world doesn't satisfy Context's NamedState, doesn't satisfy
         # Context
-        if not self <= named_state:
+        if not self._extends(context._named_state):
             return False
 
         # If there's some formula for which the world does not satisfy, doesn't
-        # satisfy the Context
-        for formula in assumption_base:
-            truth_value = self.satisfies_formula(
-                formula, X, attribute_interpretation)
-
-            if truth_value is False or truth_value == "unknown":
+        # satisfy the Context; the discretized ascriptions are shared between
+        # the formulae
+        discretized = {}
+        for formula in context._assumption_base:
+            truth_value = formula._assign_truth_value(
+                attribute_interpretation, self, X, discretized)
+
+            if truth_value is not True:
                 return False
 
         return True
 
-    def _generate_variable_assignments(self):
+    def _generate_variable_assignments(self, p=None):
         """
         Generate all possible VariableAssignment objects :math:`\chi` derivable
         from the calling NamedState object i.e., find all combinations of
@@ -603,19 +1040,27 @@ class NamedState(State):
         VariableAssignments can be created, a dummy VariableAssignment
         :math:`\chi_{dummy}` is returned.
 
+        :param p: The ConstantAssignment object to use in place of \
+        :math:`\\rho` (e.g., the :math:`\widehat{\\rho}` of some world \
+        derivable from the calling NamedState object) or ``None``.
+        :type  p: ConstantAssignment | ``None``
+
         :return: A generator for all derivable VariableAssignment objects \
         :math:`\chi`.
         :rtype: ``generator``
         """
 
-        if not self._p._vocabulary._V:
-            yield VariableAssignment(self._p._vocabulary,
+        if p is None:
+            p = self._p
+
+        if not p._vocabulary._V:
+            yield VariableAssignment(p._vocabulary,
                                      self._attribute_system,
                                      {}, dummy=True)
         else:
-            V = self._p._vocabulary._V
+            V = p._vocabulary._V
             objects = self._attribute_system._objects
-            bound_objects = self._p._target
+            bound_objects = p._target
             unbound_objects = [
                 obj for obj in objects if obj not in bound_objects]
             smaller = V if len(V) <= len(unbound_objects) else unbound_objects
@@ -631,7 +1076,7 @@ class NamedState(State):
 
             for combo in combos:
                 mapping = {pair[0]: pair[1] for pair in combo}
-                X = VariableAssignment(self._p._vocabulary,
+                X = VariableAssignment(p._vocabulary,
                                        self._attribute_system,
                                        mapping)
                 yield X
@@ -723,11 +1168,18 @@ class NamedState(State):
         alternate_extensions = self.get_named_alternate_extensions(
             *named_states)
 
+        # the parameters were validated above, so the formulae are evaluated
+        # without validation; the variable assignments depend only on this
+        # NamedState's ConstantAssignment, so they are made once
+        Xs = list(self._generate_variable_assignments())
+
         for alternate_extension in alternate_extensions:
-            for X in self._generate_variable_assignments():
+            discretized = {}
+            for X in Xs:
                 for formula in assumption_base:
-                    truth_value = formula.assign_truth_value(
-                        attribute_interpretation, alternate_extension, X)
+                    truth_value = formula._assign_truth_value(
+                        attribute_interpretation, alternate_extension, X,
+                        discretized)
                     if truth_value is not False:
                         return False
         return True
@@ -766,11 +1218,26 @@ class NamedState(State):
         if not named_states:
             raise ValueError("At least one NamedState must be provided")
 
+        indexes = self._get_value_indexes()
+
         for ao_pair in basis:
             # Take union of the ValueSets of ascriptions of all named states
             valuesets = [named_state._ascriptions[ao_pair]
                          for named_state in named_states]
 
+            # Take the union as bitmasks if all ValueSets have one
+            index = indexes[ao_pair[0]]
+            if index is not None:
+                masks = [index.get_mask(valueset) for valueset in valuesets]
+                self_mask = index.get_mask(self._ascriptions[ao_pair])
+                if None not in masks and self_mask is not None:
+                    union_mask = 0
+                    for mask in masks:
+                        union_mask |= mask
+                    if union_mask != self_mask:
+                        return False
+                    continue
+
             union = valuesets[0]
             for valueset in valuesets[1:]:
                 union += valueset
@@ -0,0 +1,136 @@
+"""This section introduces the NamedWorldView class."""
+
+from named_state import NamedState
+
+
+class NamedWorldView(NamedState):
+    """
+    NamedWorldView class. Each NamedWorldView object is a lightweight,
+    read-only view of a single world :math:`(w;\widehat{\\rho})` derivable
+    from a NamedState object.
+
+    A NamedWorldView object is constructed without validation and shares the
+    AttributeSystem object and underlying Vocabulary object :math:`\Sigma`
+    of the NamedState object it is derived from, so that nothing is checked
+    again per world; as it is known to be a world, ``satisfies_formula``,
+    ``satisfies_context``, ``satisfies_named_state`` and
+    ``_generate_variable_assignments`` never check it either. Copying a
+    NamedWorldView object (e.g., via ``copy.deepcopy``) gives a NamedState
+    object that may be changed.
+
+    :ivar attribute_system: The AttributeSytem object :math:`\mathcal{S}` \
+    of the NamedState object the world is derived from.
+    :ivar ascriptions: The single element FrozenValueSet objects of the \
+    world, keyed by attribute-object pair.
+    :ivar p: The total ConstantAssignment object :math:`\widehat{\\rho}` of \
+    the world; shared with the other worlds with the same constant \
+    assignment.
+    :ivar _is_NamedWorldView: An identifier to use in place of ``type`` or \
+    ``isinstance``.
+    """
+
+    def __init__(self, attribute_system, p, ascriptions):
+        """
+        Construct a NamedWorldView object without validation.
+
+        :param attribute_system: The AttributeSystem object \
+        :math:`\mathcal{S}` of the NamedState object the world is derived \
+        from.
+        :type  attribute_system: AttributeSystem
+        :param p: The total ConstantAssignment object \
+        :math:`\widehat{\\rho}` of the world.
+        :type  p: ConstantAssignment
+        :param ascriptions: A single element FrozenValueSet object for every \
+        attribute-object pair of ``attribute_system``\.
+        :type  ascriptions: ``dict``
+        """
+
+        self._attribute_system = attribute_system
+        self._p = p
+        self._ascriptions = ascriptions
+        self._is_State = True
+        self._is_NamedState = True
+        self._is_NamedWorldView = True
+
+    def _copy(self):
+        """
+        Return the calling NamedWorldView object as a NamedState object
+        without validation, sharing its AttributeSystem object,
+        ConstantAssignment object and ValueSet objects (copy-on-write).
+
+        :return: A copy of the calling NamedWorldView object.
+        :rtype: NamedState
+        """
+
+        named_state = NamedState.__new__(NamedState)
+        named_state._attribute_system = self._attribute_system
+        named_state._p = self._p
+        named_state._ascriptions = dict(self._ascriptions)
+        named_state._is_State = True
+        named_state._is_NamedState = True
+        return named_state
+
+    def get_named_state(self):
+        """
+        Return the world as a NamedState object.
+
+        :return: A NamedState object with the ascriptions and \
+        ConstantAssignment object of the world.
+        :rtype: NamedState
+        """
+
+        return self._copy()
+
+    def is_world(self):
+        """
+        Determine if the calling NamedWorldView object is a world; always
+        true.
+
+        :return: ``True``
+        :rtype: ``bool``
+        """
+
+        return True
+
+    def set_ascription(self, ao_pair, new_valueset):
+        """
+        NamedWorldView objects are read-only.
+
+        :raises TypeError: Always.
+        """
+
+        raise TypeError("NamedWorldView objects are read-only")
+
+    def add_object(self, obj, ascriptions=None, constant_symbol=None):
+        """
+        NamedWorldView objects are read-only.
+
+        :raises TypeError: Always.
+        """
+
+        raise TypeError("NamedWorldView objects are read-only")
+
+
+def main():
+    """Main method; quick testing."""
+    from attribute import Attribute
+    from attribute_structure import AttributeStructure
+    from attribute_system import AttributeSystem
+    from constant_assignment import ConstantAssignment
+    from vocabulary import Vocabulary
+
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    asys = AttributeSystem(AttributeStructure(color, size), ['s1', 's2'])
+    vocabulary = Vocabulary(['C1'], [], [])
+    p = ConstantAssignment(vocabulary, asys, {'C1': 's1'})
+    ns = NamedState(asys, p, {('color', 's1'): ['R'], ('size', 's1'): ['M'],
+                              ('color', 's2'): ['B', 'G'],
+                              ('size', 's2'): ['L']})
+
+    for world in ns.get_worlds():
+        print world.satisfies_named_state(ns), world._p
+        print world
+
+if __name__ == "__main__":
+    main()
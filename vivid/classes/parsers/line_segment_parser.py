@@ -13,6 +13,11 @@ class LineSegmentParser(object):
     LineSegment object related expressions (some of which can involve Point
     objects).
 
+    :ivar _functions: The names of the LineSegment functions the \
+    LineSegmentParser object can call in an expression.
+    :ivar _types: The identifiers of the types of object the \
+    LineSegmentParser object accepts as values (i.e., LineSegment and Point \
+    objects).
     :ivar _is_Parser: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
@@ -22,6 +27,10 @@ class LineSegmentParser(object):
         Construct a LineSegmentParser object.
         """
 
+        self._functions = frozenset(
+            [fn for fn in dir(LineSegment)
+             if not fn.startswith("_") and fn != "unstringify"])
+        self._types = ("_is_Point", "_is_LineSegment")
         self._is_Parser = True
 
     def __call__(self, *args):
@@ -79,6 +88,82 @@ class LineSegmentParser(object):
         except Exception, e:
             raise ValueError("Bad args provided")
 
+    def compile(self, expression, arguments):
+        """
+        Resolve the function and arguments of the expression given by
+        ``expression`` parameter once and return a function that calls it
+        with values for the names given in ``arguments`` parameter (e.g.,
+        ``compile("meets(p, l1, l2)", ["p", "l1", "l2"])``); stringified
+        LineSegment and Point objects may also be given in the expression
+        directly.
+
+        :param expression: The expression to compile.
+        :type  expression: ``str``
+        :param arguments: The names of the variables of the expression in the \
+        order their values are given to the returned function.
+        :type  arguments: ``list``
+
+        :return: A function taking a value for each name in ``arguments`` \
+        parameter and returning the result of the LineSegment function.
+        :rtype: ``function``
+
+        :raises ValueError: Function provided in ``expression`` parameter is \
+        not a function in the LineSegment class, some argument is neither a \
+        name in ``arguments`` parameter nor a stringified LineSegment or \
+        Point or ``expression`` parameter is improperly formatted; the \
+        returned function raises a ValueError if some value given to it is \
+        not a LineSegment or Point or the LineSegment function fails.
+        """
+
+        import re
+        match = re.match(r'^\s*(\w+)\s*\((.*)\)\s*$', expression)
+        if not match:
+            raise ValueError("expression must be a function call")
+
+        fn_name, fn_args = match.groups()
+        if fn_name not in dir(LineSegment):
+            raise ValueError("Function not contained in dir of LineSegment")
+
+        # call the underlying function so that objects are accepted no matter
+        # which module path their class was imported through
+        line_segment_function = getattr(LineSegment, fn_name)
+        line_segment_function = getattr(
+            line_segment_function, "im_func", line_segment_function)
+
+        # each operand is either the index of a value or an object literal
+        arguments = list(arguments)
+        operands = []
+        line_segment_pattern = r'(L\(P\(-?\d\.\d+(,-?\d\.\d+)*\),P\(-?\d\.\d+(,-?\d\.\d+)*\)\)|P\(x(,x)*\),P\(x(,x)*\)\))|P\(-?\d\.\d+(,-?\d\.\d+)*\)|P\(x(,x)*\)|\w+'
+        for match in re.finditer(line_segment_pattern, fn_args):
+            token = match.group()
+            if token in arguments:
+                operands.append((arguments.index(token), None))
+            elif token[0] == 'L' and token[-1] == ')':
+                operands.append((None, LineSegment.unstringify(token)))
+            elif token[0] == 'P' and token[-1] == ')':
+                operands.append((None, Point.unstringify(token)))
+            else:
+                raise ValueError("Only Point arguments acceptable")
+
+        if not all([char in ", " for char in re.sub(line_segment_pattern, '',
+                                                   fn_args)]):
+            raise ValueError("Only Point arguments acceptable")
+
+        def evaluator(*values):
+            parsed_args = [literal if index is None else values[index]
+                           for index, literal in operands]
+            for arg in parsed_args:
+                if not hasattr(arg, "_is_Point") and \
+                        not hasattr(arg, "_is_LineSegment"):
+                    raise ValueError(
+                        "Only Point and LineSegment arguments acceptable")
+            try:
+                return line_segment_function(*parsed_args)
+            except Exception:
+                raise ValueError("Bad args provided")
+
+        return evaluator
+
 
 def main():
     """."""
@@ -13,8 +13,12 @@ class ParserSet(object):
     :ivar parsers: The parsers contained in the ParserSet object.
     :ivar _is_ParserSet: An identifier to use in place of ``type`` or \
     ``isinstance``.
+    :cvar _shared: The ParserSet object shared by every compilation of a \
+    Relation object's definition; built on first use.
     """
 
+    _shared = None
+
     def __init__(self):
         """
         Construct a ParserSet object.
@@ -47,6 +51,48 @@ class ParserSet(object):
             raise TypeError("Indexing of ParserSet requires type int")
         return self._parsers[key]
 
+    @classmethod
+    def get_shared(cls):
+        """
+        Return the ParserSet object shared within the process, constructing it
+        (and thus the grammar of each of its parsers) only on the first call.
+
+        :return: The shared ParserSet object.
+        :rtype: ParserSet
+        """
+
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def route(self, expression):
+        """
+        Return the parsers of the ParserSet object that declare they handle
+        the expression given by ``expression`` parameter, in order. If the
+        expression is a call of a function some parser declares (in its
+        ``_functions`` member; e.g., ``meets(p, l1, l2)``), those parsers are
+        returned; otherwise the parsers accepting no objects of the vivid
+        object extension protocol (i.e., with an empty ``_types`` member) are
+        returned, as the expression is taken to be mathematical/logical.
+
+        :param expression: The expression to route.
+        :type  expression: ``str``
+
+        :return: The parsers declaring they handle ``expression`` parameter.
+        :rtype: ``list``
+        """
+
+        import re
+        match = re.match(r'^\s*(\w+)\s*\(', expression)
+        if match:
+            fn_name = match.group(1)
+            parsers = [parser for parser in self._parsers
+                       if fn_name in parser._functions]
+            if parsers:
+                return parsers
+
+        return [parser for parser in self._parsers if not parser._types]
+
     def __iter__(self):
         """
         Provides an iterator for ParserSet
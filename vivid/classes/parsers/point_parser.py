@@ -11,6 +11,10 @@ class PointParser(object):
     PointParser class. The PointParser class is used for parsing Point object
     related expressions.
 
+    :ivar _functions: The names of the Point functions the PointParser \
+    object can call in an expression.
+    :ivar _types: The identifiers of the types of object the PointParser \
+    object accepts as values (i.e., Point objects).
     :ivar _is_Parser: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
@@ -20,6 +24,10 @@ class PointParser(object):
         Construct a PointParser object.
         """
 
+        self._functions = frozenset(
+            [fn for fn in dir(Point)
+             if not fn.startswith("_") and fn != "unstringify"])
+        self._types = ("_is_Point",)
         self._is_Parser = True
 
     def __call__(self, *args):
@@ -72,6 +80,75 @@ class PointParser(object):
         except Exception, e:
             raise ValueError("Bad args provided")
 
+    def compile(self, expression, arguments):
+        """
+        Resolve the function and arguments of the expression given by
+        ``expression`` parameter once and return a function that calls it
+        with values for the names given in ``arguments`` parameter (e.g.,
+        ``compile("is_on(p, s, e)", ["p", "s", "e"])``); stringified Point
+        objects may also be given in the expression directly.
+
+        :param expression: The expression to compile.
+        :type  expression: ``str``
+        :param arguments: The names of the variables of the expression in the \
+        order their values are given to the returned function.
+        :type  arguments: ``list``
+
+        :return: A function taking a value for each name in ``arguments`` \
+        parameter and returning the result of the Point function.
+        :rtype: ``function``
+
+        :raises ValueError: Function provided in ``expression`` parameter is \
+        not a function in the Point class, some argument is neither a name in \
+        ``arguments`` parameter nor a stringified Point or ``expression`` \
+        parameter is improperly formatted; the returned function raises a \
+        ValueError if some value given to it is not a Point or the Point \
+        function fails.
+        """
+
+        import re
+        match = re.match(r'^\s*(\w+)\s*\((.*)\)\s*$', expression)
+        if not match:
+            raise ValueError("expression must be a function call")
+
+        fn_name, fn_args = match.groups()
+        if fn_name not in dir(Point):
+            raise ValueError("Function not contained in dir of Point")
+
+        # call the underlying function so that Point objects are accepted no
+        # matter which module path their class was imported through
+        point_function = getattr(Point, fn_name)
+        point_function = getattr(point_function, "im_func", point_function)
+
+        # each operand is either the index of a value or a Point literal
+        arguments = list(arguments)
+        operands = []
+        point_pattern = r'P\(-?\d\.\d+(,-?\d\.\d+)*\)|P\(x(,x)*\)|\w+'
+        for match in re.finditer(point_pattern, fn_args):
+            token = match.group()
+            if token in arguments:
+                operands.append((arguments.index(token), None))
+            elif token[0] == 'P' and token[-1] == ')':
+                operands.append((None, Point.unstringify(token)))
+            else:
+                raise ValueError("Only Point arguments acceptable")
+
+        if not all([char in ", " for char in re.sub(point_pattern, '',
+                                                   fn_args)]):
+            raise ValueError("Only Point arguments acceptable")
+
+        def evaluator(*values):
+            parsed_args = [literal if index is None else values[index]
+                           for index, literal in operands]
+            if not all([hasattr(arg, "_is_Point") for arg in parsed_args]):
+                raise ValueError("Only Point arguments acceptable")
+            try:
+                return point_function(*parsed_args)
+            except Exception:
+                raise ValueError("Bad args provided")
+
+        return evaluator
+
 
 def main():
     """."""
@@ -1,8 +1,9 @@
 """This section introduces the TruthValueParser class."""
 
 from __future__ import division
-from pyparsing import (Literal, CaselessLiteral, Word, Combine, Group,
-                       Optional, ZeroOrMore, Forward, nums, alphas, oneOf)
+from pyparsing import (Literal, CaselessLiteral, Keyword, CaselessKeyword,
+                       Word, Combine, Group, Optional, ZeroOrMore, Forward,
+                       nums, alphas, oneOf, ParseException)
 import math
 import operator
 
@@ -14,7 +15,8 @@ import operator
 # negop       ::   '!'
 # logop       ::   'and' | 'or'
 # integer     ::   ['+' | '-'] '0'..'9'+
-# atom        ::   PI | E | True | False | real | fn '(' expr ')' | '(' expr ')'
+# atom        ::   PI | E | True | False | real | fn '(' expr ')' | var |
+#                  '(' expr ')'
 # factor      ::   atom [ expop factor ]*
 # term        ::   factor [ multop factor ]*
 # expr        ::   term [ addop term ]*
@@ -23,11 +25,31 @@ import operator
 # sentence    ::   negation [logop negation]*
 
 
+class _Variable(str):
+    """
+    A ``str`` marking an identifier in the expression stack that is bound to
+    an argument of a Relation object's definition.
+    """
+
+    pass
+
+
 class TruthValueParser(object):
     """
     TruthValueParser class. TruthValueParser provides parsing functionality for
     entirely mathematical/logical strings.
 
+    :ivar _functions: The names of the mathematical functions the \
+    TruthValueParser object can call in an expression (e.g., ``sin``).
+    :ivar _types: The identifiers of the types of object the \
+    TruthValueParser object accepts as values; empty as it accepts only \
+    numbers and truth values, not objects of the vivid object extension \
+    protocol.
+    :ivar _arguments: The names of the variables of the expression being \
+    parsed by ``_parse``; a constant spelled exactly as one of them (e.g., \
+    ``e`` in ``R1(e) <=> e > 1``) is parsed as the variable.
+    :ivar _parsed: The expression and arguments most recently parsed by \
+    ``_parse`` and the stack they were parsed into (or ``None``).
     :ivar _is_Parser: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
@@ -40,16 +62,20 @@ class TruthValueParser(object):
         """
 
         point = Literal(".")
-        e = CaselessLiteral("E")
+        exponent = CaselessLiteral("E")
         fnumber = Combine(Word("+-" + nums, nums) +
                           Optional(point + Optional(Word(nums))) +
-                          Optional(e + Word("+-" + nums, nums)))
+                          Optional(exponent + Word("+-" + nums, nums)))
         ident = Word(alphas, alphas + nums + "_$")
-
-        true = Literal("True")
-        false = Literal("False")
-        andop = CaselessLiteral("and")
-        orop = CaselessLiteral("or")
+        var = Word(alphas + "_", alphas + nums + "_")
+
+        # keywords so that Relation arguments like "e1" or "order" are not
+        # split into a constant or operator followed by garbage
+        e = CaselessKeyword("E")
+        true = Keyword("True")
+        false = Keyword("False")
+        andop = CaselessKeyword("and")
+        orop = CaselessKeyword("or")
         negop = Literal("!")
         eop = Literal("=")
         gop = Literal(">")
@@ -67,11 +93,13 @@ class TruthValueParser(object):
         addop = plus | minus
         multop = mult | div
         expop = Literal("^")
-        pi = CaselessLiteral("PI")
+        pi = CaselessKeyword("PI")
         sentence = Forward()
         atom = (
             (Optional(oneOf("- +")) +
-                (pi | e | true | false | fnumber | ident + lpar + sentence + rpar).setParseAction(self.pushFirst)) |
+                ((pi | e | true | false).setParseAction(self.pushConstant) |
+                 (fnumber | ident + lpar + sentence + rpar).setParseAction(self.pushFirst) |
+                 var.setParseAction(self.pushVariable))) |
             Optional(oneOf("- +")) + Group(lpar + sentence + rpar)).setParseAction(self.pushUMinus)
         # by defining exponentiation as "atom [ ^ factor ]..." instead of
         # "atom [ ^ atom ]...", we get right-to-left exponents, instead of
@@ -122,6 +150,38 @@ class TruthValueParser(object):
         self.log = {"and": all,
                     "or": any}
 
+        # interval counterparts of the functions above; functions that are
+        # not monotone are only evaluated on single values
+        def monotone(fn):
+            return lambda bounds: (fn(bounds[0]), fn(bounds[1]))
+
+        def single(fn):
+            def interval_fn(bounds):
+                if bounds[0] != bounds[1]:
+                    raise ValueError("Unable to bound " + fn.__name__)
+                return (fn(bounds[0]), fn(bounds[1]))
+            return interval_fn
+
+        def interval_abs(bounds):
+            inf, sup = bounds
+            if inf >= 0:
+                return (abs(inf), abs(sup))
+            if sup <= 0:
+                return (abs(sup), abs(inf))
+            return (0, max(abs(inf), abs(sup)))
+
+        self.interval_fn = {"sin": single(math.sin),
+                            "cos": single(math.cos),
+                            "tan": single(math.tan),
+                            "abs": interval_abs,
+                            "trunc": monotone(self.fn["trunc"]),
+                            "round": monotone(round),
+                            "sgn": monotone(self.fn["sgn"])}
+
+        self._functions = frozenset(self.fn)
+        self._types = ()
+        self._arguments = ()
+        self._parsed = None
         self._is_Parser = True
 
     def __call__(self, *args):
@@ -135,6 +195,21 @@ class TruthValueParser(object):
         """Push first token onto the stack."""
         self.exprStack.append(toks[0])
 
+    def pushConstant(self, strg, loc, toks):
+        """
+        Push a constant onto the stack, or a variable if it is spelled
+        exactly as one of the names in ``_arguments``.
+        """
+        name = strg[loc:loc + len(toks[0])]
+        if name in self._arguments:
+            self.exprStack.append(_Variable(name))
+        else:
+            self.exprStack.append(toks[0])
+
+    def pushVariable(self, strg, loc, toks):
+        """Push a variable (bound at evaluation) onto the stack."""
+        self.exprStack.append(_Variable(toks[0]))
+
     def pushUMinus(self, strg, loc, toks):
         """Push unary minus operator onto the stack."""
         if toks and toks[0] == '-':
@@ -152,25 +227,34 @@ class TruthValueParser(object):
                 self.exprStack.append("!")
             self.negations = []
 
-    def evaluate_stack(self, s):
-        """Evaluate internal stack of parse object."""
+    def evaluate_stack(self, s, bindings={}):
+        """
+        Evaluate internal stack of parse object; variables are looked up in
+        ``bindings`` parameter.
+        """
+
         op = s.pop()
+        if isinstance(op, _Variable):
+            try:
+                return bindings[op]
+            except KeyError:
+                raise ValueError("Unbound variable: " + op)
         if op == 'unary -':
-            return -self.evaluate_stack(s)
+            return -self.evaluate_stack(s, bindings)
         if op in "+-*/^":
-            op2 = self.evaluate_stack(s)
-            op1 = self.evaluate_stack(s)
+            op2 = self.evaluate_stack(s, bindings)
+            op1 = self.evaluate_stack(s, bindings)
             return self.opn[op](op1, op2)
         elif op in "<=>=":
-            op2 = self.evaluate_stack(s)
-            op1 = self.evaluate_stack(s)
+            op2 = self.evaluate_stack(s, bindings)
+            op1 = self.evaluate_stack(s, bindings)
             return self.rel[op](float(op1), float(op2))
         elif op in "!":
-            op = self.evaluate_stack(s)
+            op = self.evaluate_stack(s, bindings)
             return self.neg["!"](op)
         elif op in "andor":
-            op2 = self.evaluate_stack(s)
-            op1 = self.evaluate_stack(s)
+            op2 = self.evaluate_stack(s, bindings)
+            op1 = self.evaluate_stack(s, bindings)
             return self.log[op]([op1, op2])
         elif op == "True":
             return True
@@ -181,12 +265,146 @@ class TruthValueParser(object):
         elif op == "E":
             return math.e  # 2.718281828
         elif op in self.fn:
-            return self.fn[op](self.evaluate_stack(s))
+            return self.fn[op](self.evaluate_stack(s, bindings))
         elif op[0].isalpha():
             return 0
         else:
             return float(op)
 
+    def evaluate_interval_stack(self, s, bindings={}):
+        """
+        Evaluate internal stack of parse object over intervals; variables are
+        looked up in ``bindings`` parameter as (infimum, supremum) 2-tuples
+        and every value is returned as such a 2-tuple bounding the values
+        ``evaluate_stack`` can return for values within the bindings. Truth
+        values are bounded by ``(False, False)``, ``(True, True)`` or
+        ``(False, True)`` when either is possible.
+
+        :raises ValueError: The stack cannot be bounded over the bindings \
+        (e.g., a division by an interval containing 0).
+        """
+
+        op = s.pop()
+        if isinstance(op, _Variable):
+            try:
+                return bindings[op]
+            except KeyError:
+                raise ValueError("Unbound variable: " + op)
+        if op == 'unary -':
+            inf, sup = self.evaluate_interval_stack(s, bindings)
+            return (-sup, -inf)
+        if op in "+-*/^":
+            op2 = self.evaluate_interval_stack(s, bindings)
+            op1 = self.evaluate_interval_stack(s, bindings)
+            return TruthValueParser._interval_operation(op, op1, op2)
+        elif op in "<=>=":
+            op2 = self.evaluate_interval_stack(s, bindings)
+            op1 = self.evaluate_interval_stack(s, bindings)
+            return TruthValueParser._interval_relation(op, op1, op2)
+        elif op in "!":
+            inf, sup = self.evaluate_interval_stack(s, bindings)
+            if type(inf) is bool and type(sup) is bool:
+                return (not sup, not inf)
+            if inf is True or sup is True:
+                raise ValueError("Unable to bound negation")
+            return (True, True)
+        elif op in "andor":
+            op2 = TruthValueParser._interval_truth_value(
+                self.evaluate_interval_stack(s, bindings))
+            op1 = TruthValueParser._interval_truth_value(
+                self.evaluate_interval_stack(s, bindings))
+            if op == "and":
+                possible = set([a and b for a in op1 for b in op2])
+            else:
+                possible = set([a or b for a in op1 for b in op2])
+            return (min(possible), max(possible))
+        elif op == "True":
+            return (True, True)
+        elif op == "False":
+            return (False, False)
+        elif op == "PI":
+            return (math.pi, math.pi)
+        elif op == "E":
+            return (math.e, math.e)
+        elif op in self.fn:
+            return self.interval_fn[op](
+                self.evaluate_interval_stack(s, bindings))
+        elif op[0].isalpha():
+            return (0, 0)
+        else:
+            return (float(op), float(op))
+
+    @staticmethod
+    def _interval_operation(op, op1, op2):
+        """
+        Bound the arithmetic operation given by ``op`` parameter over two
+        (infimum, supremum) 2-tuples.
+
+        :raises ValueError: The operation cannot be bounded.
+        """
+
+        (inf1, sup1), (inf2, sup2) = op1, op2
+
+        if op == "+":
+            return (inf1 + inf2, sup1 + sup2)
+        if op == "-":
+            return (inf1 - sup2, sup1 - inf2)
+        if op == "/" and inf2 <= 0 <= sup2:
+            raise ValueError("Unable to bound division by 0")
+        if op == "^" and (inf1 != sup1 or inf2 != sup2) and inf1 <= 0:
+            # a power of an interval of positive values is monotone in both
+            # the base and exponent, otherwise only whole exponents are
+            # bounded
+            if inf2 != sup2 or inf2 < 0 or int(inf2) != inf2:
+                raise ValueError("Unable to bound power")
+            if inf2 % 2 == 0 and sup1 >= 0:
+                return (0, max(inf1 ** inf2, sup1 ** inf2))
+
+        # the remaining operations are monotone in each operand over the
+        # intervals, so their bounds are found at the corners
+        operation = {"*": operator.mul,
+                     "/": operator.truediv,
+                     "^": operator.pow}[op]
+        corners = [operation(a, b) for a in (inf1, sup1) for b in (inf2, sup2)]
+        return (min(corners), max(corners))
+
+    @staticmethod
+    def _interval_relation(op, op1, op2):
+        """
+        Bound the relational operation given by ``op`` parameter over two
+        (infimum, supremum) 2-tuples.
+        """
+
+        inf1, sup1 = float(op1[0]), float(op1[1])
+        inf2, sup2 = float(op2[0]), float(op2[1])
+        if op == "=":
+            true = inf1 == sup1 == inf2 == sup2
+            false = sup1 < inf2 or sup2 < inf1
+        elif op == ">":
+            true, false = inf1 > sup2, sup1 <= inf2
+        elif op == "<":
+            true, false = sup1 < inf2, inf1 >= sup2
+        elif op == ">=":
+            true, false = inf1 >= sup2, sup1 < inf2
+        else:
+            true, false = sup1 <= inf2, inf1 > sup2
+
+        return (true, not false)
+
+    @staticmethod
+    def _interval_truth_value(bounds):
+        """
+        Return the ``set`` of truth values the values bounded by an
+        (infimum, supremum) 2-tuple can take.
+        """
+
+        inf, sup = bounds
+        if inf == sup == 0:
+            return set([False])
+        if inf > 0 or sup < 0:
+            return set([True])
+        return set([False, True])
+
     def _eval(self, string):
         """
         Try to evaluate given string in ``string`` parameter.
@@ -202,6 +420,129 @@ class TruthValueParser(object):
         val = self.evaluate_stack(self.exprStack[:])
         return val
 
+    def _parse(self, expression, arguments):
+        """
+        Parse the expression given by ``expression`` parameter into a stack
+        and check each of its variables is a name given in ``arguments``
+        parameter. The most recently parsed expression is kept, so compiling
+        it again (e.g., with ``compile_intervals`` after ``compile``) does not
+        parse it again.
+
+        :param expression: The expression to parse.
+        :type  expression: ``str``
+        :param arguments: The names of the variables of the expression.
+        :type  arguments: ``list``
+
+        :return: The stack of the expression.
+        :rtype: ``list``
+
+        :raises ValueError: ``expression`` parameter could not be parsed or \
+        contains a variable not in ``arguments`` parameter.
+        """
+
+        key = (expression, tuple(arguments))
+        if self._parsed is not None and self._parsed[0] == key:
+            return self._parsed[1]
+
+        self.exprStack, self.negations = [], []
+        self._arguments = frozenset(arguments)
+        try:
+            self.bnf.parseString(expression, True)
+        except ParseException:
+            raise ValueError("Unable to parse expression: " + expression)
+        finally:
+            self._arguments = ()
+
+        stack = self.exprStack
+        for op in stack:
+            if isinstance(op, _Variable) and op not in arguments:
+                raise ValueError("Unbound variable: " + op)
+
+        self._parsed = (key, stack)
+        return stack
+
+    def compile(self, expression, arguments):
+        """
+        Parse the expression given by ``expression`` parameter once and return
+        a function that evaluates it for values of the names given in
+        ``arguments`` parameter (e.g., ``compile("h1 > h2", ["h1", "h2"])``
+        returns a function ``f`` such that ``f(9, 8)`` is ``True``).
+
+        :param expression: The expression to compile.
+        :type  expression: ``str``
+        :param arguments: The names of the variables of the expression in the \
+        order their values are given to the returned function.
+        :type  arguments: ``list``
+
+        :return: A function taking a value for each name in ``arguments`` \
+        parameter and returning the value of the expression.
+        :rtype: ``function``
+
+        :raises ValueError: ``expression`` parameter could not be parsed or \
+        contains a variable not in ``arguments`` parameter; the returned \
+        function raises a ValueError if the values given to it cannot be \
+        evaluated.
+        """
+
+        stack, arguments = self._parse(expression, arguments), list(arguments)
+
+        def evaluator(*values):
+            try:
+                return self.evaluate_stack(stack[:], dict(zip(arguments,
+                                                              values)))
+            except Exception:
+                raise ValueError("Unable to evaluate expression: " +
+                                 expression)
+
+        return evaluator
+
+    def compile_intervals(self, expression, arguments):
+        """
+        Parse the expression given by ``expression`` parameter once and return
+        a function that decides it over intervals of values of the names
+        given in ``arguments`` parameter, i.e., for an (infimum, supremum)
+        2-tuple per name, the function returns ``True`` (``False``) if the
+        function returned by ``compile`` returns a true (false) value for
+        every combination of values within the intervals and ``"unknown"``
+        otherwise (e.g., ``compile_intervals("h1 > h2", ["h1", "h2"])``
+        returns a function ``f`` such that ``f((9, 12), (2, 8))`` is ``True``
+        and ``f((9, 12), (2, 10))`` is ``"unknown"``).
+
+        ``"unknown"`` is also returned when the expression cannot be bounded
+        over the intervals (e.g., when dividing by an interval containing 0
+        or taking the sine of an interval); the caller may then split the
+        intervals.
+
+        :param expression: The expression to compile.
+        :type  expression: ``str``
+        :param arguments: The names of the variables of the expression in the \
+        order their intervals are given to the returned function.
+        :type  arguments: ``list``
+
+        :return: A function taking an (infimum, supremum) 2-tuple for each \
+        name in ``arguments`` parameter and returning a truth value in \
+        :math:`\{\\textbf{true}, \\textbf{false}, \\textbf{unknown}\}`.
+        :rtype: ``function``
+
+        :raises ValueError: ``expression`` parameter could not be parsed or \
+        contains a variable not in ``arguments`` parameter.
+        """
+
+        stack, arguments = self._parse(expression, arguments), list(arguments)
+
+        def interval_evaluator(*bounds):
+            try:
+                truth_values = TruthValueParser._interval_truth_value(
+                    self.evaluate_interval_stack(stack[:], dict(zip(arguments,
+                                                                    bounds))))
+            except Exception:
+                return "unknown"
+            if len(truth_values) > 1:
+                return "unknown"
+            return truth_values.pop()
+
+        return interval_evaluator
+
 
 def main():
     import time
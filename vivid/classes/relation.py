@@ -1,5 +1,6 @@
 """This section introduces the Relation class."""
 
+from collections import OrderedDict
 from copy import deepcopy
 
 
@@ -16,10 +17,31 @@ class Relation(object):
     Attributes objects; no assumptions are made on the labels of the \
     attributes.
     :ivar subscript: The subscript of the relation.
+    :ivar evaluator: A function evaluating the right hand side of the \
+    definition for values given for its arguments; compiled once per \
+    definition.
+    :ivar interval_evaluator: A function deciding the right hand side of the \
+    definition over intervals of values given for its arguments or ``None`` \
+    if the parser evaluating the definition has no interval evaluation \
+    (see ``TruthValueParser.compile_intervals``); compiled once per \
+    definition.
     :ivar _is_Relation: An identifier to use in place of ``type`` or \
     ``isinstance``.
+    :cvar _evaluators: The evaluators compiled most recently, in least \
+    recently used order, keyed by definition.
+    :cvar _interval_evaluators: The interval evaluators compiled most \
+    recently, in least recently used order, keyed by definition.
+    :cvar _evaluators_size: The largest number of evaluators (and of \
+    interval evaluators) kept in ``_evaluators`` (and \
+    ``_interval_evaluators``); Relation objects keep their own evaluators, \
+    so an evicted evaluator is only compiled again for a new Relation \
+    object with the same definition.
     """
 
+    _evaluators = OrderedDict()
+    _interval_evaluators = OrderedDict()
+    _evaluators_size = 1024
+
     def __init__(self, definition, D_of_r, subscript):
         """
         Construct a Relation object.
@@ -85,6 +107,8 @@ class Relation(object):
                 "as argument")
 
         self._definition = definition
+        self._evaluator, self._interval_evaluator = \
+            Relation._compile_evaluators(definition)
         self._DR = D_of_r
         self._subscript = subscript
         self._is_Relation = True
@@ -184,6 +208,8 @@ class Relation(object):
 
         if Relation.is_valid_definition(definition):
             self._definition = definition
+            self._evaluator, self._interval_evaluator = \
+                Relation._compile_evaluators(definition)
         else:
             raise ValueError(
                 "definition parameter must be of form 'Rs(x1,x2,...,xn) <=> ' "
@@ -253,6 +279,176 @@ class Relation(object):
 
         return len(self._DR)
 
+    @staticmethod
+    def _compile_parsers(definition):
+        """
+        Compile the right hand side of the definition given by ``definition``
+        parameter over the arguments of the definition with each parser in
+        the shared ParserSet object declaring it handles the expression (see
+        ``ParserSet.route``), in order; parsers unable to compile the
+        expression are left out.
+
+        :param definition: A valid definition of a Relation object.
+        :type  definition: ``str``
+
+        :return: A (parser, compiled expression) 2-tuple for each parser \
+        able to compile the definition.
+        :rtype: ``list``
+        """
+
+        from parsers.parser_set import ParserSet
+
+        start_paren = definition.find('(')
+        end_paren = definition.find(')')
+        arguments = [arg.strip() for arg in
+                     definition[start_paren + 1:end_paren].split(',')]
+        expression = definition[definition.find("<=>") + 3:].strip()
+
+        compiled = []
+        for parser in ParserSet.get_shared().route(expression):
+            try:
+                compiled.append(
+                    (parser, parser.compile(expression, arguments)))
+            except ValueError:
+                pass
+
+        return compiled
+
+    @staticmethod
+    def _compile_evaluators(definition):
+        """
+        Return the evaluator and the interval evaluator of the definition
+        given by ``definition`` parameter (see ``_compile_definition`` and
+        ``_compile_interval_definition``); the parsers handling the
+        definition compile it at most once for both.
+
+        :param definition: A valid definition of a Relation object.
+        :type  definition: ``str``
+
+        :return: A 2-tuple of the evaluator and the interval evaluator.
+        :rtype: ``tuple``
+        """
+
+        compiled = None
+        if definition not in Relation._evaluators or \
+                definition not in Relation._interval_evaluators:
+            compiled = Relation._compile_parsers(definition)
+
+        return (Relation._compile_definition(definition, compiled),
+                Relation._compile_interval_definition(definition, compiled))
+
+    @staticmethod
+    def _compile_definition(definition, compiled=None):
+        """
+        Compile the right hand side of the definition given by ``definition``
+        parameter into an evaluator bound to the parser in the shared
+        ParserSet object that handles it. Parsers declare the functions and
+        types of object they handle, so the parser is chosen once when the
+        definition is compiled rather than by trying every parser for each
+        evaluation; only when several parsers declare the function of the
+        expression (e.g., ``meets`` of Point and LineSegment objects) is the
+        parser chosen by the types of the values given, once per combination
+        of types. Evaluators are cached by definition so copies of a Relation
+        object do not compile again.
+
+        :param definition: A valid definition of a Relation object.
+        :type  definition: ``str``
+        :param compiled: The result of ``_compile_parsers`` for \
+        ``definition`` parameter, if already computed.
+        :type  compiled: ``list`` | ``None``
+
+        :return: A function taking a value for each argument of the \
+        definition (in order) and returning the truth value of the \
+        definition's right hand side; the function raises a ValueError if no \
+        parser in the ParserSet object can evaluate the values given.
+        :rtype: ``function``
+        """
+
+        try:
+            evaluator = Relation._evaluators.pop(definition)
+        except KeyError:
+            pass
+        else:
+            Relation._evaluators[definition] = evaluator
+            return evaluator
+
+        if compiled is None:
+            compiled = Relation._compile_parsers(definition)
+
+        if len(compiled) == 1:
+            evaluator = compiled[0][1]
+        else:
+            dispatch = {}
+
+            def evaluator(*values):
+                key = tuple([type(value) for value in values])
+                try:
+                    compiled_expression = dispatch[key]
+                except KeyError:
+                    for parser, compiled_expression in compiled:
+                        if all([any([hasattr(value, identifier)
+                                     for identifier in parser._types])
+                                for value in values]):
+                            break
+                    else:
+                        compiled_expression = None
+                    dispatch[key] = compiled_expression
+
+                if compiled_expression is None:
+                    raise ValueError("Unable to parse formula")
+                return compiled_expression(*values)
+
+        Relation._evaluators[definition] = evaluator
+        if len(Relation._evaluators) > Relation._evaluators_size:
+            Relation._evaluators.popitem(last=False)
+        return evaluator
+
+    @staticmethod
+    def _compile_interval_definition(definition, compiled=None):
+        """
+        Compile the right hand side of the definition given by ``definition``
+        parameter into an interval evaluator with the first parser in the
+        shared ParserSet object that handles and can compile it, provided the
+        parser has a ``compile_intervals`` function. Interval evaluators are
+        cached by definition.
+
+        :param definition: A valid definition of a Relation object.
+        :type  definition: ``str``
+        :param compiled: The result of ``_compile_parsers`` for \
+        ``definition`` parameter, if already computed.
+        :type  compiled: ``list`` | ``None``
+
+        :return: A function taking an (infimum, supremum) 2-tuple for each \
+        argument of the definition (in order) and returning ``True``, \
+        ``False`` or ``"unknown"`` or ``None`` if no such function exists.
+        :rtype: ``function`` | ``None``
+        """
+
+        try:
+            interval_evaluator = Relation._interval_evaluators.pop(definition)
+        except KeyError:
+            pass
+        else:
+            Relation._interval_evaluators[definition] = interval_evaluator
+            return interval_evaluator
+
+        interval_evaluator = None
+        if compiled is None:
+            compiled = Relation._compile_parsers(definition)
+        if compiled and hasattr(compiled[0][0], "compile_intervals"):
+            start_paren = definition.find('(')
+            end_paren = definition.find(')')
+            arguments = [arg.strip() for arg in
+                         definition[start_paren + 1:end_paren].split(',')]
+            expression = definition[definition.find("<=>") + 3:].strip()
+            interval_evaluator = compiled[0][0].compile_intervals(
+                expression, arguments)
+
+        Relation._interval_evaluators[definition] = interval_evaluator
+        if len(Relation._interval_evaluators) > Relation._evaluators_size:
+            Relation._interval_evaluators.popitem(last=False)
+        return interval_evaluator
+
     @staticmethod
     def is_valid_definition(definition):
         """
@@ -1,8 +1,10 @@
 """This section introduces the State class."""
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from functools import total_ordering
 from valueset import ValueSet
+from frozen_valueset import FrozenValueSet
+from value_index import ValueIndex
 from attribute import Attribute
 from attribute_structure import AttributeStructure
 from attribute_system import AttributeSystem
@@ -25,15 +27,24 @@ class State(object):
     extensions are also available via the ``<``, ``>=``, and ``>`` operators
     respectively, despite the lack of magic functions for them.
 
-    :ivar attribute_system: A copy of the AttributeSytem object \
-    :math:`\mathcal{S}` that the State object comes from.
+    :ivar attribute_system: The AttributeSytem object :math:`\mathcal{S}` \
+    that the State object comes from; shared by reference and copied only \
+    when the State object adds an object to it.
     :ivar ascriptions: The ascriptions of the state (i.e., the set of \
     attribute-object pairs and their corresponding ValueSet objects) \
-    :math:`\delta_{i},~i=1, \ldots, k`.
+    :math:`\delta_{i},~i=1, \ldots, k`. The ValueSet objects are \
+    FrozenValueSet objects shared with copies of the State object and the \
+    Attribute objects they come from; ``set_ascription`` replaces them.
     :ivar _is_State: An identifier to use in place of ``type`` or \
     ``isinstance``.
+    :cvar _debug: Whether the unchecked variants of the methods used in \
+    inner loops (e.g., ``_set_ascription`` for ``set_ascription``), which \
+    rely on their callers to validate the parameters once, validate them \
+    anyway; for testing.
     """
 
+    _debug = False
+
     def __init__(self, attribute_system, ascriptions={}):
         """
         Construct a State object.
@@ -60,22 +71,19 @@ class State(object):
         if not isinstance(ascriptions, dict):
             raise TypeError("ascriptions parameter must be of type dict")
 
-        self._attribute_system = deepcopy(attribute_system)
+        self._attribute_system = attribute_system
         self._ascriptions = {}
         self._is_State = True
 
-        # Initialize the state as empty
+        # Initialize the state as empty; the Attribute ValueSets are shared
         for Ai in self._attribute_system._attribute_structure._attributes:
             for s_i in self._attribute_system._objects:
-                self._ascriptions[(Ai._label, s_i)] = deepcopy(Ai._value_set)
+                self._ascriptions[(Ai._label, s_i)] = Ai._value_set
 
         # Set any ascriptions provided to constructor
         for ao_pair, valueset in ascriptions.iteritems():
             self.set_ascription(ao_pair, valueset)
 
-        # break references by copying ascriptions
-        self._ascriptions = deepcopy(self._ascriptions)
-
     def __eq__(self, other):
         """
         Determine if two State objects are equal via the ``==`` operator.
@@ -106,6 +114,19 @@ class State(object):
         as the calling State object.
         """
 
+        State._check_extension(self, other)
+        return State._extends(self, other)
+
+    def _check_extension(self, other):
+        """
+        Validate the ``other`` parameter of ``<=`` (see ``__le__``).
+
+        :raises TypeError: ``other`` parameter must be a State object.
+        :raises ValueError: The state object in the ``other`` parameter must \
+        share the same underlying AttributeSystem object :math:`\mathcal{S}` \
+        as the calling State object.
+        """
+
         if not hasattr(other, "_is_State"):
             raise TypeError(
                 'other parameter must be a State object')
@@ -115,13 +136,37 @@ class State(object):
             raise ValueError(
                 "other State must be of same AttributeSystem as this State")
 
-        ao_pairs = self._ascriptions.keys()
+    def _extends(self, other):
+        """
+        Determine if the calling State object is an extension of the State
+        object in ``other`` parameter as ``<=`` does, without validating
+        ``other`` (unless ``State._debug`` is set).
+
+        :return: Whether or not the calling State object is an extension of \
+        ``other``.
+        :rtype: ``bool``
+        """
+
+        if State._debug:
+            State._check_extension(self, other)
+
+        # the ValueIndex objects are only needed (and so only fetched) once
+        # some ao-pair has different ValueSets in the two States
+        indexes = None
+        other_ascriptions = other._ascriptions
 
         # for each attribute-object pair
-        for ao_pair in ao_pairs:
+        for ao_pair, valueset in self._ascriptions.iteritems():
+            other_valueset = other_ascriptions[ao_pair]
+            # ValueSets are shared between copies of States
+            if valueset is other_valueset:
+                continue
+            if indexes is None:
+                indexes = self._get_value_indexes()
             # if the ValueSet of the ao-pair in this State is not a subset of
             # the corresponding ValueSet of the ao-pair in other State
-            if not self._ascriptions[ao_pair] <= other._ascriptions[ao_pair]:
+            if not State._is_subset(indexes[ao_pair[0]], valueset,
+                                    other_valueset):
                 return False
 
         return True
@@ -133,12 +178,33 @@ class State(object):
 
         return not self.__eq__(other)
 
+    def _key(self):
+        """
+        Private key function for hashing.
+
+        :return: ``frozenset`` of (attribute-object pair, FrozenValueSet) \
+        2-tuples.
+        :rtype: ``frozenset``
+        """
+
+        return frozenset(self._ascriptions.iteritems())
+
+    def __hash__(self):
+        """
+        Hash implementation for set functionality of State objects. A State
+        object must not be changed while it is in a ``set`` or ``dict``.
+        """
+
+        return hash(self._key())
+
     def __deepcopy__(self, memo):
         """
         Deepcopy a State object via the ``copy.deepcopy`` method.
+        The copy shares the AttributeSystem object and ValueSet objects of the
+        calling State object until either of them changes.
         """
 
-        return State(self._attribute_system, self._ascriptions)
+        return self._copy()
 
     def __getitem__(self, key):
         """
@@ -197,6 +263,59 @@ class State(object):
         """Return a string representation of the State object."""
         return self.__str__()
 
+    def _get_value_indexes(self):
+        """
+        Return the ValueIndex object of the ValueSet object of each Attribute
+        object in the calling State object's AttributeSystem, keyed by label
+        (``None`` where the ValueSet is not finite and discrete).
+
+        :return: The ValueIndex objects keyed by Attribute label.
+        :rtype: ``dict``
+        """
+
+        attributes = self._attribute_system._attribute_structure._attributes
+        return dict([(attribute._label, ValueIndex.get(attribute._value_set))
+                     for attribute in attributes])
+
+    @staticmethod
+    def _is_subset(index, valueset, other_valueset):
+        """
+        Determine if the FrozenValueSet object in the ``valueset`` parameter
+        is a subset of the FrozenValueSet object in the ``other_valueset``
+        parameter, using their bitmasks in the ValueIndex object in the
+        ``index`` parameter if both have one.
+
+        :param index: The ValueIndex object of the Attribute the ValueSets \
+        come from or ``None``.
+        :type  index: ValueIndex|None
+
+        :return: Whether ``valueset`` is a subset of ``other_valueset``.
+        :rtype: ``bool``
+        """
+
+        if index is not None:
+            mask = index.get_mask(valueset)
+            other_mask = index.get_mask(other_valueset)
+            if mask is not None and other_mask is not None:
+                return not mask & ~other_mask
+        return valueset <= other_valueset
+
+    def _copy(self):
+        """
+        Return a copy of the calling State object without validation, sharing
+        the calling State object's AttributeSystem object and ValueSet objects
+        (copy-on-write).
+
+        :return: A copy of the calling State object.
+        :rtype: State
+        """
+
+        state = State.__new__(State)
+        state._attribute_system = self._attribute_system
+        state._ascriptions = dict(self._ascriptions)
+        state._is_State = True
+        return state
+
     def add_object(self, obj, ascriptions=None):
         """
         Add an object :math:`s^{\prime}` to the calling State object's
@@ -245,21 +364,28 @@ class State(object):
                     raise ValueError(
                         "Invalid attribute-object pair: " + str(ao_pair))
 
-            self._attribute_system._objects = sorted(
-                self._attribute_system._objects + [obj])
-            # Extend ascriptions with new object
-            for Ai in attributes:
-                self._ascriptions[(Ai._label, obj)] = deepcopy(Ai._value_set)
+            self._add_object(obj, attributes)
 
             # Set any optional ascriptions
             for ao_pair, valueset in ascriptions.iteritems():
                 self.set_ascription(ao_pair, valueset)
         else:
-            self._attribute_system._objects = sorted(
-                self._attribute_system._objects + [obj])
-            # Extend ascriptions with new object
-            for Ai in attributes:
-                self._ascriptions[(Ai._label, obj)] = deepcopy(Ai._value_set)
+            self._add_object(obj, attributes)
+
+    def _add_object(self, obj, attributes):
+        """
+        Add an object to a copy of the calling State object's AttributeSystem
+        object, as the AttributeSystem object may be shared, and extend the
+        ascriptions with the new object.
+        """
+
+        self._attribute_system = copy(self._attribute_system)
+        self._attribute_system._objects = sorted(
+            self._attribute_system._objects + [obj])
+        self._attribute_system._fingerprint = None
+        # Extend ascriptions with new object
+        for Ai in attributes:
+            self._ascriptions[(Ai._label, obj)] = Ai._value_set
 
     def get_alternate_extensions(self, *states):
         """
@@ -285,13 +411,42 @@ class State(object):
         proper extensions of the calling State object.
         """
 
-        def get_properly_spanning_lists():
+        return list(self._generate_alternate_extensions(*states))
+
+    def _generate_alternate_extensions(self, *states):
+        """
+        Return a generator for the alternate extensions of the calling State
+        object with respect to State objects
+        :math:`\sigma_{1}, \ldots, \sigma_{m}` provided by optional
+        positional arguments of ``states`` parameter, in the same order as
+        ``get_alternate_extensions``; the arguments are checked when the
+        function is called.
+
+        :param states: The states {:math:`\sigma`\ :sub:`1`, :math:`\ldots, \
+        \sigma`\ :sub:`m`} to use for the derivation of the alternate \
+        extensions of the calling State object.
+        :type  states: State
+
+        :return: A generator for **AE**\ :math:`(\{\sigma_{1}, \
+        \ldots, \sigma_{m}\}, \sigma^{\prime})`.
+        :rtype: ``generator``
+
+        :raises TypeError: all optional positional arguments must be State \
+        objects.
+        :raises ValueError: at least one State object must be provided in \
+        optional positional arguments and all provided State objects must be \
+        proper extensions of the calling State object.
+        """
+
+        def generate_properly_spanning_lists():
             """
-            Return those lists that properly span s1,...,sm
+            Generate those lists that properly span s1,...,sm
             w.r.t. this State.
 
             This function is based on the algorithm found in the paper;
-            as such, it follows its steps extremely closely.
+            rather than filtering every spanning list, the spanning lists are
+            built one state at a time, so a list is abandoned as soon as one
+            of its homogeneous sublists spans the ascription in this State.
             """
 
             # create filtered table of all proper subset ascriptions among all
@@ -304,51 +459,42 @@ class State(object):
                         row.append([ao_pair, value_set])
                 table.append(row)
 
-            # make all possible spanning lists from filtered table
-            # this is step 2 of the algorithm outlined in the paper.
-            from itertools import product, combinations
-            spanning_lists = [list(tup) for tup in list(product(*table))]
-
-            # we now proceed to step 3 of the algorithm outlined in the paper
-            # by filtering out the non-properly spanning lists.
-            for sl_index, spanning_list in reversed(
-                    list(enumerate(spanning_lists))):
-
-                non_spanning_flag = False
-                # try every sublist with length greater than 1 as 1 is already
-                # ensured not to be properly spanning by virtue of step 2.
-                for i in range(2, len(spanning_list) + 1):
-                    sublists = list(combinations(spanning_list, i))
-
-                    for sublist in sublists:
-                        # check if sublist labels are homogeneous, i.e.,
-                        # if a.o. pairs are all equal in sublist
-                        ao_pairs = [ao_pair for ao_pair, valueset in sublist]
-                        if ao_pairs.count(ao_pairs[0]) == len(ao_pairs):
-
-                            # sublist is homogeneous so merge the value sets
-                            # of the a.o. pairs
-                            value_sets = [
-                                valueset for ao_pair, valueset in sublist]
-                            # flatten value sets into signle merged list
-                            merged_value_set = [item for sublist in value_sets
-                                                for item in sublist]
-
-                            # determine if ascription in self is equal to union
-                            # of merged ascriptions in sublist
-                            if self[ao_pairs[0]] == ValueSet(merged_value_set):
-                                non_spanning_flag = True
-                                break
-
-                    if non_spanning_flag:
-                        break
-                # if non-spannig flag was tripped, erase current spanning list
-                # from the set of spanning lists; we're going in reverse so we
-                # can do this in one pass
-                if non_spanning_flag:
-                    del spanning_lists[sl_index]
-
-            return spanning_lists
+            # steps 2 and 3 of the algorithm outlined in the paper: pick an
+            # entry of each row in turn (in the order of the product of the
+            # rows), keeping the merged value sets of each a.o. pair picked
+            spanning_list = []
+            merged = {}
+
+            def extend(row_index):
+                """Extend spanning_list with each entry of the next row."""
+                if row_index == len(table):
+                    yield list(spanning_list)
+                    return
+
+                for entry in table[row_index]:
+                    ao_pair, value_set = entry
+                    previous = merged.get(ao_pair)
+                    if previous is None:
+                        # a single proper subset never spans the ascription
+                        merged_values = list(value_set)
+                    else:
+                        merged_values = previous + list(value_set)
+                        # the homogeneous sublist of this a.o. pair spans the
+                        # ascription in this State, as will every larger one
+                        if self[ao_pair] == ValueSet(merged_values):
+                            continue
+
+                    merged[ao_pair] = merged_values
+                    spanning_list.append(entry)
+                    for properly_spanning_list in extend(row_index + 1):
+                        yield properly_spanning_list
+                    spanning_list.pop()
+                    if previous is None:
+                        del merged[ao_pair]
+                    else:
+                        merged[ao_pair] = previous
+
+            return extend(0)
 
         def make_ascriptions(proper_spanning_list):
             """
@@ -380,13 +526,13 @@ class State(object):
 
             # First make a new copy of this State and create the ascriptions
             # available from the properly spanning list
-            ae = State(self._attribute_system, self._ascriptions)
+            ae = State._copy(self)
             ascriptions = make_ascriptions(proper_spanning_list)
             # for each ascription, complement it w.r.t. the original ascription
             # and replace the original ascription with the complement
             for (ao_pair, valueset) in ascriptions.items():
                 complement_valueset = self._ascriptions[ao_pair] - valueset
-                ae.set_ascription(ao_pair, complement_valueset)
+                ae._set_ascription(ao_pair, complement_valueset)
 
             return ae
 
@@ -407,14 +553,10 @@ class State(object):
                     "all states provided must be proper "
                     "extensions of this State object.")
 
-        proper_spanning_lists = get_properly_spanning_lists()
-
-        alternate_extensions = []
-        for psl in proper_spanning_lists:
-            ae = make_alternate_extension(psl)
-            alternate_extensions.append(ae)
-
-        return alternate_extensions
+        # the alternate extensions are made lazily, one per properly
+        # spanning list
+        return (make_alternate_extension(psl)
+                for psl in generate_properly_spanning_lists())
 
     def get_worlds(self):
         """
@@ -426,38 +568,115 @@ class State(object):
         :rtype: ``list``
         """
 
-        from itertools import product
+        # create each possible world from this State and return them in a
+        # list.
+        return [world.get_state() for world in self.generate_worlds()]
 
-        # get a copy of the ascriptions
-        ascription_list = [item for item in self._ascriptions.items()]
-        new_valuesets = []
-        labels = []
-        # for each ascription
-        for (label, valueset) in ascription_list:
-            # discretize any Intervals within the valueset
-            new_valueset = []
-            for value in valueset:
-                if hasattr(value, "_is_Interval"):
-                    new_valueset.extend(value.discretize())
-                else:
-                    new_valueset.append(value)
-            # set ascription to discretized version
-            new_valuesets.append(new_valueset)
-            labels.append(label)
+    def generate_worlds(self):
+        """
+        Return a generator for the generation of all possible worlds
+        :math:`(w;\widehat{\\rho})` derivable from the calling State object
+        as WorldView objects, in the same order as ``get_worlds``\.
 
-        combos = list(product(*new_valuesets))
+        The worlds are enumerated by a mixed-radix counter over the
+        discretized ascriptions of the calling State object, so memory use
+        does not depend on the number of worlds.
 
-        worlds = []
+        :return: A generator for the generation of all possible worlds \
+        :math:`(w;\widehat{\\rho})` derivable from this State object.
+        :rtype: ``generator``
+        """
 
-        # create each possible world from this NamedState and
-        # return them in a list.
-        for values in combos:
-            world = State(self._attribute_system)
-            for i, label in enumerate(labels):
-                world.set_ascription(label, [values[i]])
-            worlds.append(world)
+        from world_view import WorldView
 
-        return worlds
+        labels, valuesets = self._discretize_ascriptions()
+        if not all(valuesets):
+            return
+
+        digits = [0] * len(valuesets)
+        while True:
+            yield WorldView(self, labels, valuesets, tuple(digits))
+
+            # increment the counter; the last digit varies fastest
+            for position in reversed(xrange(len(digits))):
+                digits[position] += 1
+                if digits[position] < len(valuesets[position]):
+                    break
+                digits[position] = 0
+            else:
+                return
+
+    def get_world(self, index):
+        """
+        Return the world :math:`(w;\widehat{\\rho})` at the position given by
+        the ``index`` parameter in the enumeration of ``generate_worlds`` as a
+        WorldView object, without enumerating the worlds before it.
+
+        :param index: The index of the world.
+        :type  index: ``int`` | ``long``
+
+        :return: The world at position ``index``\.
+        :rtype: WorldView
+
+        :raises TypeError: ``index`` parameter must be an ``int`` or \
+        ``long``\.
+        :raises IndexError: ``index`` parameter must be in \
+        :math:`\{0, \ldots, n-1\}` where :math:`n` is the number of worlds \
+        derivable from the calling State object.
+        """
+
+        from world_view import WorldView
+
+        if type(index) != int and type(index) != long:
+            raise TypeError("index must be of type int or long")
+
+        labels, valuesets = self._discretize_ascriptions()
+        count = 1
+        for values in valuesets:
+            count *= len(values)
+        if not 0 <= index < count:
+            raise IndexError("Invalid index: " + str(index))
+
+        # peel off the digits of the index, least significant (last) first
+        digits = []
+        for values in reversed(valuesets):
+            index, digit = divmod(index, len(values))
+            digits.append(digit)
+
+        return WorldView(self, labels, valuesets, tuple(reversed(digits)))
+
+    def get_world_count(self):
+        """
+        Return the number of worlds :math:`(w;\widehat{\\rho})` derivable
+        from the calling State object without enumerating them.
+
+        :return: The number of worlds derivable from this State object.
+        :rtype: ``int`` | ``long``
+        """
+
+        count = 1
+        for values in self._discretize_ascriptions()[1]:
+            count *= len(values)
+        return count
+
+    def _discretize_ascriptions(self):
+        """
+        Return the attribute-object pairs of the calling State object and the
+        discretized values of their ascriptions (i.e., the digits and radices
+        of the worlds' mixed-radix counter).
+
+        :return: A ``list`` of attribute-object pairs and a ``list`` of the \
+        ``list``\s of values of their ascriptions.
+        :rtype: ``tuple``
+        """
+
+        labels = []
+        valuesets = []
+        # for each ascription, discretize any Intervals within the valueset
+        for (label, valueset) in self._ascriptions.items():
+            labels.append(label)
+            valuesets.append(valueset.discretize())
+        return labels, valuesets
 
     def is_alternate_extension(self, s_prime, *states):
         """
@@ -488,8 +707,9 @@ class State(object):
             raise TypeError(
                 "s_prime parameter must be of type State.")
 
-        # generate all alternate extensions of this State
-        alternate_extensions = self.get_alternate_extensions(*states)
+        # generate the alternate extensions of this State until s_prime is
+        # found
+        alternate_extensions = self._generate_alternate_extensions(*states)
 
         # check if s_prime is within list of all alternate extensions
         for alternate_extension in alternate_extensions:
@@ -601,10 +821,9 @@ class State(object):
 
         new_values = None
         # Enforce new_value_set as a list, set, or ValueSet
-        if isinstance(new_valueset, list) or isinstance(new_valueset, set):
-            new_values = ValueSet(new_valueset)
-        elif hasattr(new_valueset, "_is_ValueSet"):
-            new_values = deepcopy(new_valueset)
+        if isinstance(new_valueset, list) or isinstance(new_valueset, set) \
+                or hasattr(new_valueset, "_is_ValueSet"):
+            new_values = FrozenValueSet(new_valueset)
         else:
             raise TypeError(
                 "Ascription values must be of type list, set, or ValueSet")
@@ -614,7 +833,7 @@ class State(object):
             raise ValueError("Ascriptions must be non-empty.")
 
         # check if ao pair is a valid key for ascriptions
-        if ao_pair in self._ascriptions.keys():
+        if ao_pair in self._ascriptions:
             label, obj = ao_pair
             # Get ValueSet of Attribute with provided label in ao_pair
             attribute = self._attribute_system._attribute_structure[label]
@@ -622,7 +841,8 @@ class State(object):
 
             # If new value_set provided is a subset of the possible value_set
             # of the Attribute
-            if new_values <= possible_values:
+            if State._is_subset(ValueIndex.get(possible_values), new_values,
+                                possible_values):
                 self._ascriptions[ao_pair] = new_values
             else:
                 raise ValueError(
@@ -632,6 +852,25 @@ class State(object):
             raise KeyError(
                 str(ao_pair) + ' not in ascriptions')
 
+    def _set_ascription(self, ao_pair, new_valueset):
+        """
+        Set an ascription of an object as ``set_ascription`` does, without
+        validating the parameters (unless ``State._debug`` is set); that is,
+        ``ao_pair`` must be an attribute-object pair of the calling State
+        object and ``new_valueset`` a non-empty subset of the ValueSet object
+        of its Attribute object.
+
+        :param ao_pair: The attribute-object pair :math:`\delta_{i}(s_{j})`.
+        :type  ao_pair: ``tuple``
+        :param new_valueset: The new ValueSet object to assign to ``ao_pair``.
+        :type  new_valueset: ValueSet
+        """
+
+        if State._debug:
+            return self.set_ascription(ao_pair, new_valueset)
+
+        self._ascriptions[ao_pair] = FrozenValueSet(new_valueset)
+
     @staticmethod
     def join(s1, s2):
         """
@@ -655,7 +894,8 @@ class State(object):
 
         ao_pairs = s1._ascriptions.keys()
         join_ascriptions = {
-            ao_pair: s1[ao_pair] + s2[ao_pair] for ao_pair in ao_pairs}
+            ao_pair: FrozenValueSet(s1[ao_pair] + s2[ao_pair])
+            for ao_pair in ao_pairs}
 
         join_state = State(s1._attribute_system)
 
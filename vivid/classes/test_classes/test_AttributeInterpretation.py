@@ -336,6 +336,45 @@ def test___iter__():
     assert ai._table == [entry for entry in iter(ai)]
 
 
+def test__index():
+    """Test the index of the interpretation table by RelationSymbol name."""
+    a = Attribute('hour', ['0,...,23'])
+    a2 = Attribute('minute', ['0,...,59'])
+    r_ahead = Relation('R1(h1,m1,h2,m2) <=> h1 > h2 or (h1 = h2 and m1 > m2)',
+                       ['hour', 'minute', 'hour', 'minute'], 1)
+    r_pm = Relation('R3(h1) <=> h1 > 12', ['hour'], 3)
+    attribute_structure = AttributeStructure(a, a2, r_ahead, r_pm)
+
+    ahead_rs = RelationSymbol('Ahead', 4)
+    pm_rs = RelationSymbol('PM', 2)
+    vocabulary = Vocabulary(['C1', 'C2'], [ahead_rs, pm_rs], [])
+
+    profiles = [
+        [ahead_rs, ('hour', 1), ('minute', 1), ('hour', 2), ('minute', 2)],
+        [pm_rs, ('hour', 2)]]
+
+    ai = AttributeInterpretation(
+        vocabulary, attribute_structure, {ahead_rs: 1, pm_rs: 3}, profiles)
+
+    assert sorted(ai._index.keys()) == ['Ahead', 'PM']
+
+    subscript, relation, profile, max_j = ai._index['Ahead']
+    assert subscript == 1
+    assert relation == r_ahead
+    assert relation is ai._attribute_structure._relations[1]
+    assert profile == (('hour', 0), ('minute', 0), ('hour', 1), ('minute', 1))
+    assert max_j == 2
+
+    subscript, relation, profile, max_j = ai._index['PM']
+    assert subscript == 3
+    assert relation == r_pm
+    assert profile == (('hour', 1),)
+    assert max_j == 2
+
+    from copy import deepcopy
+    assert deepcopy(ai)._index['PM'][2] == profile
+
+
 def test___str__():
     """Test str(AttributeInterpretation)."""
     a = Attribute('hour', ['0,...,23'])
@@ -349,6 +349,45 @@ def test___deepcopy__():
     assert astr_copy is not astr_a_b_R1_R2
 
 
+def test__get_fingerprint():
+    """Test fingerprint of AttributeStructure."""
+    a1 = Attribute("a1", [1, 2])
+    a1_prime = Attribute("a1", [1, 3])
+    a2 = Attribute("a2", [])
+    R1 = Relation("R1(a) <=> ", ["a1"], 1)
+    R1_prime = Relation("R1(a) <=> a", ["a1"], 1)
+    R2 = Relation("R2(a) <=> ", ["a1"], 2)
+
+    astr = AttributeStructure(a1, a2, R1, R2)
+    astr_copy = AttributeStructure(R2, R1, a2, a1)
+
+    assert astr._fingerprint is None
+    assert astr._get_fingerprint() == astr_copy._get_fingerprint()
+    assert astr._fingerprint is not None
+
+    # equal fingerprints fall back to the full comparison
+    assert astr == astr_copy
+    assert astr != AttributeStructure(a1_prime, a2, R1, R2)
+    assert astr != AttributeStructure(a1, a2, R1_prime, R2)
+    assert astr != AttributeStructure(a1, a2, R1)
+
+    # structures built by + have their own fingerprint
+    astr_sum = AttributeStructure(a1, a2, R1) + R2
+    assert astr_sum._get_fingerprint() == astr._get_fingerprint()
+    assert astr_sum == astr
+
+    # Relations changed in place through indexing are taken into account
+    t1 = AttributeStructure(a1, Relation("R1(a) <=> a > 1", ["a1"], 1))
+    t2 = AttributeStructure(a1, Relation("R1(a) <=> a > 2", ["a1"], 1))
+    assert t1 != t2
+    t2['R1'].set_definition("R1(a) <=> a > 1")
+    assert t1 == t2
+    t2[1].set_DR(["a1"])
+    assert t1 == t2
+    t1['R1'].set_definition("R1(b) <=> b > 1")
+    assert t1 != t2
+
+
 def test_get_labels():
     """Test get_labels function."""
     a = Attribute("a", [])
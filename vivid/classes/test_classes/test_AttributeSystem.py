@@ -434,6 +434,38 @@ def test___deepcopy__():
     assert asys_copy._objects is not asys_a_b_R1_R2_o._objects
 
 
+def test__get_fingerprint():
+    """Test fingerprint of AttributeSystem."""
+    from copy import copy
+    a = Attribute("a", [1, 2])
+    b = Attribute("b", [])
+    R1 = Relation("R1(a) <=> ", ["a"], 1)
+
+    asys = AttributeSystem(AttributeStructure(a, b, R1), ['o1', 'o2'])
+    asys_copy = AttributeSystem(AttributeStructure(R1, b, a), ['o2', 'o1'])
+
+    assert asys._fingerprint is None
+    assert asys._get_fingerprint() == asys_copy._get_fingerprint()
+    assert asys._fingerprint is not None
+    assert asys == asys_copy
+
+    assert asys != AttributeSystem(AttributeStructure(a, b, R1), ['o1'])
+    assert asys != AttributeSystem(AttributeStructure(a, b), ['o1', 'o2'])
+
+    # rebinding the objects requires the fingerprint to be reset
+    asys_more = copy(asys)
+    asys_more._objects = asys_more._objects + ['o3']
+    asys_more._fingerprint = None
+    assert asys_more != asys
+    assert asys == asys_copy
+
+    # Relations changed in place through indexing are taken into account
+    asys._attribute_structure['R1'].set_definition("R1(a) <=> a > 1")
+    assert asys != asys_copy
+    asys_copy._attribute_structure['R1'].set_definition("R1(a) <=> a > 1")
+    assert asys == asys_copy
+
+
 def test_get_power():
     """Test get_power(); power = n * |A|."""
     a = Attribute("a", [])
@@ -717,3 +717,189 @@ def test_entails_named_state():
 
     standard_test()
     point_test()
+
+
+def test__find_countermodel():
+    """Test _find_countermodel() function for Context."""
+    def brute_force_entails(context, formula, attribute_interpretation):
+        """Check entailment of formula by checking every world."""
+        for world in context._named_state.get_worlds():
+            for X in world._generate_variable_assignments():
+                satisfies_context = world.satisfies_context(
+                    context, X, attribute_interpretation)
+                satisfies_formula = world.satisfies_formula(
+                    formula, X, attribute_interpretation)
+                if satisfies_context and not satisfies_formula:
+                    return False
+        return True
+
+    hour = Attribute('hour', [Interval(0, 23)])
+    minute = Attribute('minute', [Interval(0, 59)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    r_am = Relation('R2(h1) <=> h1 <= 11', ['hour'], 2)
+    r_ahead = Relation(
+        'R3(h1,m1,hhh2,mm2) <=> h1 > hhh2 or (h1 = hhh2 and m1 > mm2)',
+        ['hour', 'minute', 'hour', 'minute'], 3)
+    attribute_structure = AttributeStructure(
+        hour, minute, r_ahead, r_pm, r_am)
+
+    rs_ahead = RelationSymbol('Ahead', 4)
+    rs_pm = RelationSymbol('PM', 1)
+    rs_am = RelationSymbol('AM', 1)
+    vocabulary = Vocabulary(['C1'], [rs_ahead, rs_pm, rs_am], ['V1'])
+
+    objects = ['s1', 's2', 's3']
+    attribute_system = AttributeSystem(attribute_structure, objects)
+    p = ConstantAssignment(vocabulary, attribute_system, {})
+
+    profiles = [
+        [rs_pm, ('hour', 1)],
+        [rs_am, ('hour', 1)],
+        [rs_ahead, ('hour', 1), ('minute', 1), ('hour', 2), ('minute', 2)]]
+
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure,
+        {rs_pm: 1, rs_am: 2, rs_ahead: 3}, profiles)
+
+    named_state = NamedState(attribute_system, p, {
+                             ("hour", "s1"): [Interval(10, 13)],
+                             ("hour", "s2"): [Interval(11, 12)],
+                             ("hour", "s3"): [9, 14],
+                             ("minute", "s1"): [0, 30],
+                             ("minute", "s2"): [15],
+                             ("minute", "s3"): [Interval(0, 1)]})
+
+    formulae = [Formula(vocabulary, 'PM', 'C1'),
+                Formula(vocabulary, 'AM', 'C1'),
+                Formula(vocabulary, 'PM', 'V1'),
+                Formula(vocabulary, 'AM', 'V1'),
+                Formula(vocabulary, 'Ahead', 'C1', 'V1'),
+                Formula(vocabulary, 'Ahead', 'V1', 'C1')]
+
+    # the search agrees with checking every world and variable assignment
+    for assumption in formulae:
+        context = Context(AssumptionBase(assumption), named_state)
+        for formula in formulae:
+            assert context.entails_formula(
+                formula, attribute_interpretation) == brute_force_entails(
+                context, formula, attribute_interpretation)
+
+    with pytest.raises(TypeError) as excinfo:
+        context._find_countermodel(None, formula=formulae[0])
+
+    # no assumption constrains the search, so only the target is checked
+    assert not Context._search_constraints(
+        [], [('hour', 's1')], {('hour', 's1'): [1, 2]}, False,
+        {('hour', 's1'): set([])})
+    assert Context._search_constraints(
+        [], [('hour', 's1')], {('hour', 's1'): [1, 2]}, False,
+        {('hour', 's1'): set([1])})
+    assert Context._search_constraints(
+        [(r_pm, [('hour', 's1')], True)], [('hour', 's1')],
+        {('hour', 's1'): [11, 12]}, False, {('hour', 's1'): set([1])})
+    assert not Context._search_constraints(
+        [(r_pm, [('hour', 's1')], True)], [('hour', 's1')],
+        {('hour', 's1'): [11, 12]}, False, {('hour', 's1'): set([0])})
+
+
+def test__get_components():
+    """Test _get_components() function for Context."""
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    r_ahead = Relation('R2(h1,h2) <=> h1 > h2', ['hour', 'hour'], 2)
+    s1, s2, s3, s4 = [('hour', s) for s in ['s1', 's2', 's3', 's4']]
+
+    c1 = (r_ahead, [s1, s2], True)
+    c2 = (r_pm, [s3], True)
+    c3 = (r_ahead, [s2, s4], False)
+    c4 = (r_pm, [s4], False)
+    c5 = (r_pm, [s1], True)
+
+    assert Context._get_components([]) == []
+    assert Context._get_components([c1, c2, c3, c4, c5]) == [
+        [c1, c3, c4, c5], [c2]]
+    assert Context._get_components([c2, c4, c1]) == [[c2], [c4], [c1]]
+    assert Context._get_components([c2, c4, c1, c3]) == [
+        [c2], [c4, c1, c3]]
+
+
+def test__search_constraints():
+    """Test _search_constraints() function for Context."""
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    r_ahead = Relation('R2(h1,h2) <=> h1 > h2', ['hour', 'hour'], 2)
+    labels = [('hour', 's' + str(i)) for i in range(40)]
+    values = dict([(label, range(24)) for label in labels])
+    no_bad_values = dict([(label, set([])) for label in labels])
+
+    # 20 independent pairs of objects, each satisfiable in 276 ways; the
+    # last constraint can't hold, which the product of the pairs would
+    # only find after all 276 ** 19 bindings of the others
+    constraints = [(r_ahead, [labels[i], labels[i + 1]], True)
+                   for i in range(0, 40, 2)]
+    assert Context._search_constraints(
+        constraints, labels, values, True, no_bad_values)
+    constraints.append((r_ahead, [labels[38], labels[39]], False))
+    assert not Context._search_constraints(
+        constraints, labels, values, True, no_bad_values)
+
+    # some component must take a bad value
+    constraints = constraints[:-1]
+    bad_values = dict(no_bad_values)
+    assert not Context._search_constraints(
+        constraints, labels, values, False, bad_values)
+    bad_values[labels[39]] = set([23])
+    assert not Context._search_constraints(
+        constraints, labels, values, False, bad_values)
+    bad_values[labels[39]] = set([22])
+    assert Context._search_constraints(
+        constraints, labels, values, False, bad_values)
+
+    # unconstrained pairs with bad values are never bound
+    constraints.append((r_pm, [labels[0]], False))
+    values[('hour', 's40')] = [0]
+    no_bad_values[('hour', 's40')] = set([])
+    assert not Context._search_constraints(
+        constraints, labels + [('hour', 's40')], values, False,
+        no_bad_values)
+    no_bad_values[('hour', 's40')] = set([0])
+    assert Context._search_constraints(
+        constraints, labels + [('hour', 's40')], values, False,
+        no_bad_values)
+
+
+def test__find_countermodel_symmetry():
+    """Test symmetry reduction in _find_countermodel() for Context."""
+    def brute_force_entails(context, named_state):
+        """Check entailment of named_state by checking every world."""
+        for world in context._named_state.get_worlds():
+            for X in world._generate_variable_assignments():
+                if world.satisfies_context(
+                        context, X, attribute_interpretation) and \
+                        not world.satisfies_named_state(named_state):
+                    return False
+        return True
+
+    hour = Attribute('hour', [Interval(0, 23)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    attribute_structure = AttributeStructure(hour, r_pm)
+    rs_pm = RelationSymbol('PM', 1)
+    vocabulary = Vocabulary(['C1', 'C2'], [rs_pm], [])
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, {rs_pm: 1}, [[rs_pm, ('hour', 1)]])
+
+    objects = ['s1', 's2', 's3', 's4']
+    attribute_system = AttributeSystem(attribute_structure, objects)
+    p = ConstantAssignment(vocabulary, attribute_system, {})
+    ascriptions = dict([(('hour', s), [11, 12]) for s in objects])
+    named_state = NamedState(attribute_system, p, ascriptions)
+    context = Context(
+        AssumptionBase(Formula(vocabulary, 'PM', 'C1')), named_state)
+
+    # the named states distinguish objects the context can't
+    p_s3 = ConstantAssignment(vocabulary, attribute_system, {'C1': 's3'})
+    for target in [NamedState(attribute_system, p, {('hour', 's3'): [12]}),
+                   NamedState(attribute_system, p, {('hour', 's1'): [12]}),
+                   NamedState(attribute_system, p_s3, ascriptions),
+                   NamedState(attribute_system, p, ascriptions)]:
+        assert context.entails_named_state(
+            target, attribute_interpretation) == brute_force_entails(
+            context, target)
@@ -302,6 +302,31 @@ def test_assign_truth_value():
     test_ValueError(bad_t_f, attribute_interpretation, named_state, VA)
     assert f.assign_truth_value(attribute_interpretation, named_state, VA)
 
+    # Test that only the valuations of the profile's ao-pairs are evaluated
+    # (at most once each, as boxes of them may be decided by the interval
+    # evaluator) no matter how many worlds the NamedState has
+    wide_named_state = NamedState(attribute_system, p, {
+                                  ('hour', 's1'): [13, 14],
+                                  ('minute', 's1'): [Interval(0, 59)],
+                                  ('minute', 's2'): [Interval(0, 59)]})
+    relation = wide_named_state._attribute_system._attribute_structure[1]
+    evaluator = relation._evaluator
+    calls = []
+
+    def counting_evaluator(*values):
+        calls.append(values)
+        return evaluator(*values)
+
+    relation._evaluator = counting_evaluator
+    f_pm = Formula(vocabulary, 'PM', 'C1')
+    assert f_pm.assign_truth_value(
+        attribute_interpretation, wide_named_state, VA) is True
+    assert len(calls) == len(set(calls))
+    assert set(calls) <= set([(13,), (14,)])
+    wide_named_state.set_ascription(('hour', 's1'), [9, 13])
+    assert f_pm.assign_truth_value(
+        attribute_interpretation, wide_named_state, VA) == "unknown"
+
     from vivid.classes.point import Point
     point = Attribute('point', [Point('x', 'x', 'x', 'x')])
     r_is_on = Relation('R1(h1, h2, h3) <=> is_on(h1, h2, h3)',
@@ -379,6 +404,272 @@ def test_assign_truth_value():
     assert f5.assign_truth_value(attribute_interpretation, named_state, VA)
 
 
+def test__assign_truth_value():
+    """Test _assign_truth_value() function for Formula."""
+    from vivid.classes.state import State
+
+    a = Attribute('hour', [Interval(0, 23)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    attribute_structure = AttributeStructure(a, r_pm)
+
+    pm_rs = RelationSymbol('PM', 1)
+    vocabulary = Vocabulary(['C1'], [pm_rs], [])
+    other_vocabulary = Vocabulary(['C1', 'C2'], [pm_rs], [])
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, {pm_rs: 1}, [[pm_rs, ('hour', 1)]])
+
+    attribute_system = AttributeSystem(attribute_structure, ['s1'])
+    p = ConstantAssignment(vocabulary, attribute_system, {'C1': 's1'})
+    VA = VariableAssignment(vocabulary, attribute_system, {}, dummy=True)
+    other_VA = VariableAssignment(
+        other_vocabulary, attribute_system, {}, dummy=True)
+    named_state = NamedState(attribute_system, p, {('hour', 's1'): [13]})
+
+    pm = Formula(vocabulary, 'PM', 'C1')
+    assert pm._assign_truth_value(attribute_interpretation, named_state, VA)
+    # the Vocabulary objects are not checked
+    assert pm._assign_truth_value(
+        attribute_interpretation, named_state, other_VA)
+
+    # unless in debug mode
+    State._debug = True
+    try:
+        assert pm._assign_truth_value(
+            attribute_interpretation, named_state, VA)
+        with pytest.raises(ValueError) as excinfo:
+            pm._assign_truth_value(
+                attribute_interpretation, named_state, other_VA)
+        with pytest.raises(TypeError) as excinfo:
+            pm._assign_truth_value(None, named_state, VA)
+    finally:
+        State._debug = False
+
+
+def test_truth_value_cache():
+    """Test the truth value cache of assign_truth_value() function."""
+    a = Attribute('hour', [Interval(0, 23)])
+    a2 = Attribute('minute', [Interval(0, 59)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    r_ahead = Relation(
+        'R3(h1,m1,hhh2,mm2) <=> h1 > hhh2 or (h1 = hhh2 and m1 > mm2)',
+        ['hour', 'minute', 'hour', 'minute'], 3)
+    attribute_structure = AttributeStructure(a, a2, r_ahead, r_pm)
+
+    pm_rs = RelationSymbol('PM', 1)
+    ahead_rs = RelationSymbol('Ahead', 4)
+    vocabulary = Vocabulary(['C1', 'C2'], [pm_rs, ahead_rs], [])
+
+    profiles = [
+        [pm_rs, ('hour', 1)],
+        [ahead_rs, ('hour', 1), ('minute', 1), ('hour', 2), ('minute', 2)]]
+    mapping = {pm_rs: 1, ahead_rs: 3}
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, mapping, profiles)
+
+    attribute_system = AttributeSystem(attribute_structure, ['s1', 's2'])
+    p = ConstantAssignment(
+        vocabulary, attribute_system, {'C1': 's1', 'C2': 's2'})
+    VA = VariableAssignment(vocabulary, attribute_system, {}, dummy=True)
+    named_state = NamedState(attribute_system, p, {
+                             ('hour', 's1'): [9, 13],
+                             ('minute', 's1'): [12],
+                             ('hour', 's2'): [9, 13],
+                             ('minute', 's2'): [12]})
+
+    pm = Formula(vocabulary, 'PM', 'C1')
+    ahead = Formula(vocabulary, 'Ahead', 'C1', 'C2')
+    ahead_self = Formula(vocabulary, 'Ahead', 'C1', 'C1')
+
+    Formula.clear_truth_value_cache()
+    assert Formula.get_truth_value_cache_info() == {
+        "hits": 0, "misses": 0, "evictions": 0, "size": 0}
+
+    assert pm.assign_truth_value(
+        attribute_interpretation, named_state, VA) == "unknown"
+    assert Formula.get_truth_value_cache_info() == {
+        "hits": 0, "misses": 1, "evictions": 0, "size": 1}
+
+    # ascriptions the profile does not read do not affect the lookup, nor
+    # does the object the profile reads them from
+    named_state.set_ascription(('minute', 's1'), [10, 11])
+    assert pm.assign_truth_value(
+        attribute_interpretation, named_state, VA) == "unknown"
+    pm_2 = Formula(vocabulary, 'PM', 'C2')
+    assert pm_2.assign_truth_value(
+        attribute_interpretation, named_state, VA) == "unknown"
+    assert Formula.get_truth_value_cache_info() == {
+        "hits": 2, "misses": 1, "evictions": 0, "size": 1}
+
+    named_state.set_ascription(('hour', 's1'), [13, 15])
+    assert pm.assign_truth_value(
+        attribute_interpretation, named_state, VA) is True
+    assert Formula.get_truth_value_cache_info()["misses"] == 2
+
+    # arguments sharing an ao_pair take the same value in every world, so
+    # they are not confused with distinct ao_pairs with equal ascriptions
+    named_state.set_ascription(('hour', 's1'), [9, 13])
+    named_state.set_ascription(('minute', 's1'), [12])
+    assert ahead.assign_truth_value(
+        attribute_interpretation, named_state, VA) == "unknown"
+    assert ahead_self.assign_truth_value(
+        attribute_interpretation, named_state, VA) is False
+
+    # the least recently used truth values are evicted
+    size = Formula._truth_value_cache_size
+    Formula.clear_truth_value_cache()
+    Formula._truth_value_cache_size = 2
+    try:
+        for hours in [[1], [2], [3], [1]]:
+            named_state.set_ascription(('hour', 's1'), hours)
+            assert pm.assign_truth_value(
+                attribute_interpretation, named_state, VA) is False
+        assert Formula.get_truth_value_cache_info() == {
+            "hits": 0, "misses": 4, "evictions": 2, "size": 2}
+        named_state.set_ascription(('hour', 's1'), [3])
+        pm.assign_truth_value(attribute_interpretation, named_state, VA)
+        assert Formula.get_truth_value_cache_info()["hits"] == 1
+    finally:
+        Formula._truth_value_cache_size = size
+        Formula.clear_truth_value_cache()
+
+def test__evaluate_profile():
+    """Test _evaluate_profile() function of Formula object."""
+    from vivid.classes.valueset import ValueSet
+    r_ahead = Relation(
+        'R3(h1,m1,hhh2,mm2) <=> h1 > hhh2 or (h1 = hhh2 and m1 > mm2)',
+        ['hour', 'minute', 'hour', 'minute'], 3)
+    profile = [('hour', 's1'), ('minute', 's1'),
+               ('hour', 's2'), ('minute', 's2')]
+    # evaluate valuations one at a time (see test__evaluate_boxes)
+    r_ahead._interval_evaluator = None
+
+    calls = []
+    evaluator = r_ahead._evaluator
+
+    def counting_evaluator(*values):
+        calls.append(values)
+        return evaluator(*values)
+    r_ahead._evaluator = counting_evaluator
+
+    # singleton ascriptions are evaluated once
+    ascriptions = {('hour', 's1'): ValueSet([9]),
+                   ('minute', 's1'): ValueSet([12]),
+                   ('hour', 's2'): ValueSet([9]),
+                   ('minute', 's2'): ValueSet([27])}
+    assert Formula._evaluate_profile(r_ahead, profile, ascriptions) is False
+    assert calls == [(9, 12, 9, 27)]
+
+    # a singleton Interval is discretized like any other Interval
+    del calls[:]
+    ascriptions[('hour', 's1')] = ValueSet([Interval(9, 10)])
+    assert Formula._evaluate_profile(
+        r_ahead, profile, ascriptions) == "unknown"
+    assert len(calls) == 2
+
+    del calls[:]
+    ascriptions[('hour', 's1')] = ValueSet([10, 11])
+    assert Formula._evaluate_profile(r_ahead, profile, ascriptions) is True
+    assert len(calls) == 2
+
+    # valuations are looked up in a TruthTable instead, if one is given
+    from vivid.classes.truth_table import TruthTable
+    r_later = Relation('R1(h1, h2) <=> h1 > h2', ['hour', 'hour'], 1)
+    attribute_structure = AttributeStructure(
+        Attribute('hour', [Interval(0, 23)]), r_later)
+    truth_table = TruthTable.get(r_later, attribute_structure)
+    r_later._evaluator = counting_evaluator
+    del calls[:]
+    assert Formula._evaluate_profile(
+        r_later, [('hour', 's1'), ('hour', 's2')], ascriptions,
+        truth_table) is True
+    assert Formula._evaluate_profile(
+        r_later, [('hour', 's2'), ('hour', 's1')], ascriptions,
+        truth_table) is False
+    assert calls == []
+
+def test__evaluate_boxes():
+    """Test _evaluate_boxes() function of Formula object."""
+    from itertools import product
+    from vivid.classes.valueset import ValueSet
+
+    def evaluate_valuations(relation, positions, valuesets):
+        """Evaluate every valuation with the Relation's evaluator."""
+        truth_values = set()
+        for valuation in product(*valuesets):
+            truth_values.add(bool(relation._evaluator(
+                *[valuation[position] for position in positions])))
+        if len(truth_values) > 1:
+            return "unknown"
+        return truth_values.pop()
+
+    relations = [
+        Relation('R1(a, b) <=> a > b', ['x', 'x'], 1),
+        Relation('R2(a, b) <=> a = b', ['x', 'x'], 2),
+        Relation('R3(a, b) <=> a * b >= 6 or a - b < -3', ['x', 'x'], 3),
+        Relation('R4(a, b) <=> 1 / (a - b) > 0.4', ['x', 'x'], 4),
+        Relation('R5(a, b) <=> !(a^2 <= b) and sin(a) < 0.5', ['x', 'x'], 5)]
+    # Intervals are given as they are and stand for their discretized values
+    valuesets = [ValueSet(values) for values in [
+        [0], [2, 3], [-3, -1, 0.5], [1.5, 2.0, 2.5, 3.0], [Interval(-5, 5)],
+        [Interval(-2.0, 6.0)], [Interval(-2.0, 2.5), 4],
+        [-7, Interval(0, 2), Interval(4.0, 5.5)]]]
+
+    for relation in relations:
+        for a, b in product(valuesets, repeat=2):
+            for positions in [[0, 1], [0, 0]]:
+                try:
+                    expected = evaluate_valuations(
+                        relation, positions, [a.discretize(), b.discretize()])
+                except ValueError:
+                    # boxes are not decided over unevaluatable valuations,
+                    # which are reached unless the result is unknown first
+                    try:
+                        truth_value = Formula._evaluate_boxes(
+                            relation, positions, [a._values, b._values])
+                    except ValueError:
+                        continue
+                    assert truth_value == "unknown"
+                    continue
+                assert Formula._evaluate_boxes(
+                    relation, positions, [a._values, b._values]) == expected
+
+    # wide ascriptions are decided without evaluating their valuations
+    relation = Relation('R6(a, b) <=> a < b + 1000', ['x', 'x'], 6)
+    calls = []
+    evaluator = relation._evaluator
+
+    def counting_evaluator(*values):
+        calls.append(values)
+        return evaluator(*values)
+    relation._evaluator = counting_evaluator
+
+    wide = ValueSet([Interval(0, 999)]).discretize()
+    assert Formula._evaluate_boxes(relation, [0, 1], [wide, wide]) is True
+    assert Formula._evaluate_boxes(
+        relation, [0, 1], [wide + [2000], wide]) == "unknown"
+    assert calls == []
+
+    # Intervals are only discretized once a box is split within them
+    discretizations = []
+    discretize = Interval.discretize
+
+    def counting_discretize(self, *args):
+        discretizations.append(self)
+        return discretize(self, *args)
+    Interval.discretize = counting_discretize
+    try:
+        fine = [Interval(0.0, 999.0)]
+        assert Formula._evaluate_boxes(relation, [0, 1], [fine, fine]) is True
+        assert Formula._evaluate_boxes(
+            relation, [0, 1], [fine + [Interval(5000.0, 5999.0)], fine]) == \
+            "unknown"
+        assert calls == [] and discretizations == []
+        assert Formula._evaluate_boxes(
+            relation, [0, 1], [[Interval(0.0, 2999.0)], fine]) == "unknown"
+        assert discretizations[0] == Interval(0.0, 2999.0)
+    finally:
+        Interval.discretize = discretize
+
 def test_get_basis():
     """Test get_basis function for Formula."""
     point = Attribute('point', [Point('x', 'x', 'x', 'x')])
@@ -0,0 +1,96 @@
+"""FrozenValueSet unit tests."""
+
+import pytest
+from vivid.classes.valueset import ValueSet
+from vivid.classes.frozen_valueset import FrozenValueSet
+from vivid.classes.interval import Interval
+from vivid.classes.point import Point
+
+
+def test___new__():
+    """Test FrozenValueSet constructor and interning."""
+    def test_TypeError(valueset):
+        """Test TypeError raising in FrozenValueSet constructor."""
+        with pytest.raises(TypeError) as excinfo:
+            FrozenValueSet(valueset)
+
+    test_TypeError(None)
+    test_TypeError(1)
+    test_TypeError(Interval(0, 10))
+
+    fvs = FrozenValueSet([3, 'a', Interval(5, 10), Point(1.0), Point(2.0)])
+    assert fvs._is_ValueSet
+    assert fvs._is_FrozenValueSet
+    assert fvs._values == ValueSet._parse(
+        [3, 'a', Interval(5, 10), Point(1.0), Point(2.0)])
+
+    # structurally equal values give the same object
+    assert FrozenValueSet([Point(2.0), Point(1.0), 'a', 3,
+                           Interval(5, 8), Interval(7, 10)]) is fvs
+    assert FrozenValueSet(ValueSet(['a', 3, Interval(5, 10),
+                                    Point(1.0), Point(2.0)])) is fvs
+    assert FrozenValueSet(fvs) is fvs
+    assert FrozenValueSet(set(['a', 'b'])) is FrozenValueSet(['b', 'a'])
+
+    # values of different types are kept apart
+    assert FrozenValueSet([1]) is not FrozenValueSet([1.0])
+    assert FrozenValueSet([1]) is not FrozenValueSet([True])
+
+
+def test___eq__():
+    """Test == operator."""
+    assert FrozenValueSet(['a', 'b']) == FrozenValueSet(['b', 'a'])
+    assert not FrozenValueSet(['a', 'b']) == FrozenValueSet(['a'])
+    assert FrozenValueSet(['a', 'b']) == ValueSet(['b', 'a'])
+    assert ValueSet(['b', 'a']) == FrozenValueSet(['a', 'b'])
+    assert FrozenValueSet(['a', 'b']) != FrozenValueSet(['a'])
+
+
+def test___le__():
+    """Test <, <=, >, >= operators for FrozenValueSet."""
+    fvs = FrozenValueSet([Interval(1, 10), 'a'])
+    assert fvs <= fvs
+    assert not fvs < fvs
+    assert FrozenValueSet([5, 'a']) < fvs
+    assert FrozenValueSet([5, 'a']) <= ValueSet([Interval(1, 10), 'a'])
+    assert not FrozenValueSet([11]) <= fvs
+    # ValueSet on the left; Python tries the FrozenValueSet's >= first
+    assert ValueSet([5, 'a']) <= fvs
+    assert ValueSet([5, 'a']) < fvs
+    assert not ValueSet([15]) <= FrozenValueSet([23])
+    assert not ValueSet([15]) < FrozenValueSet([23])
+    assert not ValueSet([Interval(1, 10), 'a']) < fvs
+    assert ValueSet([Interval(1, 10), 'a', 'b']) >= fvs
+    assert not ValueSet([1]) >= fvs
+
+
+def test___hash__():
+    """Test hash() for FrozenValueSet."""
+    assert hash(FrozenValueSet(['a', 'b'])) == hash(FrozenValueSet(['b', 'a']))
+    assert len(set([FrozenValueSet(['a', 'b']), FrozenValueSet(['b', 'a']),
+                    FrozenValueSet(['c'])])) == 2
+
+
+def test___setitem__():
+    """Test that FrozenValueSet objects cannot be changed."""
+    fvs = FrozenValueSet([1, 2, 3])
+    with pytest.raises(TypeError) as excinfo:
+        fvs[0] = 4
+    assert fvs == ValueSet([1, 2, 3])
+
+
+def test___add__():
+    """Test + and - operators for FrozenValueSet."""
+    fvs = FrozenValueSet([1, 2, 3])
+    union = fvs + [4]
+    assert union == ValueSet([1, 2, 3, 4])
+    assert fvs == ValueSet([1, 2, 3])
+    assert fvs - ValueSet([2]) == ValueSet([1, 3])
+
+
+def test___deepcopy__():
+    """Test copy.copy and copy.deepcopy for FrozenValueSet."""
+    from copy import copy, deepcopy
+    fvs = FrozenValueSet([1, 2, 3])
+    assert copy(fvs) is fvs
+    assert deepcopy(fvs) is fvs
@@ -337,3 +337,5 @@ def test_collapse_intervals():
         Interval(-10.0, 15.0), Interval(-100L, -99L), Interval(-10L, 15L)]
 
     assert Interval.collapse_intervals(intervals) == out
+    assert Interval.collapse_intervals([Interval(4, 6), Interval(1, 3)]) == \
+        [Interval(1, 3), Interval(4, 6)]
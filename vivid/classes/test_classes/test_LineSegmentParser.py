@@ -5,7 +5,10 @@ from vivid.classes.parsers.line_segment_parser import LineSegmentParser
 
 def test___init__():
     """Test PointParser constructor."""
-    assert hasattr(LineSegmentParser(), "_is_Parser")
+    parser = LineSegmentParser()
+    assert hasattr(parser, "_is_Parser")
+    assert parser._functions == frozenset(['meets'])
+    assert parser._types == ("_is_Point", "_is_LineSegment")
 
 
 def test___call__():
@@ -19,3 +22,31 @@ def test__eval():
     eval_str = "meets(P(2.5,2.5),L(P(0.0,0.0),P(5.0,5.0)),L(P(5.0,0.0),P(0.0,5.0)))"
     parser = LineSegmentParser()
     assert parser(eval_str)
+
+
+def test_compile():
+    """Test compile function."""
+    import pytest
+    from vivid.classes.point import Point
+    from vivid.classes.line_segment import LineSegment
+
+    def test_ValueError(expression, arguments):
+        """Test compile for ValueErrors with given params."""
+        with pytest.raises(ValueError) as excinfo:
+            LineSegmentParser().compile(expression, arguments)
+
+    parser = LineSegmentParser()
+    meets = parser.compile("meets(p, l1, l2)", ["p", "l1", "l2"])
+    assert meets(Point(2.5, 2.5),
+                 LineSegment(Point(0.0, 0.0), Point(5.0, 5.0)),
+                 LineSegment(Point(5.0, 0.0), Point(0.0, 5.0)))
+
+    meets = parser.compile(
+        "meets(P(2.5,2.5), L(P(0.0,0.0),P(5.0,5.0)), l2)", ["l2"])
+    assert meets(LineSegment(Point(5.0, 0.0), Point(0.0, 5.0)))
+
+    with pytest.raises(ValueError) as excinfo:
+        meets(1)
+
+    test_ValueError("not_a_function(p)", ["p"])
+    test_ValueError("meets(p, l1, l2)", ["p", "l1"])
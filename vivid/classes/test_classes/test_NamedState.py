@@ -56,8 +56,7 @@ def test___init__():
     test_ValueError(attribute_system, p_bad)
 
     s = NamedState(attribute_system, p)
-    assert s._attribute_system == attribute_system
-    assert s._attribute_system is not attribute_system
+    assert s._attribute_system is attribute_system
     assert s._p == p
     assert s._p is not p
     assert s._p._vocabulary is p._vocabulary
@@ -164,6 +163,24 @@ def test___ne__():
     assert not named_state != named_state_2
 
 
+def test___hash__():
+    """Test hash() for NamedState."""
+    color = Attribute('color', ['R', 'G', 'B'])
+    size = Attribute('size', ['S', 'M', 'L'])
+    attribute_system = AttributeSystem(AttributeStructure(color, size),
+                                       ['s1', 's2'])
+    vocabulary = Vocabulary(['a', 'b'], [], [])
+    p1 = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    p2 = ConstantAssignment(vocabulary, attribute_system, {'a': 's2'})
+
+    ns1 = NamedState(attribute_system, p1, {('color', 's1'): ['R']})
+    ns2 = NamedState(attribute_system, p1, {('color', 's1'): ['R']})
+    ns3 = NamedState(attribute_system, p2, {('color', 's1'): ['R']})
+
+    assert hash(ns1) == hash(ns2)
+    assert len(set([ns1, ns2, ns3])) == 2
+
+
 def test___deepcopy__():
     """Test copy.deepcopy for NamedState object."""
     from copy import deepcopy
@@ -188,12 +205,20 @@ def test___deepcopy__():
     named_state_copy = deepcopy(named_state)
     assert named_state == named_state_copy
     assert named_state is not named_state_copy
-    assert named_state._attribute_system == named_state_copy._attribute_system
-    assert named_state._attribute_system is not named_state_copy._attribute_system
-    assert named_state._p is not named_state_copy._p
+    assert named_state._attribute_system is named_state_copy._attribute_system
+    assert named_state._p is named_state_copy._p
     assert named_state._p._vocabulary is named_state_copy._p._vocabulary
     assert named_state._ascriptions is not named_state_copy._ascriptions
 
+    # changes to the copy do not reach the original
+    named_state_copy.set_ascription(('color', 's1'), ['R'])
+    assert named_state[('color', 's1')] == ValueSet(['R', 'B'])
+    named_state_copy.add_object('s4', constant_symbol='d')
+    assert named_state_copy._p is not named_state._p
+    assert named_state._p == p
+    assert named_state._attribute_system._objects == objects
+    assert named_state._p._attribute_system._objects == objects
+
 
 def test_total_ordering():
     """Test < operator for NamedState; overloaded for proper extension."""
@@ -304,6 +329,85 @@ def test___le__():
     # test both and chaining
     assert named_state_4 <= named_state_3 <= named_state_1 <= named_state
     assert named_state_4 <= named_state_3 <= named_state_2 <= named_state
+    assert not named_state <= named_state_2
+    assert not named_state_3 <= named_state_2 <= named_state_1
+
+    # the ascriptions and ConstantAssignments are compared in place
+    constructions = []
+    original_init = State.__init__
+
+    def counting_init(self, *args, **kwargs):
+        constructions.append(self)
+        original_init(self, *args, **kwargs)
+
+    State.__init__ = counting_init
+    try:
+        assert named_state_4 <= named_state_3 <= named_state_1 <= named_state
+        assert not named_state <= named_state_4
+    finally:
+        State.__init__ = original_init
+    assert constructions == []
+
+
+def make_clock():
+    """Return a world, a NamedState it extends and an interpretation."""
+    hour = Attribute('hour', [Interval(0, 23)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    attribute_structure = AttributeStructure(hour, r_pm)
+
+    pm_rs = RelationSymbol('PM', 1)
+    vocabulary = Vocabulary(['C1', 'C2'], [pm_rs], [])
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, {pm_rs: 1}, [[pm_rs, ('hour', 1)]])
+
+    asys = AttributeSystem(attribute_structure, ['c1', 'c2'])
+    p = ConstantAssignment(vocabulary, asys, {'C1': 'c1', 'C2': 'c2'})
+    world = NamedState(asys, p, {('hour', 'c1'): [21], ('hour', 'c2'): [3]})
+    named_state = NamedState(asys, p, {('hour', 'c1'): [21, 3]})
+    return world, named_state, attribute_interpretation
+
+
+def test__extends():
+    """Test _extends() function for NamedState."""
+    world, named_state, attribute_interpretation = make_clock()
+    assert world._extends(named_state)
+    assert not named_state._extends(world)
+
+    other_vocabulary = Vocabulary(['C1', 'C2'], [], [])
+    other_p = ConstantAssignment(other_vocabulary, world._attribute_system,
+                                 {'C1': 'c1'})
+    other = NamedState(world._attribute_system, other_p)
+    assert not world <= other
+
+    # the NamedState objects are only checked to be comparable in debug mode
+    State._debug = True
+    try:
+        assert world._extends(named_state)
+        with pytest.raises(ValueError) as excinfo:
+            world._extends(other)
+        with pytest.raises(TypeError) as excinfo:
+            world._extends(None)
+    finally:
+        State._debug = False
+
+
+def test__is_strict_subset():
+    """Test _is_strict_subset function for NamedState."""
+    color = Attribute('color', ['R', 'G', 'B'])
+    attribute_system = AttributeSystem(AttributeStructure(color), ['s1', 's2'])
+    vocabulary = Vocabulary(['a', 'b'], [], [])
+
+    p = ConstantAssignment(vocabulary, attribute_system, {'a': 's1'})
+    p_1 = ConstantAssignment(vocabulary, attribute_system,
+                             {'a': 's1', 'b': 's2'})
+    p_2 = ConstantAssignment(vocabulary, attribute_system,
+                             {'a': 's2', 'b': 's1'})
+    p_3 = ConstantAssignment(Vocabulary(['a', 'b', 'c'], [], []),
+                             attribute_system, {'a': 's1', 'b': 's2'})
+
+    for p_i in [p, p_1, p_2, p_3]:
+        for p_j in [p, p_1, p_2, p_3]:
+            assert NamedState._is_strict_subset(p_i, p_j) is (p_i < p_j)
 
 
 def test_add_object():
@@ -603,6 +707,62 @@ def test_get_worlds():
     assert worlds == worlds_manual
 
 
+def test__generate_constant_assignments():
+    """Test _generate_constant_assignments() function for NamedState."""
+    color = Attribute('color', ['R', 'G', 'B'])
+    attribute_structure = AttributeStructure(color)
+    objects = ['s1', 's2', 's3', 's4', 's5']
+    attribute_system = AttributeSystem(attribute_structure, objects)
+
+    def mappings(generator):
+        """Return the mappings of ConstantAssignments as sorted tuples."""
+        return sorted([tuple(sorted(p._mapping.items())) for p in generator])
+
+    for constants in [['a'], ['a', 'b'], ['a', 'b', 'c'], list('abcdefg')]:
+        vocabulary = Vocabulary(constants, [], [])
+        p = ConstantAssignment(vocabulary, attribute_system, {'a': 's5'})
+        ns = NamedState(attribute_system, p, {
+                        ('color', 's1'): ['R'], ('color', 's2'): ['R'],
+                        ('color', 's3'): ['R', 'G'],
+                        ('color', 's4'): ['R'], ('color', 's5'): ['B']})
+
+        classes = ns._get_interchangeable_objects()
+        assert classes == [['s1', 's2', 's4'], ['s3']]
+
+        full = mappings(ns._generate_constant_assignments())
+        representatives = list(ns._generate_constant_assignments(classes))
+        # no two representatives are in the same orbit
+        orbits = [mappings(ns._expand_constant_assignment(p, classes))
+                  for p in representatives]
+        assert sorted(sum(orbits, [])) == full
+        assert len(set(sum(orbits, []))) == len(full)
+
+    vocabulary = Vocabulary(['a', 'b'], [], [])
+    p = ConstantAssignment(vocabulary, attribute_system, {})
+    ns = NamedState(attribute_system, p, {})
+    classes = ns._get_interchangeable_objects()
+    assert classes == [objects]
+    assert mappings(ns._generate_constant_assignments(classes)) == [
+        (('a', 's1'), ('b', 's2'))]
+    assert len(list(ns._generate_constant_assignments())) == 20
+
+    # objects distinguished by another NamedState aren't interchangeable
+    ns_prime = NamedState(attribute_system, p, {('color', 's2'): ['R']})
+    assert ns._get_interchangeable_objects(ns_prime) == [
+        ['s1', 's3', 's4', 's5'], ['s2']]
+    p_prime = ConstantAssignment(vocabulary, attribute_system, {'a': 's3'})
+    ns_prime = NamedState(attribute_system, p_prime, {})
+    assert ns._get_interchangeable_objects(ns_prime) == [
+        ['s1', 's2', 's4', 's5'], ['s3']]
+
+    # objects that occur as values are never interchangeable
+    obj = Attribute('obj', ['s1', 's2'])
+    attribute_system = AttributeSystem(AttributeStructure(obj), objects)
+    p = ConstantAssignment(vocabulary, attribute_system, {})
+    ns = NamedState(attribute_system, p, {})
+    assert ns._get_interchangeable_objects() == [[obj] for obj in objects]
+
+
 def test_is_named_alternate_extension():
     """Test is_named_alternate_extension() function for NamedState."""
     def test_paper_example():
@@ -708,6 +868,37 @@ def test_is_named_alternate_extension():
     test_objects_simple()
 
 
+def test__generate_injective_extensions():
+    """Test _generate_injective_extensions() function for NamedState."""
+    a = Attribute('a', [1])
+    objects = ['o' + str(i) for i in range(8)]
+    attribute_system = AttributeSystem(AttributeStructure(a), objects)
+    vocabulary = Vocabulary(['C1', 'C2', 'C3', 'C4', 'C5'], [], [])
+
+    def extensions(mapping, domain):
+        """Return the extensions of mapping as a list of frozensets."""
+        p = ConstantAssignment(vocabulary, attribute_system, mapping)
+        ns = NamedState(attribute_system, p, {})
+        return [frozenset(extension.items()) for extension in
+                ns._generate_injective_extensions(domain)]
+
+    assert extensions({}, []) == [frozenset([])]
+    assert extensions({'C1': 'o1'}, ['C1']) == [frozenset([('C1', 'o1')])]
+    assert sorted(extensions({}, ['C1'])) == sorted(
+        [frozenset([('C1', obj)]) for obj in objects])
+
+    # every partial injection extending the mapping, each once: the number
+    # of ways to map k of the 4 free constants onto the 7 free objects
+    domain = ['C1', 'C2', 'C3', 'C4', 'C5']
+    result = extensions({'C2': 'o3'}, domain)
+    assert len(result) == len(set(result)) == 1 + 4 * 7 + 6 * 7 * 6 + \
+        4 * 7 * 6 * 5 + 7 * 6 * 5 * 4
+    for extension in result:
+        mapping = dict(extension)
+        assert mapping['C2'] == 'o3'
+        assert len(set(mapping.values())) == len(mapping)
+
+
 def test_get_named_alternate_extensions():
     """Test get_named_alternate_extensions() function for NamedState."""
     def test_paper_example():
@@ -1019,9 +1210,31 @@ def test_get_named_alternate_extensions():
                   l_32, l_33, l_34, l_35]:
             assert i in alternate_extensions
 
+    def test_uncovered_domain():
+        """Test constants of p outside the domains of the NamedStates."""
+        color = Attribute('color', ['R', 'G', 'B'])
+        attribute_system = AttributeSystem(
+            AttributeStructure(color), ['s1', 's2'])
+        vocabulary = Vocabulary(['C1', 'C2'], [], [])
+        p = ConstantAssignment(vocabulary, attribute_system, {'C1': 's1'})
+        state = NamedState(attribute_system, p, {})
+
+        # no superset of p maps only C2, so there are no alternate extensions
+        p_1 = ConstantAssignment(vocabulary, attribute_system, {'C2': 's2'})
+        state_1 = NamedState(attribute_system, p_1, {('color', 's1'): ['R']})
+        assert state.get_named_alternate_extensions(state_1) == []
+
+        p_2 = ConstantAssignment(vocabulary, attribute_system,
+                                 {'C1': 's1', 'C2': 's2'})
+        state_2 = NamedState(attribute_system, p_2, {('color', 's1'): ['R']})
+        alternate_extensions = state.get_named_alternate_extensions(state_2)
+        assert NamedState(attribute_system, p, {}) in alternate_extensions
+        assert len(alternate_extensions) == 2
+
     test_paper_example()
     test_objects_simple()
     test_objects_complex()
+    test_uncovered_domain()
 
 
 def test_satisfies_formula():
@@ -1207,6 +1420,105 @@ def test_satisfies_formula():
     point_test()
 
 
+def test__satisfies_formula():
+    """Test _satisfies_formula() function for NamedState."""
+    world, named_state, attribute_interpretation = make_clock()
+    vocabulary = world._p._vocabulary
+    X = VariableAssignment(vocabulary, world._attribute_system, {},
+                           dummy=True)
+    f1 = Formula(vocabulary, 'PM', 'C1')
+    f2 = Formula(vocabulary, 'PM', 'C2')
+
+    assert world._satisfies_formula(f1, X, attribute_interpretation)
+    assert not world._satisfies_formula(f2, X, attribute_interpretation)
+    # the calling NamedState object is not checked to be a world
+    assert not named_state._satisfies_formula(
+        f1, X, attribute_interpretation)
+
+    # unless in debug mode
+    State._debug = True
+    try:
+        assert world._satisfies_formula(f1, X, attribute_interpretation)
+        with pytest.raises(ValueError) as excinfo:
+            named_state._satisfies_formula(f1, X, attribute_interpretation)
+        with pytest.raises(TypeError) as excinfo:
+            world._satisfies_formula(None, X, attribute_interpretation)
+    finally:
+        State._debug = False
+
+
+def test_assign_truth_values():
+    """Test assign_truth_values() function for NamedState."""
+    a = Attribute('hour', [Interval(0, 23)])
+    a2 = Attribute('minute', [Interval(0, 59)])
+    r_pm = Relation('R1(h1) <=> h1 > 11', ['hour'], 1)
+    r_am = Relation('R2(h1) <=> h1 <= 11', ['hour'], 2)
+    r_ahead = Relation(
+        'R3(h1,m1,h2,m2) <=> h1 > h2 or (h1 = h2 and m1 > m2)',
+        ['hour', 'minute', 'hour', 'minute'], 3)
+    attribute_structure = AttributeStructure(a, a2, r_ahead, r_pm, r_am)
+
+    pm_rs = RelationSymbol('PM', 1)
+    am_rs = RelationSymbol('AM', 1)
+    ahead_rs = RelationSymbol('Ahead', 4)
+    vocabulary = Vocabulary(['C1', 'C2'], [pm_rs, am_rs, ahead_rs], ['V1'])
+
+    profiles = [
+        [pm_rs, ('hour', 1)],
+        [am_rs, ('hour', 1)],
+        [ahead_rs, ('hour', 1), ('minute', 1), ('hour', 2), ('minute', 2)]]
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, {pm_rs: 1, am_rs: 2, ahead_rs: 3},
+        profiles)
+
+    asys = AttributeSystem(attribute_structure, ['c1', 'c2', 'x1'])
+    p = ConstantAssignment(vocabulary, asys, {'C1': 'c1', 'C2': 'c2'})
+    X = VariableAssignment(vocabulary, asys, {'V1': 'x1'})
+    named_state = NamedState(asys, p, {('hour', 'c1'): [21, 11],
+                                       ('minute', 'c1'): [9],
+                                       ('hour', 'c2'): [Interval(0, 10)],
+                                       ('minute', 'c2'): [40],
+                                       ('hour', 'x1'): [3]})
+
+    formulae = [Formula(vocabulary, 'PM', 'C1'),
+                Formula(vocabulary, 'AM', 'C2'),
+                Formula(vocabulary, 'Ahead', 'C1', 'C2'),
+                Formula(vocabulary, 'PM', 'V1'),
+                Formula(vocabulary, 'Ahead', 'C2', 'V1')]
+
+    truth_values = named_state.assign_truth_values(
+        formulae, X, attribute_interpretation)
+    assert truth_values == ["unknown", True, True, False, "unknown"]
+    assert truth_values == [
+        formula.assign_truth_value(attribute_interpretation, named_state, X)
+        for formula in formulae]
+    assert named_state.assign_truth_values(
+        [], X, attribute_interpretation) == []
+
+    with pytest.raises(TypeError) as excinfo:
+        named_state.assign_truth_values([None], X, attribute_interpretation)
+    with pytest.raises(TypeError) as excinfo:
+        named_state.assign_truth_values(
+            formulae, None, attribute_interpretation)
+    with pytest.raises(TypeError) as excinfo:
+        named_state.assign_truth_values(formulae, X, None)
+
+    other_vocabulary = Vocabulary(['C1', 'C2'], [pm_rs, am_rs, ahead_rs], [])
+    with pytest.raises(ValueError) as excinfo:
+        named_state.assign_truth_values(
+            formulae + [Formula(other_vocabulary, 'PM', 'C1')], X,
+            attribute_interpretation)
+    with pytest.raises(ValueError) as excinfo:
+        named_state.assign_truth_values(formulae, VariableAssignment(
+            other_vocabulary, asys, {}, dummy=True), attribute_interpretation)
+
+    # truth values are generated one at a time
+    truth_values = named_state._generate_truth_values(
+        formulae[:1] + [None], X, attribute_interpretation)
+    assert next(truth_values) == "unknown"
+    with pytest.raises(TypeError) as excinfo:
+        next(truth_values)
+
 def test_satisfies_named_state():
     """Test satisfies_named_state() function for NamedState."""
     def test_TypeError(world, named_state):
@@ -1517,6 +1829,35 @@ def test_satisfies_context():
     point_test()
 
 
+def test__satisfies_context():
+    """Test _satisfies_context() function for NamedState."""
+    world, named_state, attribute_interpretation = make_clock()
+    vocabulary = world._p._vocabulary
+    X = VariableAssignment(vocabulary, world._attribute_system, {},
+                           dummy=True)
+    f1 = Formula(vocabulary, 'PM', 'C1')
+    f2 = Formula(vocabulary, 'PM', 'C2')
+
+    context = Context(AssumptionBase(f1), named_state)
+    assert world._satisfies_context(context, X, attribute_interpretation)
+    context = Context(AssumptionBase(f1, f2), named_state)
+    assert not world._satisfies_context(context, X, attribute_interpretation)
+    context = Context(AssumptionBase(f1), world)
+    assert not named_state._satisfies_context(
+        context, X, attribute_interpretation)
+
+    # the calling NamedState object is only checked in debug mode
+    State._debug = True
+    try:
+        with pytest.raises(ValueError) as excinfo:
+            named_state._satisfies_context(
+                context, X, attribute_interpretation)
+        with pytest.raises(TypeError) as excinfo:
+            world._satisfies_context(None, X, attribute_interpretation)
+    finally:
+        State._debug = False
+
+
 def test__generate_variable_assignments():
     """Test generate_variable_assignments function."""
     objects = ['s1', 's2']
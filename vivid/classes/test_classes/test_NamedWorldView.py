@@ -0,0 +1,160 @@
+"""NamedWorldView unit tests."""
+
+import pytest
+from copy import deepcopy
+from vivid.classes.attribute import Attribute
+from vivid.classes.attribute_structure import AttributeStructure
+from vivid.classes.attribute_system import AttributeSystem
+from vivid.classes.relation import Relation
+from vivid.classes.relation_symbol import RelationSymbol
+from vivid.classes.vocabulary import Vocabulary
+from vivid.classes.attribute_interpretation import AttributeInterpretation
+from vivid.classes.constant_assignment import ConstantAssignment
+from vivid.classes.formula import Formula
+from vivid.classes.assumption_base import AssumptionBase
+from vivid.classes.context import Context
+from vivid.classes.named_state import NamedState
+from vivid.classes.valueset import ValueSet
+
+
+def make_named_state():
+    """Return a NamedState with eight worlds and its interpretation."""
+    hour = Attribute('hour', [1, 2])
+    minute = Attribute('minute', [10, 20, 30])
+    r_same = Relation('R1(h1,h2) <=> h1 = h2', ['hour', 'hour'], 1)
+    attribute_structure = AttributeStructure(hour, minute, r_same)
+
+    same_rs = RelationSymbol('SAME', 2)
+    vocabulary = Vocabulary(['C1', 'C2'], [same_rs], [])
+    attribute_interpretation = AttributeInterpretation(
+        vocabulary, attribute_structure, {same_rs: 1},
+        [[same_rs, ('hour', 1), ('hour', 2)]])
+
+    attribute_system = AttributeSystem(attribute_structure, ['s1', 's2'])
+    p = ConstantAssignment(vocabulary, attribute_system, {'C1': 's1'})
+    named_state = NamedState(attribute_system, p, {
+        ('hour', 's1'): [1], ('minute', 's1'): [20, 30],
+        ('minute', 's2'): [10, 30]})
+    return named_state, attribute_interpretation
+
+
+def test___init__():
+    """Test NamedWorldView constructor."""
+    named_state, attribute_interpretation = make_named_state()
+
+    constructions = []
+    original_init = NamedState.__init__
+
+    def counting_init(self, *args, **kwargs):
+        constructions.append(args)
+        original_init(self, *args, **kwargs)
+
+    NamedState.__init__ = counting_init
+    try:
+        worlds = list(named_state.get_worlds())
+    finally:
+        NamedState.__init__ = original_init
+
+    assert constructions == []
+    assert len(worlds) == 8
+    for world in worlds:
+        assert world._is_NamedWorldView
+        assert world._is_NamedState
+        assert world._is_State
+        assert world._attribute_system is named_state._attribute_system
+        assert world._p._vocabulary is named_state._p._vocabulary
+        assert world._p.is_total()
+        assert world <= named_state
+
+
+def test___eq__():
+    """Test == operator."""
+    named_state, attribute_interpretation = make_named_state()
+    worlds = list(named_state.get_worlds())
+    named_states = [world.get_named_state() for world in worlds]
+
+    for i, world in enumerate(worlds):
+        for j, other in enumerate(named_states):
+            assert (world == other) is (i == j)
+            assert (other == world) is (i == j)
+
+
+def test__copy():
+    """Test deepcopy of NamedWorldView objects."""
+    named_state, attribute_interpretation = make_named_state()
+    world = next(named_state.get_worlds())
+
+    world_copy = deepcopy(world)
+    assert not hasattr(world_copy, "_is_NamedWorldView")
+    assert world_copy._is_NamedState
+    assert world_copy == world
+    assert world_copy._ascriptions is not world._ascriptions
+
+    world_copy.set_ascription(('minute', 's1'), [10])
+    assert world_copy[('minute', 's1')] == ValueSet([10])
+    assert world[('minute', 's1')] != ValueSet([10])
+
+
+def test_get_named_state():
+    """Test get_named_state() function for NamedWorldView."""
+    named_state, attribute_interpretation = make_named_state()
+    for world in named_state.get_worlds():
+        world_named_state = world.get_named_state()
+        assert world_named_state == NamedState(
+            world._attribute_system, world._p, world._ascriptions)
+        assert world_named_state.is_world()
+
+
+def test_is_world():
+    """Test is_world() function for NamedWorldView."""
+    named_state, attribute_interpretation = make_named_state()
+    for world in named_state.get_worlds():
+        assert world.is_world()
+
+
+def test_set_ascription():
+    """Test NamedWorldView objects are read-only."""
+    named_state, attribute_interpretation = make_named_state()
+    world = next(named_state.get_worlds())
+
+    with pytest.raises(TypeError) as excinfo:
+        world.set_ascription(('minute', 's1'), [10])
+    with pytest.raises(TypeError) as excinfo:
+        world.add_object('s3')
+    with pytest.raises(TypeError) as excinfo:
+        world.add_object('s3', constant_symbol='C3')
+    assert world._attribute_system._objects == ['s1', 's2']
+
+
+def test_satisfies():
+    """Test satisfaction for NamedWorldView objects matches NamedState."""
+    named_state, attribute_interpretation = make_named_state()
+    vocabulary = named_state._p._vocabulary
+
+    same = Formula(vocabulary, 'SAME', 'C1', 'C2')
+    context = Context(AssumptionBase(same), named_state)
+    other = NamedState(named_state._attribute_system, named_state._p, {
+        ('minute', 's2'): [30]})
+
+    satisfying = 0
+    for world in named_state.get_worlds():
+        world_named_state = world.get_named_state()
+
+        assert world.satisfies_named_state(named_state)
+        assert world.satisfies_named_state(other) is \
+            world_named_state.satisfies_named_state(other)
+
+        Xs = list(world._generate_variable_assignments())
+        assert Xs == list(
+            world_named_state._generate_variable_assignments())
+
+        for X in Xs:
+            satisfies_formula = world.satisfies_formula(
+                same, X, attribute_interpretation)
+            assert satisfies_formula is world_named_state.satisfies_formula(
+                same, X, attribute_interpretation)
+            assert world.satisfies_context(
+                context, X, attribute_interpretation) is satisfies_formula
+            satisfying += satisfies_formula
+
+    assert satisfying == 4
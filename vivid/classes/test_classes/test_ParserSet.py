@@ -35,3 +35,53 @@ def test___iter__():
     parset_set = ParserSet()
     for parser in parset_set:
         assert hasattr(parser, "_is_Parser")
+
+
+def test_get_shared():
+    """Test ParserSet.get_shared()."""
+    from vivid.classes.relation import Relation
+    from vivid.classes.parsers.truth_value_parser import TruthValueParser
+
+    parser_set = ParserSet.get_shared()
+    assert hasattr(parser_set, "_is_ParserSet")
+    assert ParserSet.get_shared() is parser_set
+    assert ParserSet() is not parser_set
+
+    # compiling definitions reuses the shared grammar
+    constructions = []
+    original_init = TruthValueParser.__init__
+
+    def counting_init(self):
+        constructions.append(self)
+        original_init(self)
+
+    TruthValueParser.__init__ = counting_init
+    try:
+        evaluator = Relation._compile_definition(
+            "R1(shared_a, shared_b) <=> shared_a < shared_b")
+    finally:
+        TruthValueParser.__init__ = original_init
+
+    assert evaluator(1, 2)
+    assert not constructions
+
+
+def test_route():
+    """Test route function."""
+    parser_set = ParserSet()
+    truth_value_parser, point_parser, line_segment_parser = parser_set
+
+    # mathematical/logical expressions go to the TruthValueParser only
+    assert parser_set.route("h1 > h2 or (h1 = h2 and m1 > m2)") == \
+        [truth_value_parser]
+    assert parser_set.route("abs(h1 - h2) < 2") == [truth_value_parser]
+    assert parser_set.route("(h1 < 2)") == [truth_value_parser]
+    assert parser_set.route("") == [truth_value_parser]
+    # undeclared functions are left to the TruthValueParser to reject
+    assert parser_set.route("undeclared(a, b)") == [truth_value_parser]
+
+    # functions go to the parsers declaring them, in order
+    assert parser_set.route("is_on(p, s, e)") == [point_parser]
+    assert parser_set.route(" can_observe (p, s, e, q)") == [point_parser]
+    assert parser_set.route("meets(p, l1, l2)") == \
+        [point_parser, line_segment_parser]
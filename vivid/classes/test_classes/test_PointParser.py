@@ -5,7 +5,11 @@ from vivid.classes.parsers.point_parser import PointParser
 
 def test___init__():
     """Test PointParser constructor."""
-    assert hasattr(PointParser(), "_is_Parser")
+    parser = PointParser()
+    assert hasattr(parser, "_is_Parser")
+    assert parser._functions == frozenset(
+        ['can_observe', 'clocks_unequal', 'is_on', 'meets', 'not_same_point'])
+    assert parser._types == ("_is_Point",)
 
 
 def test___call__():
@@ -30,3 +34,32 @@ def test__eval():
     assert parser("is_on(P(1.5,1.5,1.5,1.5),P(1.0,1.0,1.0,1.0),P(3.0,3.0,3.0,3.0))")
     assert parser("not_same_point(P(1.5,1.5,1.5,1.5),P(2.0,2.0,2.0,2.0))")
     assert parser("meets(P(1.5,1.5,1.5,1.5),P(2.0,2.0,2.0,2.0),P(1.0,1.0,1.0,1.0),P(1.0,1.0,1.0,1.0),P(2.0,2.0,2.0,2.0))")
+
+
+def test_compile():
+    """Test compile function."""
+    import pytest
+    from vivid.classes.point import Point
+
+    def test_ValueError(expression, arguments):
+        """Test compile for ValueErrors with given params."""
+        with pytest.raises(ValueError) as excinfo:
+            PointParser().compile(expression, arguments)
+
+    parser = PointParser()
+    is_on = parser.compile("is_on(p, s, e)", ["p", "s", "e"])
+    assert is_on(Point(2.0, 2.0), Point(-1.0, -1.0), Point(3.0, 3.0))
+    assert not is_on(Point(2.0, 2.0), Point(6.0, 1.0), Point(3.0, 2.0))
+
+    # Point literals may be mixed with arguments
+    is_on = parser.compile("is_on(p, P(-1.0,-1.0), e)", ["e", "p"])
+    assert is_on(Point(3.0, 3.0), Point(2.0, 2.0))
+
+    with pytest.raises(ValueError) as excinfo:
+        is_on(1, 2)
+    with pytest.raises(ValueError) as excinfo:
+        is_on(Point('x', 'x'), Point(2.0, 2.0))
+
+    test_ValueError("not_a_function(p)", ["p"])
+    test_ValueError("is_on(p, s, e)", ["p", "s"])
+    test_ValueError("p > s", ["p", "s"])
@@ -134,6 +134,12 @@ def test_set_definition():
     # invalid definition test
     test_ValueError("invalid definition")
 
+    # evaluator is recompiled with the new definition
+    r.set_definition("R1(a) <=> a > 1")
+    assert r._definition == "R1(a) <=> a > 1"
+    assert r._evaluator(2) is True
+    assert r._evaluator(0) is False
+
 
 def test_get_DR():
     """Test get_DR function."""
@@ -172,6 +178,185 @@ def test_get_arity():
     assert r.get_arity() == 3
 
 
+def test__compile_definition():
+    """Test _compile_definition function."""
+    from vivid.classes.point import Point
+    from vivid.classes.line_segment import LineSegment
+
+    def test_ValueError(evaluator, *values):
+        """Test evaluator for ValueErrors with given values."""
+        with pytest.raises(ValueError) as excinfo:
+            evaluator(*values)
+
+    # empty RHS compiles but can't be evaluated
+    test_ValueError(Relation._compile_definition("R1(a) <=> "), 1)
+
+    # arguments are stripped and bound by position
+    ahead = Relation._compile_definition(
+        "R1(h1, m1, hhh2, mm2) <=> h1 > hhh2 or (h1 = hhh2 and m1 > mm2)")
+    assert ahead(9, 0, 8, 0) is True
+    assert ahead(8, 1, 8, 2) is False
+    test_ValueError(ahead, 'a', 1, 'b', 2)
+
+    # arguments named as constants are bound, not read as the constants
+    e = Relation._compile_definition("R1(e) <=> e > 1")
+    assert e(2) is True
+    assert e(0) is False
+    assert Relation._compile_definition("R1(pi) <=> pi < 1")(0) is True
+
+    # evaluators are shared between equal definitions
+    assert Relation._compile_definition("R1(a) <=> a = 1") is \
+        Relation._compile_definition("R1(a) <=> a = 1")
+    r = Relation("R1(a) <=> a = 1", ["a"], 1)
+    from copy import deepcopy
+    assert deepcopy(r)._evaluator is r._evaluator
+
+    # first parser able to evaluate the values is used
+    meets = Relation._compile_definition("R2(p, l1, l2) <=> meets(p, l1, l2)")
+    assert meets(Point(2.5, 2.5),
+                 LineSegment(Point(0.0, 0.0), Point(5.0, 5.0)),
+                 LineSegment(Point(5.0, 0.0), Point(0.0, 5.0)))
+    assert not meets(Point(2.5, 2.5),
+                     LineSegment(Point(0.0, 0.0), Point(5.0, 0.0)),
+                     LineSegment(Point(5.0, 0.0), Point(0.0, 5.0)))
+    meets = Relation._compile_definition(
+        "R2(p, p1, p2, p3, p4) <=> meets(p, p1, p2, p3, p4)")
+    assert meets(Point(1.5, 1.5), Point(1.0, 1.0), Point(2.0, 2.0),
+                 Point(2.0, 1.0), Point(1.0, 2.0))
+    test_ValueError(meets, 1, 2, 3, 4, 5)
+    test_ValueError(meets, Point(1.5, 1.5), 1, 2, 3, 4)
+
+    # the least recently used evaluators are evicted
+    size = Relation._evaluators_size
+    Relation._evaluators_size = 2
+    Relation._evaluators.clear()
+    try:
+        first = Relation._compile_definition("R1(lru_a) <=> lru_a = 1")
+        Relation._compile_definition("R1(lru_a) <=> lru_a = 2")
+        assert Relation._compile_definition(
+            "R1(lru_a) <=> lru_a = 1") is first
+        Relation._compile_definition("R1(lru_a) <=> lru_a = 3")
+        assert len(Relation._evaluators) == 2
+        assert "R1(lru_a) <=> lru_a = 2" not in Relation._evaluators
+        assert Relation._compile_definition(
+            "R1(lru_a) <=> lru_a = 1") is first
+        assert first(1) is True
+    finally:
+        Relation._evaluators_size = size
+
+
+def test__compile_parsers():
+    """Test _compile_parsers function."""
+    from vivid.classes.parsers.parser_set import ParserSet
+    truth_value_parser, point_parser, line_segment_parser = \
+        ParserSet.get_shared()
+
+    def parsers(definition):
+        """Return the parsers compiling definition."""
+        return [parser for parser, compiled_expression in
+                Relation._compile_parsers(definition)]
+
+    assert parsers("R1(h1, h2) <=> h1 > h2") == [truth_value_parser]
+    assert parsers("R1(p, s, e) <=> is_on(p, s, e)") == [point_parser]
+    assert parsers("R1(p, l1, l2) <=> meets(p, l1, l2)") == \
+        [point_parser, line_segment_parser]
+    # parsers unable to compile the expression are left out
+    assert parsers("R1(h1) <=> h1 >") == []
+    assert parsers("R1(p, s) <=> is_on(p, s, e)") == []
+
+    # a definition handled by one parser is bound to it directly
+    evaluator = Relation._compile_definition("R1(route_a) <=> route_a = 1")
+    assert evaluator(1) is True
+    compiles = []
+    original_compile = point_parser.compile
+
+    def counting_compile(*args):
+        compiles.append(args)
+        return original_compile(*args)
+
+    point_parser.compile = counting_compile
+    try:
+        Relation._compile_definition("R1(route_b) <=> route_b = 1")
+    finally:
+        del point_parser.compile
+    assert compiles == []
+
+
+
+def test__compile_evaluators():
+    """Test _compile_evaluators function."""
+    from vivid.classes.parsers.parser_set import ParserSet
+    truth_value_parser = ParserSet.get_shared()[0]
+
+    class CountingGrammar(object):
+        """Count the expressions parsed by a grammar."""
+        def __init__(self, bnf):
+            self.bnf, self.parsed = bnf, []
+
+        def parseString(self, string, parseAll=False):
+            self.parsed.append(string)
+            return self.bnf.parseString(string, parseAll)
+
+    routes = []
+    compile_parsers = Relation._compile_parsers
+
+    def counting_compile_parsers(definition):
+        routes.append(definition)
+        return compile_parsers(definition)
+
+    grammar = CountingGrammar(truth_value_parser.bnf)
+    truth_value_parser.bnf = grammar
+    Relation._compile_parsers = staticmethod(counting_compile_parsers)
+    try:
+        r = Relation("R1(once_a) <=> once_a > 1", ["a"], 1)
+        assert routes == ["R1(once_a) <=> once_a > 1"]
+        assert grammar.parsed == ["once_a > 1"]
+        assert r._evaluator(2) is True
+        assert r._interval_evaluator((2, 3)) is True
+
+        # cached definitions are not compiled again
+        Relation("R1(once_a) <=> once_a > 1", ["a"], 1)
+        r.set_definition("R1(once_a) <=> once_a > 1")
+        assert len(routes) == 1 and len(grammar.parsed) == 1
+    finally:
+        Relation._compile_parsers = staticmethod(compile_parsers)
+        truth_value_parser.bnf = grammar.bnf
+
+
+def test__compile_interval_definition():
+    """Test _compile_interval_definition function."""
+    ahead = Relation._compile_interval_definition(
+        "R1(h1, m1, hhh2, mm2) <=> h1 > hhh2 or (h1 = hhh2 and m1 > mm2)")
+    assert ahead((9, 12), (0, 59), (2, 8), (0, 59)) is True
+    assert ahead((8, 9), (0, 59), (8, 8), (0, 59)) == "unknown"
+
+    # interval evaluators are shared between equal definitions
+    r = Relation("R1(a) <=> a = 1", ["a"], 1)
+    assert r._interval_evaluator is \
+        Relation._compile_interval_definition("R1(a) <=> a = 1")
+    from copy import deepcopy
+    assert deepcopy(r)._interval_evaluator is r._interval_evaluator
+    r.set_definition("R1(a) <=> a > 1")
+    assert r._interval_evaluator((2, 3)) is True
+
+    # only the parser first able to compile the definition is used
+    assert Relation._compile_interval_definition(
+        "R2(p, l1, l2) <=> meets(p, l1, l2)") is None
+
+    # the least recently used interval evaluators are evicted
+    size = Relation._evaluators_size
+    Relation._evaluators_size = 1
+    Relation._interval_evaluators.clear()
+    try:
+        first = Relation._compile_interval_definition(
+            "R1(lru_b) <=> lru_b = 1")
+        Relation._compile_interval_definition("R1(lru_b) <=> lru_b = 2")
+        assert len(Relation._interval_evaluators) == 1
+        assert Relation._compile_interval_definition(
+            "R1(lru_b) <=> lru_b = 1") is not first
+    finally:
+        Relation._evaluators_size = size
+
 def test_is_valid_definition():
     """Test is_valid_definition function."""
     # correct definition form test
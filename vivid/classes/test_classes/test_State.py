@@ -31,8 +31,8 @@ def test___init__():
     test_TypeError(asys, object)
 
     s = State(asys)
-    assert s._attribute_system == asys
-    assert s._attribute_system is not asys
+    assert s._attribute_system is asys
+    assert s[('color', 's1')] is asys._attribute_structure['color']._value_set
     s = State(asys, {
         ('color', 's1'): ['R'],
         ('color', 's2'): ['B', 'G'],
@@ -139,6 +139,42 @@ def test___le__():
     assert s1 <= s
     assert not s <= s1
 
+    # discrete Intervals are compared value by value through bitmasks
+    from vivid.classes.interval import Interval
+    hour = Attribute("hour", [Interval(0, 23)])
+    hsys = AttributeSystem(AttributeStructure(hour), ['s1'])
+    h1 = State(hsys, {('hour', 's1'): [Interval(1, 3)]})
+    h2 = State(hsys, {('hour', 's1'): [1, 2, 3]})
+    h3 = State(hsys, {('hour', 's1'): [1, 3]})
+    assert h1 <= h2 and h2 <= h1
+    assert h3 <= h1
+    assert not h1 <= h3
+
+
+def test__extends():
+    """Test _extends() function for State."""
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    asys = AttributeSystem(AttributeStructure(color, size), ['s1', 's2'])
+    other_asys = AttributeSystem(AttributeStructure(color, size), ['s1'])
+
+    s = State(asys)
+    s1 = State(asys, {('color', 's1'): ['R'], ('size', 's2'): ['L', 'S']})
+
+    assert s1._extends(s)
+    assert not s._extends(s1)
+
+    # the parameters are only validated in debug mode
+    State._debug = True
+    try:
+        assert s1._extends(s)
+        with pytest.raises(TypeError) as excinfo:
+            s._extends(None)
+        with pytest.raises(ValueError) as excinfo:
+            s._extends(State(other_asys))
+    finally:
+        State._debug = False
+
 
 def test___ne__():
     """Test != operator."""
@@ -175,6 +211,22 @@ def test___ne__():
     assert not s != s1 != s2
 
 
+def test___hash__():
+    """Test hash() for State."""
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    asys = AttributeSystem(AttributeStructure(color, size), ['s1', 's2'])
+
+    s1 = State(asys, {('color', 's1'): ['R'], ('size', 's2'): ['L', 'S']})
+    s2 = State(asys, {('size', 's2'): ['S', 'L'], ('color', 's1'): ['R']})
+    s3 = State(asys, {('color', 's1'): ['G']})
+
+    # equal ascriptions share one FrozenValueSet
+    assert s1[('size', 's2')] is s2[('size', 's2')]
+    assert hash(s1) == hash(s2)
+    assert len(set([s1, s2, s3])) == 2
+
+
 def test___deepcopy__():
     """Test deepcopy"""
     color = Attribute("color", ['R', 'G', 'B'])
@@ -196,10 +248,18 @@ def test___deepcopy__():
 
     assert s == s_copy
     assert s is not s_copy
-    assert s._attribute_system == s_copy._attribute_system
-    assert s._attribute_system is not s_copy._attribute_system
+    assert s._attribute_system is s_copy._attribute_system
     assert s._ascriptions == s_copy._ascriptions
     assert s._ascriptions is not s_copy._ascriptions
+    assert s[('color', 's2')] is s_copy[('color', 's2')]
+
+    # changes to the copy do not reach the original
+    s_copy.set_ascription(('color', 's2'), ['B'])
+    assert s[('color', 's2')] == ValueSet(['B', 'G'])
+    s_copy.add_object('s3')
+    assert s._attribute_system._objects == ['s1', 's2']
+    assert asys._objects == ['s1', 's2']
+    assert ('color', 's3') not in s._ascriptions
 
 
 def test_set_ascription():
@@ -260,6 +320,34 @@ def test_set_ascription():
     assert s[('size', 's1')] == ValueSet(['S', 'M'])
 
 
+def test__set_ascription():
+    """Test _set_ascription function."""
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    asys = AttributeSystem(AttributeStructure(color, size), ['s1', 's2'])
+    s = State(asys)
+
+    s._set_ascription(('color', 's2'), ['R', 'G'])
+    assert s[('color', 's2')] == ValueSet(['R', 'G'])
+    # the values are not checked against the Attribute
+    s._set_ascription(('color', 's1'), ['a'])
+    assert s[('color', 's1')] == ValueSet(['a'])
+
+    # unless in debug mode
+    State._debug = True
+    try:
+        s._set_ascription(('size', 's1'), ['S'])
+        assert s[('size', 's1')] == ValueSet(['S'])
+        with pytest.raises(ValueError) as excinfo:
+            s._set_ascription(('color', 's1'), ['a'])
+        with pytest.raises(ValueError) as excinfo:
+            s._set_ascription(('color', 's1'), [])
+        with pytest.raises(KeyError) as excinfo:
+            s._set_ascription(('color', 's3'), ['R'])
+    finally:
+        State._debug = False
+
+
 def test___getitem__():
     """Test indexing for State"""
     color = Attribute("color", ['R', 'G', 'B'])
@@ -427,6 +515,109 @@ def test_get_worlds():
     assert len(s.get_worlds()) == len(worlds)
 
 
+def test_generate_worlds():
+    """Test generate_worlds function."""
+    import types
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    a = AttributeStructure(color, size)
+    o = ['s1', 's2']
+    asys = AttributeSystem(a, o)
+
+    s = State(asys, {
+        ('color', 's1'): ['R'],
+        ('color', 's2'): ['B', 'G'],
+        ('size', 's1'): ['M'],
+        ('size', 's2'): ['L', 'S']})
+
+    assert isinstance(s.generate_worlds(), types.GeneratorType)
+
+    worlds = s.get_worlds()
+    views = list(s.generate_worlds())
+    assert len(views) == len(worlds) == 4
+    for index, (view, world) in enumerate(zip(views, worlds)):
+        assert view.get_index() == index
+        assert view.get_state() == world
+        assert view == world
+        assert view._attribute_system is s._attribute_system
+
+    # a State with no objects has exactly one (empty) world
+    empty = State(AttributeSystem(a, []))
+    assert len(list(empty.generate_worlds())) == 1
+
+
+def test_get_world():
+    """Test get_world function."""
+    from vivid.classes.interval import Interval
+
+    def test_TypeError(state, index):
+        """Test get_world for TypeErrors with given params."""
+        with pytest.raises(TypeError) as excinfo:
+            state.get_world(index)
+
+    def test_IndexError(state, index):
+        """Test get_world for IndexErrors with given params."""
+        with pytest.raises(IndexError) as excinfo:
+            state.get_world(index)
+
+    hour = Attribute("hour", [Interval(0, 23)])
+    minute = Attribute("minute", [Interval(0, 59)])
+    asys = AttributeSystem(AttributeStructure(hour, minute),
+                           ['s1', 's2', 's3', 's4'])
+    s = State(asys)
+
+    # random access into 24^4 * 60^4 worlds without enumerating them
+    count = s.get_world_count()
+    assert count == 24 ** 4 * 60 ** 4
+    for index in [0, 1, 59, 60, 12345678, count // 2, count - 1]:
+        world = s.get_world(index)
+        assert world.get_index() == index
+        assert world.is_world()
+
+    small = State(asys, {('hour', 's1'): [Interval(0, 1)],
+                         ('hour', 's2'): [3],
+                         ('hour', 's3'): [4],
+                         ('hour', 's4'): [5],
+                         ('minute', 's1'): [0],
+                         ('minute', 's2'): [Interval(0, 2)],
+                         ('minute', 's3'): [0],
+                         ('minute', 's4'): [0]})
+    views = list(small.generate_worlds())
+    assert len(views) == small.get_world_count() == 6
+    for index, view in enumerate(views):
+        assert small.get_world(index) == view
+
+    test_TypeError(s, None)
+    test_TypeError(s, '0')
+    test_TypeError(s, 1.0)
+    test_IndexError(s, -1)
+    test_IndexError(s, count)
+
+    # the ascriptions are discretized once per world
+    discretizations = []
+    discretize_ascriptions = small._discretize_ascriptions
+
+    def counting_discretize_ascriptions():
+        discretizations.append(None)
+        return discretize_ascriptions()
+    small._discretize_ascriptions = counting_discretize_ascriptions
+    small.get_world(5)
+    test_IndexError(small, 6)
+    assert len(discretizations) == 2
+
+
+def test_get_world_count():
+    """Test get_world_count function."""
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    a = AttributeStructure(color, size)
+    asys = AttributeSystem(a, ['s1', 's2'])
+
+    assert State(asys).get_world_count() == 3 ** 4
+    assert State(asys, {('color', 's1'): ['R']}).get_world_count() == 3 ** 3
+    assert State(AttributeSystem(a, [])).get_world_count() == 1
+
+
 def test_is_disjoint():
     """Test is_disjoint function."""
     color = Attribute("color", ['R', 'G', 'B'])
@@ -591,6 +782,63 @@ def test_get_alternate_extensions():
     assert ae_s2 == s2
     assert ae_s3 == s3
 
+    # the alternate extensions can be generated lazily, after validation
+    from types import GeneratorType
+    assert isinstance(s.get_alternate_extensions(s1), list)
+    aes = s._generate_alternate_extensions(s1)
+    assert isinstance(aes, GeneratorType)
+    assert list(aes) == s.get_alternate_extensions(s1)
+    with pytest.raises(ValueError) as excinfo:
+        s._generate_alternate_extensions(s)
+
+    def brute_force_alternate_extensions(state, *states):
+        """Filter the full product of the rows as the paper does."""
+        from itertools import product, combinations
+        table = [[(ao_pair, value_set)
+                  for ao_pair, value_set in sorted(st._ascriptions.items())
+                  if st[ao_pair] < state[ao_pair]] for st in states]
+        extensions = []
+        for spanning_list in product(*table):
+            spanning = False
+            for i in range(2, len(spanning_list) + 1):
+                for sublist in combinations(spanning_list, i):
+                    ao_pairs = set([ao_pair for ao_pair, vs in sublist])
+                    if len(ao_pairs) == 1:
+                        merged = [v for ao_pair, vs in sublist for v in vs]
+                        if state[ao_pairs.pop()] == ValueSet(merged):
+                            spanning = True
+            if spanning:
+                continue
+            merged = {}
+            for ao_pair, value_set in spanning_list:
+                merged.setdefault(ao_pair, []).extend(value_set)
+            extension = deepcopy(state)
+            for ao_pair, values in merged.items():
+                extension.set_ascription(
+                    ao_pair, state[ao_pair] - ValueSet(values))
+            extensions.append(extension)
+        return extensions
+
+    color, size = Attribute(
+        "color", ['R', 'G', 'B']), Attribute("size", ['S', 'M', 'L'])
+    asys = AttributeSystem(AttributeStructure(color, size), ['s1', 's2'])
+    s = State(asys)
+    extensions = []
+    for colors in [['R'], ['G'], ['B'], ['R', 'G'], ['G', 'B']]:
+        for sizes in [['S'], ['M'], ['S', 'L'], ['S', 'M', 'L']]:
+            extension = deepcopy(s)
+            extension.set_ascription(('color', 's1'), colors)
+            extension.set_ascription(('size', 's2'), sizes)
+            if extension < s:
+                extensions.append(extension)
+
+    for i in range(0, len(extensions) - 2, 3):
+        states = extensions[i:i + 4]
+        expected = brute_force_alternate_extensions(s, *states)
+        aes = s.get_alternate_extensions(*states)
+        assert len(aes) == len(expected)
+        assert set(aes) == set(expected)
+
 
 def test_join():
     """Test join function for States."""
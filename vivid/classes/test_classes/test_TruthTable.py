@@ -0,0 +1,82 @@
+"""TruthTable unit tests."""
+
+from vivid.classes.interval import Interval
+from vivid.classes.point import Point
+from vivid.classes.attribute import Attribute
+from vivid.classes.relation import Relation
+from vivid.classes.attribute_structure import AttributeStructure
+from vivid.classes.relation_symbol import RelationSymbol
+from vivid.classes.vocabulary import Vocabulary
+from vivid.classes.attribute_interpretation import AttributeInterpretation
+from vivid.classes.truth_table import TruthTable
+
+
+def test_get():
+    """Test get function."""
+    speed = Attribute('speed', [Interval(0, 9), 10.5])
+    hour = Attribute('hour', [Interval(0, 23)])
+    point = Attribute('point', [Point('x', 'x')])
+    r_same = Relation('R1(v1, v2) <=> v1 = v2', ['speed', 'speed'], 1)
+    r_ahead = Relation('R2(h1, h2, h3) <=> h1 > h2', ['hour'] * 3, 2)
+    r_point = Relation('R3(p) <=> p = p', ['point'], 3)
+    attribute_structure = AttributeStructure(
+        speed, hour, point, r_same, r_ahead, r_point)
+
+    truth_table = TruthTable.get(r_same, attribute_structure)
+    assert truth_table._is_TruthTable
+    assert truth_table._strides == [11, 1]
+    assert TruthTable.get(r_same, attribute_structure) is truth_table
+    # tables are shared between equal definitions over equal Attributes
+    from copy import deepcopy
+    assert TruthTable.get(deepcopy(r_same), deepcopy(attribute_structure)) \
+        is truth_table
+
+    # too many value tuples, values that are not discrete and definitions
+    # that cannot be evaluated for some value tuple are not tabled
+    assert TruthTable.get(r_ahead, attribute_structure) is None
+    assert TruthTable.get(r_point, attribute_structure) is None
+    assert TruthTable.get(Relation('R1(v1, v2) <=> 1 / (v1 - v2) > 0',
+                                   ['speed', 'speed'], 1),
+                          attribute_structure) is None
+    assert TruthTable.get(Relation('R4(v) <=> v > 1', ['size'], 4),
+                          attribute_structure) is None
+
+    # the realizations of an interpretation are tabled on construction
+    rs_same = RelationSymbol('SAME', 2)
+    vocabulary = Vocabulary(['C'], [rs_same], [])
+    r_same_hour = Relation('R5(h1, h2) <=> h1 = h2', ['hour', 'hour'], 5)
+    attribute_structure += r_same_hour
+    size = len(TruthTable._tables)
+    AttributeInterpretation(vocabulary, attribute_structure, {rs_same: 5},
+                            [[rs_same, ('hour', 1), ('hour', 2)]])
+    assert len(TruthTable._tables) == size + 1
+    assert TruthTable.get(r_same_hour, attribute_structure) is not None
+
+    # the least recently used TruthTable objects are evicted
+    size = TruthTable._tables_size
+    TruthTable._tables_size = 1
+    TruthTable._tables.clear()
+    try:
+        truth_table = TruthTable.get(r_same, attribute_structure)
+        TruthTable.get(r_same_hour, attribute_structure)
+        assert len(TruthTable._tables) == 1
+        assert TruthTable.get(r_same, attribute_structure) is not truth_table
+    finally:
+        TruthTable._tables_size = size
+
+
+def test_evaluate():
+    """Test evaluate function."""
+    r_less = Relation('R1(v1, v2) <=> v1 < v2 + 3', ['speed'] * 2, 1)
+    attribute_structure = AttributeStructure(
+        Attribute('speed', [Interval(0, 9)]), r_less)
+
+    truth_table = TruthTable.get(r_less, attribute_structure)
+    for v1 in range(10):
+        for v2 in range(10):
+            assert truth_table.evaluate(v1, v2) is (v1 < v2 + 3)
+
+    # values outside the table are evaluated by the Relation
+    assert truth_table.evaluate(2.5, 0) is True
+    assert truth_table.evaluate(11, 9) is True
+    assert truth_table.evaluate(True, 9) is True
@@ -1,5 +1,6 @@
 """TruthValueParser unit tests."""
 
+import pytest
 from vivid.classes.parsers.truth_value_parser import TruthValueParser
 
 
@@ -14,3 +15,85 @@ def test_eval():
     assert lmtp(
         '!(4 < 5 * cos(2 * PI) and 4 * e^3 > 3 * 3 * (3 + 3)) and !!(2 < 3)') \
         is False
+
+
+def test_compile():
+    """Test TruthValueParser compilation."""
+    def test_ValueError(expression, arguments):
+        """Test compile for ValueErrors with given params."""
+        with pytest.raises(ValueError) as excinfo:
+            TruthValueParser().compile(expression, arguments)
+
+    lmtp = TruthValueParser()
+    ahead = lmtp.compile('h1 > hhh2 or (h1 = hhh2 and m1 > mm2)',
+                         ['h1', 'm1', 'hhh2', 'mm2'])
+    assert ahead(9, 0, 8, 0) is True
+    assert ahead(8, 3, 8, 2) is True
+    assert ahead(8, 1, 8, 2) is False
+
+    # arguments sharing a prefix with constants, operators or functions
+    f = lmtp.compile('e1 > e and order = sin', ['e1', 'order', 'sin'])
+    assert f(3, 1, 1) is True
+    assert f(2, 1, 1) is False
+    assert lmtp.compile('sin(x) = 0', ['x'])(0) is True
+
+    # arguments spelled as constants are variables; other spellings are not
+    assert lmtp.compile('e > 1', ['e'])(2) is True
+    assert lmtp.compile('e > 1', ['e'])(0) is False
+    assert lmtp.compile('pi + E = 3', ['pi'])(3 - 2.718281828459045) is True
+    assert lmtp.compile_intervals('e > 1', ['e'])((2, 3)) is True
+    assert lmtp('e > 2') is True
+    assert lmtp.compile('e > 2', ['E'])(0) is True
+
+    # compiled expressions are independent of later parses
+    assert lmtp('!(2 < 3)') is False
+    assert ahead(9, 0, 8, 0) is True
+
+    with pytest.raises(ValueError) as excinfo:
+        ahead('a', 0, 'b', 0)
+
+    test_ValueError('meets(a, b, c)', ['a', 'b', 'c'])
+    test_ValueError('a > b', ['a'])
+    test_ValueError('', ['a'])
+
+
+def test_compile_intervals():
+    """Test TruthValueParser compilation for intervals."""
+    lmtp = TruthValueParser()
+    ahead = lmtp.compile_intervals('h1 > hhh2 or (h1 = hhh2 and m1 > mm2)',
+                                   ['h1', 'm1', 'hhh2', 'mm2'])
+    assert ahead((9, 12), (0, 59), (2, 8), (0, 59)) is True
+    assert ahead((8, 8), (3, 5), (8, 8), (0, 2)) is True
+    assert ahead((1, 7), (0, 59), (8, 12), (0, 59)) is False
+    assert ahead((8, 9), (0, 59), (8, 8), (0, 59)) == "unknown"
+
+    # relational operators
+    assert lmtp.compile_intervals('a = b', ['a', 'b'])((2, 2), (2, 2)) is True
+    assert lmtp.compile_intervals('a = b', ['a', 'b'])((1, 2), (3, 4)) is False
+    assert lmtp.compile_intervals(
+        'a = b', ['a', 'b'])((1, 3), (3, 4)) == "unknown"
+    assert lmtp.compile_intervals('a >= b', ['a', 'b'])((3, 4), (1, 3)) is True
+    assert lmtp.compile_intervals(
+        'a <= b', ['a', 'b'])((3, 4), (1, 2)) is False
+    assert lmtp.compile_intervals(
+        'a < b', ['a', 'b'])((1, 3), (2, 4)) == "unknown"
+
+    # arithmetic, negation and functions
+    f = lmtp.compile_intervals('!(x^2 - 2 * x > 3)', ['x'])
+    assert f((-0.5, 0.5)) is True
+    assert f((4, 5)) is False
+    # each occurrence of x is bounded separately
+    assert f((-1, 3)) == "unknown"
+    assert lmtp.compile_intervals('abs(x) < 2', ['x'])((-1.5, 1.5)) is True
+    assert lmtp.compile_intervals('-x < 0 or x < -1', ['x'])((0.5, 2)) is True
+
+    # expressions that cannot be bounded are unknown
+    assert lmtp.compile_intervals('1 / x > 0', ['x'])((-1, 1)) == "unknown"
+    assert lmtp.compile_intervals('1 / x > 0', ['x'])((1, 2)) is True
+    assert lmtp.compile_intervals('sin(x) < 2', ['x'])((0, 1)) == "unknown"
+    assert lmtp.compile_intervals('sin(x) < 2', ['x'])((1, 1)) is True
+
+    with pytest.raises(ValueError) as excinfo:
+        lmtp.compile_intervals('meets(a, b, c)', ['a', 'b', 'c'])
+    with pytest.raises(ValueError) as excinfo:
+        lmtp.compile_intervals('a > b', ['a'])
@@ -0,0 +1,45 @@
+"""ValueIndex unit tests."""
+
+from vivid.classes.frozen_valueset import FrozenValueSet
+from vivid.classes.value_index import ValueIndex
+from vivid.classes.interval import Interval
+from vivid.classes.point import Point
+
+
+def test_get():
+    """Test get function."""
+    universe = FrozenValueSet(['R', 'G', 'B', True, Interval(0, 9), 2.5])
+    index = ValueIndex.get(universe)
+    assert index._is_ValueIndex
+    assert index._universe is universe
+    assert len(index._positions) == 15
+    assert ValueIndex.get(universe) is index
+    assert ValueIndex.get(FrozenValueSet(['B', 'R', 'G', True, 2.5,
+                                          Interval(0, 9)])) is index
+
+    # universes that are not finite and discrete or are too large
+    assert ValueIndex.get(FrozenValueSet([Interval(0.0, 1.0)])) is None
+    assert ValueIndex.get(FrozenValueSet([Point(1.0)])) is None
+    assert ValueIndex.get(
+        FrozenValueSet([Interval(0, ValueIndex._max_size)])) is None
+
+
+def test_get_mask():
+    """Test get_mask function."""
+    index = ValueIndex.get(FrozenValueSet(['R', 'G', 'B', Interval(0, 9)]))
+    full = index.get_mask(FrozenValueSet(['R', 'G', 'B', Interval(0, 9)]))
+    assert full == (1 << 13) - 1
+
+    red = index.get_mask(FrozenValueSet(['R']))
+    low = index.get_mask(FrozenValueSet([Interval(0, 4)]))
+    singles = index.get_mask(FrozenValueSet([0, 1, 2, 3, 4]))
+    assert bin(red).count('1') == 1
+    assert low == singles
+    assert not red & low
+    assert red | low | full == full
+
+    # values outside the universe have no mask
+    assert index.get_mask(FrozenValueSet(['Y'])) is None
+    assert index.get_mask(FrozenValueSet([True])) is None
+    assert index.get_mask(FrozenValueSet([1L])) is None
+    assert index.get_mask(FrozenValueSet([Interval(0.0, 1.0)])) is None
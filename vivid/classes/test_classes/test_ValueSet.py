@@ -154,6 +154,13 @@ def test___le__():
     assert VS10 > VS6
     assert VS10 >= VS6
 
+    # Test values subsumed by adjacent Intervals merged in other
+    VS11 = ValueSet([Interval(1, 10), Interval(11, 20), Interval(30, 40)])
+    assert ValueSet([Interval(5, 15), 30, 40]) <= VS11
+    assert not ValueSet([Interval(5, 25)]) <= VS11
+    assert not ValueSet([25, 30]) <= VS11
+    assert not ValueSet([15L]) <= VS11
+
 
 def test___ne__():
     """Test != operator."""
@@ -246,6 +253,7 @@ def test___add__():
         LineSegment(Point(2.0), Point(3.0))])
 
     assert VSD == VSA + -100
+    assert -100 not in VSA
     assert VSD == VSA + [-5, -100]
     assert VSF == VSE + [LineSegment(Point(2.0), Point(3.0))]
 
@@ -510,6 +518,24 @@ def test___sub__():
     assert ValueSet([Interval(0, 1), Interval(9, 10)]) == \
         ValueSet([Interval(0, 10)]) - ValueSet([Interval(2, 8)])
 
+    # Intervals and values inside an Interval of other are removed
+    assert ValueSet([]) == \
+        ValueSet([Interval(2, 3), 5]) - ValueSet([Interval(1, 10)])
+    assert ValueSet([Interval(2.0, 3.0), 5.0]) == \
+        ValueSet([Interval(2.0, 3.0), 5.0]) - ValueSet([Interval(1, 10)])
+
+    # one Interval cut many times and cuts spanning several Intervals
+    VS16 = ValueSet([Interval(0, 1000)])
+    VS17 = ValueSet(range(1, 1000, 2))
+    assert VS16 - VS17 == ValueSet(range(0, 1001, 2))
+    VS18 = ValueSet([Interval(0, 3), Interval(6, 9), Interval(12, 15)])
+    assert VS18 - ValueSet([Interval(2, 13)]) == \
+        ValueSet([Interval(0, 1), Interval(14, 15)])
+
+    # a float cut closer than the epsilon to the infimum leaves the infimum
+    assert ValueSet([Interval(1.0, 2.0)]) - ValueSet([1.000000000001]) == \
+        ValueSet([1.0, Interval(1.000000000011, 2.0)])
+
 
 def test___getitem__():
     """Test indexing for ValueSet object."""
@@ -565,6 +591,12 @@ def test___contains__():
     assert not Interval(100.0, 1000.0) in v
     assert not Interval(100L, 1000L) in v
     assert not Point('x') in v
+    assert not [1] in v
+    assert not 100 in v
+
+    v[0] = 7
+    assert 7 in v
+    assert not 8 in v
 
 
 def test___len__():
@@ -693,6 +725,15 @@ def test___repr__():
     assert v3.__repr__() == "V()"
 
 
+def test_discretize():
+    """Test discretize function."""
+    assert ValueSet([]).discretize() == []
+    assert ValueSet(['a', Point(1.0)]).discretize() == ['a', Point(1.0)]
+    assert sorted(ValueSet([Interval(1, 3), 7]).discretize()) == [1, 2, 3, 7]
+    assert sorted(ValueSet([Interval(0.0, 2.0)]).discretize()) == \
+        [0.0, 1.0, 2.0]
+
+
 def test__split_by_types():
     """Test split_by_types used in parsing."""
     def test_AttributeError(values):
@@ -767,6 +808,14 @@ def test__parse():
     assert interval_collapsing == [
         Interval(-10, 500), Interval(-10.2, 500.442), Interval(-10L, 500L)]
 
+    # test adjacent ints and Intervals merging into sorted, disjoint Intervals
+    adjacent_merging = ValueSet._parse(
+        [Interval(5, 8), 10, 4, Interval(1, 3), -1, 0, 1L, 2L,
+         Interval(3L, 6L), 20.0, Interval(1.0, 2.0), Interval(2.0, 3.0)])
+
+    assert adjacent_merging == [10, 20.0, Interval(-1, 8),
+                                Interval(1.0, 3.0), Interval(1L, 6L)]
+
     point_duplicates = ValueSet._parse([Point(1.0), Point(1.0), Point('x')])
 
     assert point_duplicates == [Point(1.0), Point('x')]
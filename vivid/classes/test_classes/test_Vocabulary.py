@@ -180,6 +180,27 @@ def test___hash__():
     assert hash(vocabulary) == hash(vocabulary2)
 
 
+def test__get_fingerprint():
+    """Test fingerprint of Vocabulary."""
+    C, R, V = ['C1', 'C2'], [RelationSymbol('R', 1)], ['V']
+    vocabulary = Vocabulary(C, R, V)
+    C, R, V = ['C2', 'C1'], [RelationSymbol('R', 1)], ['V']
+    vocabulary2 = Vocabulary(C, R, V)
+
+    assert vocabulary._fingerprint is None
+    assert vocabulary._get_fingerprint() == vocabulary2._get_fingerprint()
+    assert vocabulary._fingerprint is not None
+
+    # adding symbols must invalidate the cached fingerprint
+    vocabulary.add_constant('C3')
+    assert vocabulary._fingerprint is None
+    assert vocabulary != vocabulary2
+    vocabulary2.add_constant('C3')
+    assert vocabulary == vocabulary2
+    vocabulary.add_variable('x')
+    assert vocabulary != vocabulary2
+
+
 def test___str__():
     """Test str(Vocabulary)."""
     C = ['C']
@@ -0,0 +1,106 @@
+"""WorldView unit tests."""
+
+import pytest
+from vivid.classes.valueset import ValueSet
+from vivid.classes.attribute import Attribute
+from vivid.classes.attribute_structure import AttributeStructure
+from vivid.classes.attribute_system import AttributeSystem
+from vivid.classes.state import State
+
+
+def make_state():
+    """Return a State with four worlds."""
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    asys = AttributeSystem(AttributeStructure(color, size), ['s1', 's2'])
+    return State(asys, {
+        ('color', 's1'): ['R'],
+        ('color', 's2'): ['B', 'G'],
+        ('size', 's1'): ['M'],
+        ('size', 's2'): ['L', 'S']})
+
+
+def test___init__():
+    """Test WorldView constructor."""
+    s = make_state()
+    world = s.get_world(0)
+    assert world._is_WorldView
+    assert world._state is s
+    assert world._attribute_system is s._attribute_system
+
+
+def test___eq__():
+    """Test == operator."""
+    s = make_state()
+    assert s.get_world(1) == s.get_world(1)
+    assert s.get_world(1) == s.get_worlds()[1]
+    assert not s.get_world(1) == s.get_world(2)
+
+
+def test___ne__():
+    """Test != operator."""
+    s = make_state()
+    assert s.get_world(1) != s.get_world(2)
+    assert not s.get_world(1) != s.get_worlds()[1]
+
+
+def test___getitem__():
+    """Test indexing for WorldView objects."""
+    s = make_state()
+    world = s.get_world(0)
+    assert world[('color', 's1')] == ValueSet(['R'])
+    with pytest.raises(KeyError) as excinfo:
+        world[('color', 's3')]
+
+
+def test__ascriptions():
+    """Test _ascriptions property."""
+    s = make_state()
+    for world, state_world in zip(s.generate_worlds(), s.get_worlds()):
+        assert world._ascriptions == state_world._ascriptions
+
+
+def test___str__():
+    """Test str(WorldView)."""
+    s = make_state()
+    assert str(s.get_world(3)) == str(s.get_worlds()[3])
+
+
+def test___repr__():
+    """Test repr(WorldView)."""
+    s = make_state()
+    assert repr(s.get_world(3)) == repr(s.get_worlds()[3])
+
+
+def test_get_index():
+    """Test get_index function."""
+    s = make_state()
+    for index in range(4):
+        assert s.get_world(index).get_index() == index
+
+
+def test_get_value():
+    """Test get_value function."""
+    s = make_state()
+    values = set([(world.get_value(('color', 's2')),
+                   world.get_value(('size', 's2')))
+                  for world in s.generate_worlds()])
+    assert values == set([('B', 'L'), ('B', 'S'), ('G', 'L'), ('G', 'S')])
+    assert s.get_world(2).get_value(('size', 's1')) == 'M'
+    with pytest.raises(KeyError) as excinfo:
+        s.get_world(0).get_value(('weight', 's1'))
+
+
+def test_get_state():
+    """Test get_state function."""
+    s = make_state()
+    world = s.get_world(0).get_state()
+    assert world._is_State
+    assert world.is_world()
+    assert world in s.get_worlds()
+
+
+def test_is_world():
+    """Test is_world function."""
+    s = make_state()
+    assert s.get_world(0).is_world()
@@ -0,0 +1,153 @@
+"""This section introduces the TruthTable class."""
+
+from collections import OrderedDict
+from itertools import product
+from value_index import ValueIndex
+
+
+class TruthTable(object):
+    """
+    TruthTable class. Each TruthTable object holds the truth value of the
+    definition of a Relation object for every tuple of values of the
+    Attribute objects in its :math:`D(R)` (whose ValueSets must be finite and
+    discrete; see ValueIndex) as the bits of an integer, so that evaluating
+    the definition for such values is an index lookup.
+
+    :cvar _max_size: The largest number of value tuples tabled.
+    :cvar _tables: The TruthTable objects (or ``None`` if the Relation \
+    cannot be tabled) used most recently, in least recently used order, \
+    keyed by the definition and the FrozenValueSet objects of the \
+    Attributes in :math:`D(R)`.
+    :cvar _tables_size: The largest number of TruthTable objects kept in \
+    ``_tables``.
+    :ivar _evaluator: The evaluator of the Relation object, used for values \
+    outside the table.
+    :ivar _indexes: The ValueIndex object of each argument of the definition.
+    :ivar _strides: The distance between the positions of value tuples \
+    differing by one position in the values of each argument.
+    :ivar _table: The integer whose bit at the position of a value tuple is \
+    set if and only if the definition is true for the value tuple.
+    :ivar _is_TruthTable: An identifier to use in place of ``type`` or \
+    ``isinstance``.
+    """
+
+    _max_size = 1024
+    _tables = OrderedDict()
+    _tables_size = 1024
+
+    @classmethod
+    def get(cls, relation, attribute_structure):
+        """
+        Return the TruthTable object of the Relation object in the
+        ``relation`` parameter over the Attribute objects of the
+        AttributeStructure object in the ``attribute_structure`` parameter,
+        building it on first use.
+
+        :param relation: The Relation object to table.
+        :type  relation: Relation
+        :param attribute_structure: The AttributeStructure object with the \
+        Attribute objects in :math:`D(R)` of ``relation``.
+        :type  attribute_structure: AttributeStructure
+
+        :return: The TruthTable object of ``relation`` or ``None`` if some \
+        Attribute in :math:`D(R)` does not have a finite and discrete \
+        ValueSet, there are more than ``TruthTable._max_size`` value tuples \
+        or the definition cannot be evaluated for some value tuple.
+        :rtype: TruthTable|None
+        """
+
+        try:
+            universes = tuple([attribute_structure[label]._value_set
+                               for label in relation._DR])
+        except KeyError:
+            return None
+
+        key = (relation._definition, universes)
+        try:
+            truth_table = cls._tables.pop(key)
+        except KeyError:
+            pass
+        else:
+            cls._tables[key] = truth_table
+            return truth_table
+
+        indexes = [ValueIndex.get(universe) for universe in universes]
+        size = 1
+        for index in indexes:
+            if index is None:
+                size = None
+                break
+            size *= len(index._positions)
+
+        if size is None or size > cls._max_size:
+            truth_table = None
+        else:
+            truth_table = TruthTable(relation, indexes)
+            if truth_table._table is None:
+                truth_table = None
+        cls._tables[key] = truth_table
+        if len(cls._tables) > cls._tables_size:
+            cls._tables.popitem(last=False)
+        return truth_table
+
+    def __init__(self, relation, indexes):
+        """
+        Construct a TruthTable object by evaluating the definition of the
+        Relation object in the ``relation`` parameter for every value tuple.
+
+        :param relation: The Relation object to table.
+        :type  relation: Relation
+        :param indexes: The ValueIndex object of each argument of the \
+        definition.
+        :type  indexes: ``list``
+        """
+
+        self._evaluator = relation._evaluator
+        self._indexes = indexes
+
+        strides, stride = [], 1
+        for index in reversed(indexes):
+            strides.insert(0, stride)
+            stride *= len(index._positions)
+        self._strides = strides
+
+        # the value tuples are numbered in the order of the product of the
+        # values of each argument, ordered by their positions in its index
+        values = []
+        for index in indexes:
+            ordered = sorted(index._positions.items(), key=lambda x: x[1])
+            values.append([value for (_type, value), position in ordered])
+
+        table = 0
+        for position, value_tuple in enumerate(product(*values)):
+            try:
+                if relation._evaluator(*value_tuple):
+                    table |= 1 << position
+            except ValueError:
+                table = None
+                break
+
+        self._table = table
+        self._is_TruthTable = True
+
+    def evaluate(self, *values):
+        """
+        Return the truth value of the definition for the values given for
+        its arguments (in order), falling back on the evaluator of the
+        Relation object for values not in the table.
+
+        :return: The truth value of the definition.
+        :rtype: ``bool``
+
+        :raises ValueError: The values are not in the table and cannot be \
+        evaluated.
+        """
+
+        position = 0
+        try:
+            for index, stride, value in zip(
+                    self._indexes, self._strides, values):
+                position += index._positions[(type(value), value)] * stride
+        except (KeyError, TypeError):
+            return bool(self._evaluator(*values))
+        return bool(self._table >> position & 1)
@@ -0,0 +1,131 @@
+"""This section introduces the ValueIndex class."""
+
+from weakref import WeakKeyDictionary
+
+
+class ValueIndex(object):
+    """
+    ValueIndex class. Each ValueIndex object numbers the values of a finite,
+    discrete universe (i.e., the FrozenValueSet object of an Attribute whose
+    values are ``str``\s, ``bool``\s, ``int``\s, ``long``\s, ``float``\s and
+    int or long Intervals) so that any subset of the universe can be
+    represented as a bitmask; subset, union, difference and equality of such
+    subsets are then integer operations.
+
+    :cvar _max_size: The largest number of discrete values indexed.
+    :cvar _indexes: The ValueIndex object (or ``None`` if the universe \
+    cannot be indexed) of each universe, keyed by FrozenValueSet object.
+    :ivar universe: The FrozenValueSet object being indexed.
+    :ivar positions: A ``dict`` of (type, value) 2-tuples and the position \
+    of their bit.
+    :ivar masks: The bitmask of each FrozenValueSet object computed so far.
+    :ivar _is_ValueIndex: An identifier to use in place of ``type`` or \
+    ``isinstance``.
+    """
+
+    _max_size = 4096
+    _indexes = WeakKeyDictionary()
+
+    @classmethod
+    def get(cls, universe):
+        """
+        Return the ValueIndex object of the FrozenValueSet object in the
+        ``universe`` parameter, building it on first use.
+
+        :param universe: The FrozenValueSet object to index.
+        :type  universe: FrozenValueSet
+
+        :return: The ValueIndex object of ``universe`` or ``None`` if \
+        ``universe`` is not finite and discrete or has more than \
+        ``ValueIndex._max_size`` values.
+        :rtype: ValueIndex|None
+        """
+
+        try:
+            return cls._indexes[universe]
+        except KeyError:
+            pass
+
+        values = ValueIndex._discretize(universe)
+        if values is None or len(values) > cls._max_size:
+            index = None
+        else:
+            index = ValueIndex(universe, values)
+        cls._indexes[universe] = index
+        return index
+
+    def __init__(self, universe, values):
+        """
+        Construct a ValueIndex object.
+
+        :param universe: The FrozenValueSet object to index.
+        :type  universe: FrozenValueSet
+        :param values: The discrete values of ``universe`` as (type, value) \
+        2-tuples.
+        :type  values: ``list``
+        """
+
+        self._universe = universe
+        self._positions = dict(
+            [(value, position) for position, value in enumerate(values)])
+        self._masks = WeakKeyDictionary()
+        self._is_ValueIndex = True
+
+    def get_mask(self, valueset):
+        """
+        Return the bitmask of the FrozenValueSet object in the ``valueset``
+        parameter, computing it on first use.
+
+        :param valueset: The FrozenValueSet object to represent.
+        :type  valueset: FrozenValueSet
+
+        :return: The bitmask of ``valueset`` or ``None`` if some value of \
+        ``valueset`` is not a discrete value of the universe.
+        :rtype: ``int``|``long``|None
+        """
+
+        try:
+            return self._masks[valueset]
+        except KeyError:
+            pass
+
+        mask = 0
+        values = ValueIndex._discretize(valueset)
+        if values is None:
+            mask = None
+        else:
+            for value in values:
+                try:
+                    mask |= 1 << self._positions[value]
+                except KeyError:
+                    mask = None
+                    break
+
+        self._masks[valueset] = mask
+        return mask
+
+    @staticmethod
+    def _discretize(valueset):
+        """
+        Return the discrete values of the ValueSet object in the ``valueset``
+        parameter as (type, value) 2-tuples, with int and long Intervals
+        replaced by their values.
+
+        :return: The discrete values or ``None`` if ``valueset`` contains a \
+        float Interval or an object other than an Interval, or an Interval \
+        with more than ``ValueIndex._max_size`` values.
+        :rtype: ``list``|None
+        """
+
+        values = []
+        for value in valueset:
+            if hasattr(value, "_is_Interval"):
+                if value._type is float or \
+                        value[1] - value[0] >= ValueIndex._max_size:
+                    return None
+                values.extend([(value._type, i) for i in value.discretize()])
+            elif type(value) in [int, float, long, str, bool]:
+                values.append((type(value), value))
+            else:
+                return None
+        return values
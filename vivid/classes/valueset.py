@@ -12,6 +12,7 @@ object if the object uses a non-standard form of equality,
 # Known issues
 # Subset does not test that an interval exists in discrete form in other
 
+from bisect import bisect_right
 from copy import deepcopy
 from functools import total_ordering
 from interval import Interval
@@ -29,13 +30,22 @@ class ValueSet(object):
 
     :cvar _base_types: The literal types supported by the ValueSet class.
     :cvar _object_types: The object types supported by the ValueSet class.
-    :ivar values: The values contained in the ValueSet object.
+    :cvar _gaps: The distance between neighbouring values of each numeric \
+    type that are merged into a single Interval.
+    :cvar _epsilons: The distance between a cut and the Interval parts left \
+    on either side of it for each numeric type in set difference.
+    :ivar values: The values contained in the ValueSet object, in canonical \
+    form (see ``_parse``).
+    :ivar members: A ``frozenset`` of the values, built on the first \
+    membership test.
     :ivar _is_ValueSet: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
 
     _base_types = [int, float, long, str, bool]
     _object_types = ["_is_Interval", "_is_Point", "_is_LineSegment"]
+    _gaps = {int: 1, float: 0.0, long: 1L}
+    _epsilons = {int: 1, float: 0.00000000001, long: 1L}
 
     @classmethod
     def add_object_type(cls, object_identifier):
@@ -78,6 +88,7 @@ class ValueSet(object):
             raise TypeError("valueset parameter must be of type list or set")
         # Save parsed output
         self._values = ValueSet._parse(valueset)
+        self._members = None
         self._is_ValueSet = True
 
     def __eq__(self, other):
@@ -85,9 +96,17 @@ class ValueSet(object):
         Determine if two ValueSet objects are equal via the ``==`` operator.
         """
 
-        union = set(self._values) | set(other._values)
-        intersection = set(self._values) & set(other._values)
-        return union == intersection
+        if len(self._values) != len(other._values):
+            return False
+
+        # canonical forms of equal ValueSets only differ in the order of
+        # objects other than Intervals
+        try:
+            if self._values == other._values:
+                return True
+        except AttributeError:
+            pass
+        return self._get_members() == other._get_members()
 
     def __le__(self, other):
         """
@@ -96,9 +115,35 @@ class ValueSet(object):
         ``other`` parameter.
         """
 
+        def in_other_interval(value):
+            """Determine if value is contained in any Interval in other."""
+            if hasattr(value, "_is_Interval"):
+                inf, sup = value._infimum, value._supremum
+                types = other_intervals.keys()
+            else:
+                inf = sup = value
+                types = [type(value)]
+
+            for _type in types:
+                infima, intervals = other_intervals[_type]
+                # the only candidate is the last Interval starting before inf
+                index = bisect_right(infima, inf) - 1
+                if index >= 0 and sup <= intervals[index]._supremum:
+                    return True
+            return False
+
         self_dict = ValueSet._split_by_types(self)
         other_dict = ValueSet._split_by_types(other)
 
+        # sorted, disjoint Intervals in other by type for binary search
+        other_intervals = {}
+        for _type, gap in ValueSet._gaps.iteritems():
+            intervals = Interval._sweep(
+                [i for i in other_dict["_is_Interval"] if i._type == _type],
+                [], gap)[1]
+            other_intervals[_type] = (
+                [interval._infimum for interval in intervals], intervals)
+
         # filter out ints, floats, or longs contained in any Interval in other
         filtered_self_values = []
         for _type, values in self_dict.iteritems():
@@ -106,10 +151,7 @@ class ValueSet(object):
             if _type == int or _type == float or _type == long or \
                     _type == "_is_Interval":
                 for value in values:
-                    for interval in other_dict['_is_Interval']:
-                        if value in interval:
-                            break
-                    else:
+                    if not in_other_interval(value):
                         filtered_self_values.append(value)
             # Handle point related stuff; speicfically handled here for
             # generic point support
@@ -131,16 +173,16 @@ class ValueSet(object):
             else:
                 filtered_self_values.extend(values)
 
-        # At this point, only objects, str, and bool can be in new_self_values
-        new_self_values = ValueSet(filtered_self_values)
-
-        if len(new_self_values) > len(other._values):
+        # At this point, only values not contained in an Interval of other
+        # remain; this ValueSet is a subset if other contains all of them.
+        if len(filtered_self_values) > len(other._values):
             return False
 
-        # if the intersection of both ValueSets is the same as this ValueSet
-        # then this ValueSet is contained in other and is a subset.
-        intersection = set(new_self_values) & set(other._values)
-        return intersection == set(new_self_values)
+        other_members = other._get_members()
+        for value in filtered_self_values:
+            if value not in other_members:
+                return False
+        return True
 
     def __ne__(self, other):
         """
@@ -164,9 +206,7 @@ class ValueSet(object):
             other_values = [v for v in iter(other)]
             return ValueSet(self._values + other_values)
         else:
-            new_values = self._values
-            new_values.append(other)
-            return ValueSet(new_values)
+            return ValueSet(self._values + [other])
 
     def __iadd__(self, other):
         """
@@ -181,252 +221,35 @@ class ValueSet(object):
         """
         Overloaded ``-`` operator for ValueSet. The ``-`` operator functions as
         the set-theoretic difference.
-        """
-
-        def resolve_intervals(intervals, other_type_lists):
-            """
-            Break intervals up according to corresponding types of
-            non-iterables (int, long, float) in other.
-            """
-
-            def resolve_interval_interval(self, other, self_danglers,
-                                          other_danglers, diff):
-                """
-                Break down a set of intervals according to another set of
-                intervals.
-                Use differential diff provided when splitting intervals.
-                """
-
-                for i, self_interval in enumerate(self):
-                    for j, other_interval in enumerate(other):
-
-                        other_inf = other_interval[0]
-                        other_sup = other_interval[1]
-                        self_inf = self_interval[0]
-                        self_sup = self_interval[1]
-
-                        if other_interval <= self_interval:
-                            # split both,removing overlap
-                            try:
-                                new_self = Interval(other_sup + diff, self_sup)
-                                self.append(new_self)
-                            except ValueError:
-                                self_danglers.append(self_sup)
-                            try:
-                                new_other = Interval(other_inf,
-                                                     self_inf - diff)
-                                other.append(new_other)
-                            except ValueError:
-                                other_danglers.append(other_inf)
-                            del self[i]
-                            del other[j]
-                            return True
-                        elif self_interval <= other_interval:
-                            # split both, removing overlap
-                            try:
-                                new_self = Interval(self_inf, other_inf - diff)
-                                self.append(new_self)
-                            except ValueError:
-                                self_danglers.append(self_inf)
-                            try:
-                                new_other = Interval(self_sup + diff,
-                                                     other_sup)
-                                other.append(new_other)
-                            except ValueError:
-                                other_danglers.append(other_sup)
-                            del self[i]
-                            del other[j]
-                            return True
-                        elif other_interval in self_interval:
-                            # split self_interval and destroy other, this is
-                            # the only case where we don't keep danglers
-                            try:
-                                new_l_self = Interval(self_inf,
-                                                      other_inf - diff)
-                                self.append(new_l_self)
-                            except ValueError:
-                                if self_inf == other_inf - diff:
-                                    self_danglers.append(self_inf)
-                            try:
-                                new_h_self = Interval(other_sup + diff,
-                                                      self_sup)
-                                self.append(new_h_self)
-                            except ValueError:
-                                if other_sup + diff == self_sup:
-                                    self_danglers.append(self_sup)
-                            del self[i]
-                            del other[j]
-                            return True
-
-                return False
-
-            def resolve_interval_singletons(self, other, danglers, diff):
-                """
-                Break down a set of intervals according to a set of singletons.
-                Use differential diff provided when splitting intervals.
-                """
-
-                for i, self_interval in enumerate(self):
-                    for j, other_signleton in enumerate(other):
-
-                        self_inf = self_interval[0]
-                        self_sup = self_interval[1]
-
-                        if other_signleton in self_interval:
-                            if other_signleton == self_inf:
-                                try:
-                                    new_self = Interval(self_inf + diff,
-                                                        self_sup)
-                                    self.append(new_self)
-                                except ValueError:
-                                    danglers.append(self_sup)
-                                del self[i]
-                                del other[j]
-                                return True
-                            elif other_signleton == self_sup:
-                                try:
-                                    new_self = Interval(self_inf,
-                                                        self_sup - diff)
-                                    self.append(new_self)
-                                except ValueError:
-                                    danglers.append(self_inf)
-                                del self[i]
-                                del other[j]
-                                return True
-                            else:
-                                try:
-                                    new_l_self = Interval(
-                                        self_inf, other_signleton - diff)
-                                    self.append(new_l_self)
-                                except ValueError:
-                                    danglers.append(self_inf)
-                                try:
-                                    new_h_self = Interval(
-                                        other_signleton + diff, self_sup)
-                                    self.append(new_h_self)
-                                except ValueError:
-                                    danglers.append(self_sup)
-                                del self[i]
-                                del other[j]
-                                return True
-
-                return False
 
-            self_danglers, other_danglers = [], []
-
-            if intervals:
-                # Split intervals by types
-                int_Intervals = [i for i in intervals if i._type is int]
-                long_Intervals = [i for i in intervals if i._type is long]
-                float_Intervals = [i for i in intervals if i._type is float]
-
-                # Split other type list into numerics and intervals
-                other_ints = other_type_lists[int]
-                other_longs = other_type_lists[long]
-                other_floats = other_type_lists[float]
-                other_intervals = other_type_lists["_is_Interval"]
-                other_int_Intervals = [
-                    i for i in other_intervals if i._type is int]
-                other_long_Intervals = [
-                    i for i in other_intervals if i._type is long]
-                other_float_Intervals = [
-                    i for i in other_intervals if i._type is float]
-
-                # Note: at this point, all intervals are guarenteed to be
-                # disjoint from collapse_intervals.
-
-                # Break intervals apart until its impossible to keep breaking
-                # them, then remove any singletons
-                if int_Intervals:
-                    while resolve_interval_interval(int_Intervals,
-                                                    other_int_Intervals,
-                                                    self_danglers,
-                                                    other_danglers,
-                                                    diff=1):
-                            pass
-
-                    # push dangling ints in other into other_ints, then reset
-                    # other_danglers
-                    other_ints.extend(other_danglers)
-                    other_danglers = []
-
-                    while resolve_interval_singletons(
-                            int_Intervals, other_ints, self_danglers, diff=1):
-                            pass
-
-                if long_Intervals:
-                    while resolve_interval_interval(long_Intervals,
-                                                    other_long_Intervals,
-                                                    self_danglers,
-                                                    other_danglers,
-                                                    diff=1L):
-                            pass
-
-                    # push dangling longs in other into other_longs, then reset
-                    # other_danglers
-                    other_longs.extend(other_danglers)
-                    other_danglers = []
-
-                    while resolve_interval_singletons(long_Intervals,
-                                                      other_longs,
-                                                      self_danglers,
-                                                      diff=1L):
-                            pass
-
-                f_min = 0.00000000001
-                if float_Intervals:
-                    while resolve_interval_interval(float_Intervals,
-                                                    other_float_Intervals,
-                                                    self_danglers,
-                                                    other_danglers,
-                                                    diff=f_min):
-                            pass
-
-                    # push dangling floats in other into other_floats, then
-                    # reset other_danglers
-                    other_floats.extend(other_danglers)
-                    other_danglers = []
-
-                    while resolve_interval_singletons(float_Intervals,
-                                                      other_floats,
-                                                      self_danglers,
-                                                      diff=f_min):
-                            pass
-
-                intervals = int_Intervals + long_Intervals + float_Intervals
-
-                return intervals, self_danglers
-            else:
-                return intervals, self_danglers
+        The ints, longs and floats and Intervals of each numeric type are cut
+        by the values and Intervals of the same type in ``other`` parameter in
+        a single sweep (see ``_cut``); all other values are removed if
+        ``other`` parameter contains them.
+        """
 
         # Split the members of ValueSet's into lists defined by their
         # respective types
         self_type_lists = ValueSet._split_by_types(self._values)
         other_type_lists = ValueSet._split_by_types(other._values)
 
-        from collections import defaultdict
-        std_type_lists = defaultdict(list)
-
-        for type_key, values in self_type_lists.iteritems():
-            try:
-                other_values = other_type_lists[type_key]
-                diff = set(values) - set(other_values)
-                std_type_lists[type_key] = diff
-            except KeyError:
-                std_type_lists[type_key] = values
-
         output_set = []
-
-        # Break intervals if necessary and add any danglers to output_set
-        std_type_lists["_is_Interval"], danglers = resolve_intervals(
-            std_type_lists["_is_Interval"], other_type_lists)
-        output_set.extend(danglers)
-
-        # reconstruct list, sorting when possible
-        for base_type in ValueSet._base_types:
-            output_set += sorted(std_type_lists[base_type])
-        for object_type in ValueSet._object_types:
-            output_set += std_type_lists[object_type]
+        for type_key, values in self_type_lists.iteritems():
+            if type_key in ValueSet._gaps or type_key == "_is_Interval":
+                continue
+            other_values = set(other_type_lists.get(type_key, []))
+            output_set.extend(
+                [value for value in values if value not in other_values])
+
+        for _type in [int, float, long]:
+            output_set.extend(ValueSet._cut(
+                self_type_lists[_type],
+                [i for i in self_type_lists["_is_Interval"]
+                 if i._type == _type],
+                other_type_lists[_type],
+                [i for i in other_type_lists["_is_Interval"]
+                 if i._type == _type],
+                _type))
 
         return ValueSet(output_set)
 
@@ -460,6 +283,12 @@ class ValueSet(object):
         object.
         """
 
+        try:
+            return key in self._get_members()
+        except (AttributeError, TypeError):
+            # unhashable key or incomparable values with colliding hashes
+            pass
+
         for value in self:
             try:
                 is_equal = key == value
@@ -516,6 +345,7 @@ class ValueSet(object):
             # if simple type, replace item at index with value
             if type(value) in ValueSet._base_types:
                 self._values[key] = value
+                self._members = None
                 return
 
             # not simple type, check if it's a valid object type
@@ -529,6 +359,7 @@ class ValueSet(object):
                     identifier = object_identifier
             if identifier:
                 self._values[key] = value
+                self._members = None
                 return
 
             # not a valid base type or object type
@@ -563,6 +394,106 @@ class ValueSet(object):
         """Return a string representation of the ValueSet object."""
         return self.__str__()
 
+    def discretize(self):
+        """
+        Return the values of the calling ValueSet object with every Interval
+        object replaced by its discretized values (see
+        ``Interval.discretize``).
+
+        :return: The discrete values of the calling ValueSet object.
+        :rtype: ``list``
+        """
+
+        values = []
+        for value in self._values:
+            if hasattr(value, "_is_Interval"):
+                values.extend(value.discretize())
+            else:
+                values.append(value)
+        return values
+
+    def _get_members(self):
+        """
+        Return the values of the calling ValueSet object as a ``frozenset``,
+        building it on first use.
+
+        :return: The values of the calling ValueSet object.
+        :rtype: ``frozenset``
+        """
+
+        if self._members is None:
+            self._members = frozenset(self._values)
+        return self._members
+
+    @staticmethod
+    def _cut(values, intervals, other_values, other_intervals, _type):
+        """
+        Return the ints, longs or floats in ``values`` parameter and the
+        Intervals in ``intervals`` parameter less the values and Intervals in
+        ``other_values`` and ``other_intervals`` parameters, all of the type
+        given by ``_type`` parameter.
+
+        The values and Intervals of other are merged into sorted, disjoint
+        cuts and every Interval is split in one sweep over them. The part of
+        an Interval below a cut ends ``ValueSet._epsilons[_type]`` below the
+        cut and the part above it starts that much above it; a part whose
+        infimum and supremum meet is left as a single value.
+
+        :return: The values and Intervals of the difference.
+        :rtype: ``list``
+        """
+
+        epsilon = ValueSet._epsilons[_type]
+        other_values, other_intervals = Interval._sweep(
+            other_intervals, other_values, ValueSet._gaps[_type])
+        cuts = [(value, value) for value in other_values]
+        cuts.extend([(i._infimum, i._supremum) for i in other_intervals])
+        cuts.sort()
+        infima = [cut_inf for cut_inf, cut_sup in cuts]
+
+        output = []
+
+        def add_part(inf, sup):
+            """Add the part of an Interval from inf to sup to output."""
+            if inf == sup:
+                output.append(inf)
+            else:
+                output.append(Interval(inf, sup))
+
+        # single values remain unless the only cut that may contain them does
+        for value in values:
+            index = bisect_right(infima, value) - 1
+            if index < 0 or cuts[index][1] < value:
+                output.append(value)
+
+        start = 0
+        for interval in sorted(intervals, key=lambda i: i._infimum):
+            inf, sup = interval._infimum, interval._supremum
+            # cuts below this Interval are below every later Interval too
+            while start < len(cuts) and cuts[start][1] < inf:
+                start += 1
+
+            index = start
+            if index == len(cuts) or cuts[index][0] > sup:
+                output.append(interval)
+                continue
+
+            while inf is not None and index < len(cuts) and \
+                    cuts[index][0] <= sup:
+                cut_inf, cut_sup = cuts[index]
+                if cut_inf > inf:
+                    add_part(inf, max(cut_inf - epsilon, inf))
+                if cut_sup < sup:
+                    inf = min(cut_sup + epsilon, sup)
+                else:
+                    inf = None
+                index += 1
+
+            if inf is not None:
+                add_part(inf, sup)
+
+        return output
+
     @staticmethod
     def _split_by_types(values):
         """
@@ -587,13 +518,15 @@ class ValueSet(object):
         # initialize a dictionary to separate types
         from collections import defaultdict
         type_lists = defaultdict(list)
+        seen = defaultdict(set)
 
         # for each value provided
         for value in values:
             # if it's a base type, simply add to it's corresponding list
             # while rejecting duplicates.
             if type(value) in ValueSet._base_types:
-                if value not in type_lists[type(value)]:
+                if value not in seen[type(value)]:
+                    seen[type(value)].add(value)
                     type_lists[type(value)].append(value)
                 continue
 
@@ -611,7 +544,8 @@ class ValueSet(object):
 
             # store object in its corresponding list if it's not a duplicate
             if identifier:
-                if value not in type_lists[identifier]:
+                if value not in seen[identifier]:
+                    seen[identifier].add(value)
                     type_lists[identifier].append(value)
             else:
                 raise TypeError(
@@ -622,102 +556,39 @@ class ValueSet(object):
     @staticmethod
     def _parse(values):
         """
-        Parse a ``list`` into the standard format used by ValueSet objects.
-        Any ``int``\s, ``long``\s, and ``float``\s are absorbed into an
-        Interval object if they are contained by that Interval and the base
-        types contained in ``values`` are sorted.
+        Parse a ``list`` into the canonical form used by ValueSet objects.
+        The Intervals of each numeric type are merged into sorted, disjoint
+        Intervals (adjacent int and long Intervals included), any ``int``\s,
+        ``long``\s, and ``float``\s are absorbed into an Interval object if
+        they are contained by or adjacent to that Interval and the base types
+        contained in ``values`` are sorted.
 
-        :return: Filtered, sorted values in the ValueSet standard format.
+        :return: Filtered, sorted values in the ValueSet canonical form.
         :rtype: ``list``
 
         :raises TypeError: ``values`` parameter must be either a ``list`` or \
         ``set``.
         """
 
-        def _extend_intervals(type_lists):
-            """
-            If int or long is just beyond infirmum or supremum, extend the
-            interval.
-            """
-
-            for i in type_lists[int]:
-                for index, interval in enumerate(type_lists["_is_Interval"]):
-                    if interval._type == int:
-                        if i == interval[0] - 1:
-                            type_lists["_is_Interval"][index] = Interval(i, interval[1])
-                            type_lists[int].remove(i)
-                            return True
-                        if i == interval[1] + 1:
-                            type_lists["_is_Interval"][index] = Interval(interval[0], i)
-                            type_lists[int].remove(i)
-                            return True
-
-            for i in type_lists[long]:
-                for index, interval in enumerate(type_lists["_is_Interval"]):
-                    if interval._type == long:
-                        if i == interval[0] - 1:
-                            type_lists["_is_Interval"][index] = Interval(i, interval[1])
-                            type_lists[long].remove(i)
-                            return True
-                        if i == interval[1] + 1:
-                            type_lists["_is_Interval"][index] = Interval(interval[0], i)
-                            type_lists[long].remove(i)
-                            return True
-            return False
-
-        def _filter_numerics(type_lists):
-            """Filter out numeric values subsumed by some Interval."""
-            # filter out the ints, floats, and longs, subsumed by some Interval
-            bad_ints, bad_floats, bad_longs = [], [], []
-            for i in type_lists[int]:
-                for interval in type_lists["_is_Interval"]:
-                    if interval._type == int:
-                        if i in interval:
-                            if i not in bad_ints:
-                                bad_ints.append(i)
-
-            for f in type_lists[float]:
-                for interval in type_lists["_is_Interval"]:
-                    if interval._type == float:
-                        if f in interval:
-                            if f not in bad_floats:
-                                bad_floats.append(f)
-
-            for l in type_lists[long]:
-                for interval in type_lists["_is_Interval"]:
-                    if interval._type == long:
-                        if l in interval:
-                            if l not in bad_longs:
-                                bad_longs.append(l)
-
-            for bi in bad_ints:
-                type_lists[int].remove(bi)
-
-            for bf in bad_floats:
-                type_lists[float].remove(bf)
-
-            for bl in bad_longs:
-                type_lists[long].remove(bl)
-
         # only accept sets and lists for valueset parameter
         if not isinstance(values, list) and not isinstance(values, set):
             raise TypeError("values paramter must be a list or set")
 
-        # make copy of input before processing
-        input_set = deepcopy(values)
-
-        # convert set to list
-        if isinstance(input_set, set):
-            input_set = list(input_set)
-
         type_lists = ValueSet._split_by_types(values)
 
-        # If intervals are within this valueset
+        # If intervals are within this valueset, merge them with the values of
+        # their type in one sweep for each numeric type
         if type_lists["_is_Interval"]:
-            type_lists["_is_Interval"] = Interval.collapse_intervals(
-                type_lists["_is_Interval"])
-            while _extend_intervals(type_lists): pass
-            _filter_numerics(type_lists)
+            intervals = []
+            for _type in [int, float, long]:
+                typed_intervals = [i for i in type_lists["_is_Interval"]
+                                   if i._type == _type]
+                if typed_intervals:
+                    type_lists[_type], typed_intervals = Interval._sweep(
+                        typed_intervals, type_lists[_type],
+                        ValueSet._gaps[_type])
+                    intervals.extend(typed_intervals)
+            type_lists["_is_Interval"] = intervals
 
         output_set = []
         # reconstruct list, sorting when possible
@@ -9,6 +9,9 @@ class Vocabulary(object):
     :ivar C: The constants C of the vocabulary.
     :ivar R: The relation symbols R of the vocabulary.
     :ivar V: The variables V of the vocabulary.
+    :ivar fingerprint: A cached hash of the contents of the Vocabulary \
+    object (or ``None`` until it is first needed); Vocabulary objects with \
+    different fingerprints are never equal.
     :ivar _is_Vocabulary: An identifier to use in place of ``type`` or \
     ``isinstance``.
     """
@@ -75,6 +78,7 @@ class Vocabulary(object):
         self._C = sorted(list(set(C)), key=lambda c: c.lower())
         self._R = sorted(list(set(R)), key=lambda rs: rs._name.lower())
         self._V = sorted(list(set(V)), key=lambda v: v.lower())
+        self._fingerprint = None
         self._is_Vocabulary = True
 
     def __eq__(self, other):
@@ -82,6 +86,11 @@ class Vocabulary(object):
         Determine if two Vocabulary objects are equal via ``==`` operator.
         """
 
+        if self is other:
+            return True
+        if self._get_fingerprint() != other._get_fingerprint():
+            return False
+
         # constructor removes duplicates, so set comparison okay
         c_cond = set(self._C) == set(other._C)
         r_cond = set(self._R) == set(other._R)
@@ -152,6 +161,20 @@ class Vocabulary(object):
 
         return hash(self._key())
 
+    def _get_fingerprint(self):
+        """
+        Return the fingerprint of the calling Vocabulary object, computing it
+        on first use.
+
+        :return: The hash of the sets ``C``, ``R`` and ``V``.
+        :rtype: ``int``
+        """
+
+        if self._fingerprint is None:
+            self._fingerprint = hash(
+                (frozenset(self._C), frozenset(self._R), frozenset(self._V)))
+        return self._fingerprint
+
     def add_constant(self, constant):
         """
         Add a constant to this Vocabulary object's constants ``C``.
@@ -171,6 +194,7 @@ class Vocabulary(object):
         in_V = constant in self._V
         if not in_C and not in_V:
             self._C = sorted(self._C + [constant], key=lambda c: c.lower())
+            self._fingerprint = None
         else:
             raise ValueError("duplicate symbol cannot be added")
 
@@ -193,6 +217,7 @@ class Vocabulary(object):
         in_V = variable in self._V
         if not in_C and not in_V:
             self._V = sorted(self._V + [variable], key=lambda v: v.lower())
+            self._fingerprint = None
         else:
             raise ValueError("duplicate symbol cannot be added")
 
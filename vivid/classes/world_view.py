@@ -0,0 +1,182 @@
+"""This section introduces the WorldView class."""
+
+
+class WorldView(object):
+    """
+    WorldView class. Each WorldView object is a lightweight, read-only view of
+    a single world :math:`(w;\widehat{\\rho})` derivable from a State object.
+
+    The worlds of a State object are numbered by a mixed-radix counter whose
+    :math:`i`\ th digit selects a value from the discretized ascription of the
+    :math:`i`\ th attribute-object pair (the last digit varies fastest).
+    A WorldView object shares the State object's AttributeSystem and
+    discretized ascriptions and only holds the digits of its own index, so
+    creating one costs nothing per world beyond the digits.
+
+    :ivar state: The State object the world is derived from.
+    :ivar labels: The attribute-object pairs of the State object, in the \
+    order of the digits.
+    :ivar valuesets: The discretized values of the ascriptions of the State \
+    object, in the order of the digits.
+    :ivar digits: The digits of the index of the world.
+    :ivar _is_WorldView: An identifier to use in place of ``type`` or \
+    ``isinstance``.
+    """
+
+    def __init__(self, state, labels, valuesets, digits):
+        """
+        Construct a WorldView object.
+
+        :param state: The State object the world is derived from.
+        :type  state: State
+        :param labels: The attribute-object pairs of the State object.
+        :type  labels: ``list``
+        :param valuesets: The discretized values of the ascription of each \
+        attribute-object pair in ``labels`` parameter.
+        :type  valuesets: ``list``
+        :param digits: The index of the value to use from each list of \
+        values in ``valuesets`` parameter.
+        :type  digits: ``tuple``
+        """
+
+        self._state = state
+        self._labels = labels
+        self._valuesets = valuesets
+        self._digits = digits
+        self._is_WorldView = True
+
+    @property
+    def _attribute_system(self):
+        """The AttributeSystem object of the underlying State object."""
+        return self._state._attribute_system
+
+    @property
+    def _ascriptions(self):
+        """
+        The ascriptions of the world, i.e., a ``dict`` of attribute-object
+        pairs and single element ValueSet objects; built on access.
+        """
+
+        from valueset import ValueSet
+        return dict(
+            [(label, ValueSet([values[digit]])) for label, values, digit in
+             zip(self._labels, self._valuesets, self._digits)])
+
+    def __eq__(self, other):
+        """
+        Determine if a WorldView object is equal to another WorldView object
+        or State object via the ``==`` operator.
+        """
+
+        return self._attribute_system == other._attribute_system and \
+            self._ascriptions == other._ascriptions
+
+    def __ne__(self, other):
+        """
+        Determine if a WorldView object is not equal to another WorldView
+        object or State object via the ``!=`` operator.
+        """
+
+        return not self.__eq__(other)
+
+    def __getitem__(self, ao_pair):
+        """
+        Retrieve the single element ValueSet of the attribute-object pair
+        given by ``ao_pair`` parameter in the world via indexing (e.g.
+        ``WorldView[ao_pair]``).
+
+        :raises KeyError: ``ao_pair`` parameter must be an attribute-object \
+        pair of the underlying State object.
+        """
+
+        from valueset import ValueSet
+        return ValueSet([self.get_value(ao_pair)])
+
+    def __str__(self):
+        """Return a readable string representation of the WorldView object."""
+        return str(self.get_state())
+
+    def __repr__(self):
+        """Return a string representation of the WorldView object."""
+        return self.__str__()
+
+    def get_index(self):
+        """
+        Return the index of the world among the worlds of the underlying
+        State object.
+
+        :return: The index of the world.
+        :rtype: ``int``
+        """
+
+        index = 0
+        for values, digit in zip(self._valuesets, self._digits):
+            index = index * len(values) + digit
+        return index
+
+    def get_value(self, ao_pair):
+        """
+        Return the value of the attribute-object pair given by ``ao_pair``
+        parameter in the world.
+
+        :param ao_pair: The attribute-object pair :math:`\delta_{i}(s_{j})`.
+        :type  ao_pair: ``tuple``
+
+        :return: The value ascribed to ``ao_pair`` in the world.
+
+        :raises KeyError: ``ao_pair`` parameter must be an attribute-object \
+        pair of the underlying State object.
+        """
+
+        try:
+            position = self._labels.index(ao_pair)
+        except ValueError:
+            raise KeyError(ao_pair)
+        return self._valuesets[position][self._digits[position]]
+
+    def get_state(self):
+        """
+        Return the world as a State object.
+
+        :return: A State object whose ascriptions are the single element \
+        ValueSets of the world.
+        :rtype: State
+        """
+
+        from state import State
+        world = State(self._attribute_system)
+        for label, values, digit in zip(self._labels, self._valuesets,
+                                        self._digits):
+            world.set_ascription(label, [values[digit]])
+        return world
+
+    def is_world(self):
+        """
+        Determine if the calling WorldView object is a world; always true.
+
+        :return: ``True``
+        :rtype: ``bool``
+        """
+
+        return True
+
+
+def main():
+    """Main method; quick testing."""
+    from attribute import Attribute
+    from attribute_structure import AttributeStructure
+    from attribute_system import AttributeSystem
+    from state import State
+
+    color = Attribute("color", ['R', 'G', 'B'])
+    size = Attribute("size", ['S', 'M', 'L'])
+    asys = AttributeSystem(AttributeStructure(color, size), ['s1', 's2'])
+    s = State(asys, {('color', 's1'): ['R'], ('size', 's1'): ['M'],
+                     ('color', 's2'): ['B', 'G'], ('size', 's2'): ['L', 'S']})
+
+    for world in s.generate_worlds():
+        print world.get_index(), world.get_value(('color', 's2')), \
+            world.get_value(('size', 's2'))
+
+if __name__ == "__main__":
+    main()